@@ -1,8 +1,8 @@
 """나비 내전 게임 관련 명령어"""
 import discord
-from discord.ext import commands
-from bot.views.participant_view import ParticipantView
-import requests
+from bot.views.participant_view import ParticipantView, active_views
+from bot.utils.recruitment_store import recruitment_store
+from bot.utils.member_cache import member_cache
 import json
 import uuid
 from datetime import datetime
@@ -31,72 +31,56 @@ async def start_match(ctx, title):
     # 유저 정보를 포함한 ParticipantView 생성
     view = ParticipantView(thread, message, ctx.author, title, format_user_info)
     await message.edit(view=view)
+    view.save()
 
-def setup_game_commands(bot):
-    for i in range(1, 6):
-        def create_match_command(i):
-            async def match_command(ctx, *, title: str = f"나비내전{i}"):
-                await start_match(ctx, title)
-            return match_command
-        bot.command(name=f"내전{i}")(create_match_command(i))
+async def _get_channel(bot, channel_id):
+    return bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
 
-    @commands.command(name='사이버테스트', aliases=['사테', 'cyber'])
-    async def cyber_draft_test(self, ctx):
-        """사이버펑크 스타일 드래프트 테스트"""
+async def restore_recruitments(bot):
+    """저장된 모집을 같은 메시지에 다시 연결 (메시지가 사라졌으면 삭제)"""
+    restored = 0
+    for recruit_id, message_id, state in recruitment_store.load('participant'):
         try:
-            # 사이버 테스트용 세션 ID 생성
-            session_id = f"cyber_{int(datetime.now().timestamp())}"
-            
-            # 테스트용 참가자 (현재 명령어 실행자 포함)
-            participants = [self.format_user_info(ctx.author)]
-            
-            # 더미 참가자들 추가
-            for i in range(9):
-                dummy_user = {
-                    'discord_id': f'cyber_{i}',
-                    'username': f'CyberUser{i+1}',
-                    'display_name': f'사이버유저{i+1}',
-                    'avatar_url': f'https://cdn.discordapp.com/embed/avatars/{i % 6}.png',
-                    'discriminator': f'{3000 + i:04d}'
-                }
-                participants.append(dummy_user)
-            
-            # 웹서버에 테스트 세션 생성
-            session_data = {
-                'session_id': session_id,
-                'participants': participants,
-                'channel_id': str(ctx.channel.id),
-                'guild_id': str(ctx.guild.id),
-                'created_by': self.format_user_info(ctx.author),
-                'created_at': datetime.now().isoformat(),
-                'title': '🤖 사이버펑크 드래프트'
-            }
-            
-            response = requests.post(
-                f'{self.web_server_url}/api/session/create',
-                json=session_data,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                embed = discord.Embed(
-                    title="🤖 사이버펑크 드래프트",
-                    description="사이버펑크 스타일 드래프트 페이지가 생성되었습니다!",
-                    color=0x00ff88
-                )
-                embed.add_field(
-                    name="🎮 사이버 페이지",
-                    value=f"[매트릭스 진입!]({self.web_server_url}/draft_cyber/{session_id})",
-                    inline=False
-                )
-                embed.add_field(name="세션 ID", value=f"`{session_id}`", inline=True)
-                embed.add_field(name="참가자", value=f"{len(participants)}명", inline=True)
-                embed.add_field(name="테마", value="🟢 네온 사이버펑크", inline=True)
-                
-                await ctx.send(embed=embed)
-            else:
-                await ctx.send(f"❌ 사이버 세션 생성 실패: {response.text}")
-                
-        except Exception as e:
-            await ctx.send(f"❌ 사이버 드래프트 실패: {str(e)}")
+            channel = await _get_channel(bot, state['channel_id'])
+            message = await channel.fetch_message(message_id)
+            thread = await _get_channel(bot, state['thread_id'])
+            host = message.guild.get_member(state['host_id']) or await message.guild.fetch_member(state['host_id'])
+        except discord.HTTPException as e:
+            print(f"⚠️ 모집 복원 실패 - 삭제합니다 ({recruit_id}): {e}")
+            recruitment_store.delete(recruit_id)
+            continue
+
+        view = ParticipantView.from_state(thread, message, host, state, format_user_info)
+        bot.add_view(view, message_id=message_id)
+        if view.game_started and view.start_message_id:
+            bot.add_view(view.start_view(), message_id=view.start_message_id)
+        restored += 1
+    if restored:
+        print(f"♻️ 모집 {restored}개 복원")
+
+async def expire_recruitment(recruit_id, message_id, state):
+    """RECRUIT_TTL 동안 변화가 없던 모집의 버튼 해제 (저장소에서는 이미 지워짐)"""
+    view = active_views.pop(recruit_id, None)
+    if view is not None:
+        view.stop()
+        await view.embed_message.edit(view=None)
+    print(f"🧹 만료된 모집 정리: {recruit_id}")
+
+def setup_game_commands(bot):
+    # 참가자 정렬용 멤버 캐시를 멤버 이벤트로 갱신
+    member_cache.register(bot)
+
+    # 재시작 후 모집 복원 + 오래된 모집 정리 (on_ready는 재연결 때도 오므로 한 번만)
+    async def on_ready():
+        if getattr(bot, '_recruitments_restored', False):
+            return
+        bot._recruitments_restored = True
+        await restore_recruitments(bot)
+        recruitment_store.start_sweeper('participant', expire_recruitment)
+
+    bot.add_listener(on_ready)
+
+    # %내전1~5 는 bot/main.py의 로비 모집이 맡는다 - 여기서는 대기자/티어 정렬이 있는 모집
+    @bot.command(name="모집")
+    async def match_command(ctx, *, title: str = "나비내전"):
+        await start_match(ctx, title)
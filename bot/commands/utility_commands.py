@@ -2,6 +2,8 @@
 import random
 import discord
 from discord.ext import commands
+from bot.utils.web_client import web_client
+from bot.utils.message_coalescer import coalescer_stats
 
 def setup_utility_commands(bot):
     @bot.command(name="주사위")
@@ -15,16 +17,24 @@ def setup_utility_commands(bot):
             color=0x06ffa5
         )
         await ctx.send(embed=embed)
-    
-    @bot.command(name="나비")
-    async def butterfly_info(ctx):
-        embed = discord.Embed(
-            title="🦋 나비 내전 시스템",
-            description="나비처럼 아름다운 내전을 즐겨보세요!",
-            color=0x06ffa5
-        )
-        embed.add_field(name="📋 명령어", value="`!내전1` ~ `!내전5`", inline=True)
-        embed.add_field(name="🎲 주사위", value="`!주사위`", inline=True)
-        embed.add_field(name="🦋 정보", value="`!나비`", inline=True)
-        embed.set_footer(text="🦋 나비 서버에서 즐거운 내전 되세요!")
+
+    @bot.command(name="웹상태")
+    async def web_status(ctx):
+        """봇 -> 웹서버 호출 통계"""
+        stats = web_client.stats()
+        latency = stats['latency_ms']
+        embed = discord.Embed(title="🦋 웹서버 연결 상태", color=0x06ffa5)
+        embed.add_field(name="요청 / 실패", value=f"{stats['requests']} / {stats['failures']}", inline=True)
+        embed.add_field(name="지연 p50 / p95", value=f"{latency['p50']}ms / {latency['p95']}ms", inline=True)
+        embed.add_field(name="회로 차단기", value=stats['circuit'], inline=True)
+        await ctx.send(embed=embed)
+
+    @bot.command(name="알림상태")
+    async def activity_status(ctx):
+        """스레드 활동 알림 묶음 전송 통계"""
+        stats = coalescer_stats()
+        embed = discord.Embed(title="🦋 활동 알림 상태", color=0x06ffa5)
+        embed.add_field(name="대기 중", value=f"{stats['queued']}줄 ({stats['channels']}개 채널)", inline=True)
+        embed.add_field(name="전송", value=f"{stats['digests_sent']}개 메시지 / {stats['lines_sent']}줄", inline=True)
+        embed.add_field(name="요청 한도 초과(429)", value=f"{stats['rate_limited']}회", inline=True)
         await ctx.send(embed=embed)
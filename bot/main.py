@@ -11,6 +11,16 @@ sys.path.insert(0, str(project_root))
 
 from shared.config import Config
 from shared.database import Database
+from shared.readiness import mark_ready
+from bot.utils.notifier import send_dms
+from bot.utils.web_bridge import event_bus, create_web_session, build_result_embed
+from bot.utils.web_client import WebServerUnavailable
+from bot.utils.recruitment_store import recruitment_store
+from bot.commands.game_commands import setup_game_commands
+from bot.commands.utility_commands import setup_utility_commands
+from shared.event_bus import DRAFT_PROGRESS, DRAFT_CONFIRMED
+from shared.team_balancer import balance_teams, build_players, load_player_stats
+from shared.rating import record_game_result
 import discord
 from discord.ext import commands
 import asyncio
@@ -23,18 +33,41 @@ intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix='%', intents=intents)
 
-# 게임 세션 저장소
+# 게임 세션 저장소 (recruitment_store에 함께 저장되어 재시작 후 복원)
 game_sessions = {}
+# 모집 메시지에 연결된 버튼 뷰 (정리할 때 stop()으로 해제)
+lobby_views = {}
 
 class GameSession:
     def __init__(self, session_id, channel_id):
         self.session_id = session_id
         self.channel_id = channel_id
+        self.message_id = None
         self.participants = []
         self.status = 'recruiting'
         self.created_at = datetime.now()
         self.max_players = 10
     
+    def to_state(self):
+        return {
+            'channel_id': self.channel_id,
+            'participants': self.participants,
+            'status': self.status,
+            'created_at': self.created_at.isoformat()
+        }
+    
+    @classmethod
+    def from_state(cls, session_id, message_id, state):
+        session = cls(session_id, state['channel_id'])
+        session.message_id = message_id
+        session.participants = state['participants']
+        session.status = state['status']
+        session.created_at = datetime.fromisoformat(state['created_at'])
+        return session
+    
+    def save(self):
+        recruitment_store.save(self.session_id, 'lobby', self.message_id, self.to_state())
+    
     def add_participant(self, user):
         if len(self.participants) < self.max_players:
             self.participants.append({
@@ -58,6 +91,71 @@ class GameSession:
 async def on_ready():
     print(f'🦋 {bot.user} 나비 내전 봇이 준비되었습니다!')
     print(f'🔗 봇이 {len(bot.guilds)}개의 서버에 연결되어 있습니다.')
+    # 재연결 때도 on_ready가 다시 오므로 한 번만 시작
+    if not event_bus.running:
+        await event_bus.start()
+        restore_lobbies()
+        recruitment_store.start_sweeper('lobby', expire_lobby)
+    mark_ready()
+
+def restore_lobbies():
+    """저장된 모집 상태 복원 - 모집 중인 메시지에는 버튼 뷰를 다시 연결"""
+    restored = 0
+    for session_id, message_id, state in recruitment_store.load('lobby'):
+        session = GameSession.from_state(session_id, message_id, state)
+        game_sessions[session_id] = session
+        if session.status == 'recruiting' and message_id:
+            view = GameParticipationView(session_id)
+            bot.add_view(view, message_id=message_id)
+            lobby_views[session_id] = view
+            restored += 1
+    if game_sessions:
+        print(f"♻️ 내전 세션 {len(game_sessions)}개 복원 (모집 중 {restored}개)")
+
+def forget_lobby(session_id):
+    """메모리/저장소에서 세션 제거, 버튼 뷰 해제"""
+    game_sessions.pop(session_id, None)
+    recruitment_store.delete(session_id)
+    view = lobby_views.pop(session_id, None)
+    if view is not None:
+        view.stop()
+
+async def expire_lobby(session_id, message_id, state):
+    """RECRUIT_TTL 동안 변화가 없던 모집 정리 (저장소에서는 이미 지워짐)"""
+    game_sessions.pop(session_id, None)
+    view = lobby_views.pop(session_id, None)
+    if view is not None:
+        view.stop()
+    if state['status'] == 'recruiting' and message_id:
+        channel = bot.get_channel(state['channel_id'])
+        if channel is not None:
+            await channel.get_partial_message(message_id).edit(content="⌛ 모집이 만료되었습니다.", view=None)
+    print(f"🧹 만료된 내전 세션 정리: {session_id}")
+
+@event_bus.on(DRAFT_PROGRESS)
+def on_draft_progress(data):
+    """웹서버 밴/픽 진행 상황"""
+    session = game_sessions.get(data['session_id'])
+    if session is not None:
+        status = 'draft_done' if data['completed'] else 'drafting'
+        if session.status != status:
+            session.status = status
+            session.save()
+
+@event_bus.on(DRAFT_CONFIRMED)
+async def on_draft_confirmed(data):
+    """확정된 밴픽 결과를 세션 채널에 전송"""
+    session = game_sessions.get(data['session_id'])
+    if session is not None:
+        session.status = 'completed'
+        session.save()
+    
+    channel_id = str(data.get('channel_id') or '')
+    if not channel_id.isdigit():
+        print(f"⚠️ 결과를 보낼 채널이 없습니다: {data['session_id']}")
+        return
+    channel = bot.get_channel(int(channel_id)) or await bot.fetch_channel(int(channel_id))
+    await channel.send(embed=build_result_embed(data))
 
 @bot.command(name='내전1')
 async def start_game_1(ctx):
@@ -79,6 +177,30 @@ async def start_game_4(ctx):
 async def start_game_5(ctx):
     await start_internal_game(ctx, 5)
 
+async def open_web_session(session, guild_id, title):
+    """모은 참가자로 웹서버에 밴픽 세션 생성 (결과가 이 채널로 돌아온다) - 실패하면 False"""
+    try:
+        return await create_web_session({
+            'session_id': session.session_id,
+            'participants': [{
+                'discord_id': p['discord_id'],
+                'username': p['discord_name'],
+                'display_name': p['discord_name'],
+                'avatar_url': 'https://cdn.discordapp.com/embed/avatars/0.png',
+                'discriminator': '0000'
+            } for p in session.participants],
+            'channel_id': str(session.channel_id),
+            'guild_id': str(guild_id),
+            'created_by': session.participants[0]['discord_id'],
+            'created_at': session.created_at.isoformat(),
+            'title': title
+        })
+    except WebServerUnavailable as e:
+        print(f"⚠️ 웹서버 세션 생성 실패: {e}")
+        return False
+
+WEB_SESSION_FAILED = "⚠️ 웹서버에 밴픽 세션을 만들지 못했습니다. 웹서버 상태(`%웹상태`)를 확인해주세요."
+
 async def start_internal_game(ctx, game_number):
     """내전 게임 시작"""
     session_id = f"game_{game_number}_{ctx.channel.id}_{int(datetime.now().timestamp())}"
@@ -101,16 +223,19 @@ async def start_internal_game(ctx, game_number):
     
     view = GameParticipationView(session_id)
     message = await ctx.send(embed=embed, view=view)
+    lobby_views[session_id] = view
     
     # 메시지 ID 저장
     session.message_id = message.id
+    session.save()
 
 class GameParticipationView(discord.ui.View):
+    """모집 버튼 - 재시작 후에도 같은 custom_id로 메시지에 다시 연결된다 (오래된 모집은 정리 작업이 해제)"""
     def __init__(self, session_id):
-        super().__init__(timeout=300)  # 5분 타임아웃
+        super().__init__(timeout=None)
         self.session_id = session_id
     
-    @discord.ui.button(label='🦋 참가하기', style=discord.ButtonStyle.primary)
+    @discord.ui.button(label='🦋 참가하기', style=discord.ButtonStyle.primary, custom_id='nabi:lobby:join')
     async def join_game(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer()
         
@@ -137,36 +262,48 @@ class GameParticipationView(discord.ui.View):
             embed.add_field(name="참가자 목록", value=participant_list, inline=False)
             
             # 10명이 모였는지 확인
+            banpick_url = None
             if session.is_full():
                 embed.title = "🎉 10명 모집 완료!"
                 embed.description = "밴픽 페이지로 이동합니다..."
                 embed.color = 0x00ff00
                 
-                # 밴픽 페이지 링크 생성
-                draft_cyber_url = f"{Config.get_base_url()}/draft_cyber/{session.session_id}"
-                embed.add_field(name="🔗 밴픽 페이지", value=f"[여기를 클릭하세요!]({draft_cyber_url})", inline=False)
-                
                 # 세션 상태 업데이트
                 session.status = 'lobby'
                 
-                # 참가자들에게 DM 발송
-                for participant in session.participants:
-                    try:
-                        user = await interaction.client.fetch_user(int(participant['discord_id']))
-                        await user.send(f"🦋 내전 밴픽이 시작되었습니다!\n🔗 {draft_cyber_url}")
-                    except:
-                        pass  # DM 발송 실패는 무시
+                # 웹서버에 세션을 만든 뒤에만 밴픽 페이지 링크를 보낸다 (없는 세션은 404)
+                # 포지션 선택 후 드래프트 시작 - 웹 세션은 position_select에서 시작한다
+                if await open_web_session(session, interaction.guild_id, embed.title):
+                    banpick_url = f"{Config.get_base_url()}/banpick/{session.session_id}"
+                    embed.add_field(name="🔗 밴픽 페이지", value=f"[여기를 클릭하세요!]({banpick_url})", inline=False)
+                else:
+                    embed.add_field(name="🔗 밴픽 페이지", value=WEB_SESSION_FAILED, inline=False)
                 
-                # 버튼 비활성화
+                # 버튼 비활성화 (모집 완료 - 더 이상 버튼 이벤트를 받지 않음)
                 for item in self.children:
                     item.disabled = True
+                self.stop()
+                lobby_views.pop(self.session_id, None)
             
+            session.save()
             await interaction.edit_original_response(embed=embed, view=self if not session.is_full() else None)
             
+            if banpick_url is not None:
+                # 참가자들에게 DM 동시 발송 - 받지 못한 참가자는 채널에서 멘션
+                results = await send_dms(
+                    interaction.client,
+                    [p['discord_id'] for p in session.participants],
+                    f"🦋 내전 밴픽이 시작되었습니다!\n🔗 {banpick_url}"
+                )
+                failed = [r.user_id for r in results if not r.ok and r.user_id.isdigit()]
+                if failed:
+                    mentions = ' '.join(f"<@{user_id}>" for user_id in failed)
+                    await interaction.followup.send(f"📨 DM을 받지 못한 참가자: {mentions}\n🔗 {banpick_url}")
+            
         else:
             await interaction.followup.send("❌ 참가자가 가득 찼습니다!", ephemeral=True)
     
-    @discord.ui.button(label='❌ 참가 취소', style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label='❌ 참가 취소', style=discord.ButtonStyle.secondary, custom_id='nabi:lobby:leave')
     async def leave_game(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer()
         
@@ -182,6 +319,7 @@ class GameParticipationView(discord.ui.View):
             return
         
         session.remove_participant(user_id)
+        session.save()
         
         if session.participants:
             participant_list = "\n".join([f"{i+1}. {p['discord_name']}" for i, p in enumerate(session.participants)])
@@ -205,7 +343,8 @@ async def nabi_info(ctx):
         description="아름다운 리그 오브 레전드 내전 시스템입니다.",
         color=0x9932cc
     )
-    embed.add_field(name="📋 명령어", value="`!내전1` ~ `!내전5`: 내전 모집\n`!나비`: 시스템 정보", inline=False)
+    embed.add_field(name="📋 명령어", value="`!내전1` ~ `!내전5`: 내전 모집\n`!모집 [제목]`: 대기자 명단이 있는 모집\n`!나비`: 시스템 정보\n`!주사위`: 주사위", inline=False)
+    embed.add_field(name="🔧 상태", value="`!웹상태`: 웹서버 연결\n`!알림상태`: 활동 알림 전송", inline=False)
     embed.add_field(name="🎮 기능", value="• 10명 자동 모집\n• 웹 기반 밴픽\n• 실시간 결과 처리", inline=False)
     
     await ctx.send(embed=embed)
@@ -253,15 +392,80 @@ async def test_fill_game(ctx):
     )
     embed.add_field(name="참가자 목록", value=participant_list, inline=False)
     
-    # 밴픽 페이지 링크 생성
-    draft_cyber_url = f"{Config.get_base_url()}/draft_cyber/{session.session_id}"
-    embed.add_field(name="🔗 밴픽 페이지", value=f"[여기를 클릭하세요!]({draft_cyber_url})", inline=False)
+    # 웹서버에 세션을 만든 뒤에만 링크를 보낸다 (더미 참가자는 밴픽 페이지의 자동 배정으로 자리를 채운다)
+    if await open_web_session(session, ctx.guild.id, embed.title):
+        banpick_url = f"{Config.get_base_url()}/banpick/{session.session_id}"
+        embed.add_field(name="🔗 밴픽 페이지", value=f"[여기를 클릭하세요!]({banpick_url})", inline=False)
+    else:
+        embed.add_field(name="🔗 밴픽 페이지", value=WEB_SESSION_FAILED, inline=False)
     
     # 세션 상태 업데이트
     session.status = 'lobby'
+    session.save()
     
     await ctx.send(embed=embed)
 
+@bot.command(name='밸런스')
+async def balance_command(ctx):
+    """현재 채널 모집 인원으로 전력이 비슷한 팀 나누기 추천"""
+    sessions = [s for s in game_sessions.values() if s.channel_id == ctx.channel.id and s.participants]
+    if not sessions:
+        await ctx.send("❌ 참가자가 있는 내전이 없습니다. 먼저 %내전1을 실행하세요!")
+        return
+    
+    session = max(sessions, key=lambda s: s.created_at)
+    participants = [{'discord_id': p['discord_id'], 'display_name': p['discord_name']} for p in session.participants]
+    if len(participants) % 2:
+        await ctx.send(f"❌ 짝수 인원만 나눌 수 있습니다 (현재 {len(participants)}명)")
+        return
+    
+    # DB 조회는 이벤트 루프를 막지 않도록 스레드에서
+    stats = await asyncio.to_thread(load_player_stats, [p['discord_id'] for p in participants])
+    splits = balance_teams(build_players(participants, stats), top_k=3)
+    
+    embed = discord.Embed(title="⚖️ 팀 밸런스 추천", description=f"{len(participants)}명 기준", color=0x9932cc)
+    for rank, split in enumerate(splits, 1):
+        embed.add_field(
+            name=f"{rank}안 - 전력 차 {split.difference:.0f}",
+            value=(
+                f"🔵 {', '.join(player.name for player in split.blue)} ({split.blue_strength:.0f})\n"
+                f"🔴 {', '.join(player.name for player in split.red)} ({split.red_strength:.0f})"
+            ),
+            inline=False
+        )
+    await ctx.send(embed=embed)
+
+RESULT_TEAMS = {'블루': 'blue', 'blue': 'blue', '레드': 'red', 'red': 'red'}
+
+@bot.command(name='결과')
+@commands.has_permissions(manage_messages=True)
+async def record_result(ctx, session_id: str, winner: str):
+    """경기 결과 기록 + 레이팅 갱신 (예: %결과 <세션ID> 블루)"""
+    winner_team = RESULT_TEAMS.get(winner.lower())
+    if winner_team is None:
+        await ctx.send("❌ 승리 팀은 블루 또는 레드로 입력하세요!")
+        return
+    
+    game = await asyncio.to_thread(Database().fetch_one, "SELECT id FROM games WHERE session_id = %s", (session_id,))
+    if game is None:
+        await ctx.send(f"❌ 기록된 경기가 없습니다: `{session_id}`")
+        return
+    
+    try:
+        changes = await asyncio.to_thread(record_game_result, game['id'], winner_team)
+    except ValueError as e:
+        await ctx.send(f"❌ {e}")
+        return
+    
+    embed = discord.Embed(title="🏆 경기 결과 기록", description=f"세션 `{session_id}` - {winner} 승리", color=0x9932cc)
+    for team, label in (('blue', '🔵 블루팀'), ('red', '🔴 레드팀')):
+        lines = [
+            f"<@{change.discord_id}> {change.after:.0f} ({change.delta:+.0f})"
+            for change in changes if change.team == team
+        ]
+        embed.add_field(name=label, value="\n".join(lines) or "-", inline=True)
+    await ctx.send(embed=embed)
+
 @bot.command(name='리셋')
 async def reset_games(ctx):
     """테스트용: 현재 채널의 모든 게임 세션 리셋"""
@@ -269,7 +473,7 @@ async def reset_games(ctx):
     sessions_to_remove = [sid for sid, session in game_sessions.items() if session.channel_id == ctx.channel.id]
     
     for sid in sessions_to_remove:
-        del game_sessions[sid]
+        forget_lobby(sid)
     
     await ctx.send(f"✅ {len(sessions_to_remove)}개의 게임 세션을 리셋했습니다!")
 
@@ -294,6 +498,12 @@ async def draft_test(ctx):
     
     await ctx.send(embed=embed)
 
+# 분리된 명령어 모듈 등록
+# - %모집 + 모집 뷰 복원/만료 정리 + 멤버 캐시 이벤트
+# - %주사위, %웹상태, %알림상태
+setup_game_commands(bot)
+setup_utility_commands(bot)
+
 
 def main():
     """봇 실행"""
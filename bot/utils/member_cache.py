@@ -0,0 +1,110 @@
+"""멤버 표시 이름/티어 캐시
+
+(서버 id, 멤버 id) -> (표시 이름, 티어, 정렬 키). 닉네임은 바뀔 때만 다시 파싱한다.
+멤버 이벤트(on_member_update/join/remove)로 갱신되고, 버튼 상호작용의 interaction.user도
+최신 멤버 정보이므로 그때마다 넣어 준다. 멤버 이벤트는 members 인텐트가 있어야 오지만
+없어도 상호작용과 guild.get_member(내부 dict 조회)로 채워진다.
+캐시에 없는 멤버는 resolve()/resolve_members()가 REST 조회를 동시에 보내 채운다.
+"""
+import asyncio
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from shared.nickname_parser import parse_tier_from_nickname
+from shared.constants import TIER_ORDER
+
+
+class MemberInfo(NamedTuple):
+    display_name: str
+    tier: str
+    sort_key: float
+
+
+UNKNOWN_MEMBER = MemberInfo('', 'unknown', float('inf'))
+
+
+def member_info(display_name: str) -> MemberInfo:
+    tier = parse_tier_from_nickname(display_name)
+    return MemberInfo(display_name, tier, TIER_ORDER.get(tier, float('inf')))
+
+
+class MemberCache:
+    def __init__(self):
+        self._entries: Dict[Tuple[int, int], MemberInfo] = {}
+
+    def update(self, member) -> MemberInfo:
+        """멤버 정보 저장 (표시 이름이 같으면 기존 항목 재사용)"""
+        key = (member.guild.id, member.id)
+        info = self._entries.get(key)
+        if info is None or info.display_name != member.display_name:
+            info = member_info(member.display_name)
+            self._entries[key] = info
+        return info
+
+    def remove(self, guild_id: int, member_id: int) -> None:
+        self._entries.pop((guild_id, member_id), None)
+
+    def get(self, guild, member_id: int) -> MemberInfo:
+        """캐시 조회 - 없으면 길드 멤버 캐시에서 찾아 저장 (모르는 멤버는 UNKNOWN_MEMBER)"""
+        info = self._entries.get((guild.id, member_id))
+        if info is not None:
+            return info
+        member = guild.get_member(member_id)
+        return self.update(member) if member is not None else UNKNOWN_MEMBER
+
+    def display_name(self, guild, member_id: int) -> Optional[str]:
+        info = self.get(guild, member_id)
+        return info.display_name if info is not UNKNOWN_MEMBER else None
+
+    async def resolve(self, guild, member_ids: Iterable[int]) -> List[MemberInfo]:
+        """여러 멤버 정보 조회 - 캐시에 없는 멤버만 fetch_member를 동시에 호출"""
+        member_ids = list(member_ids)
+        infos = [self.get(guild, member_id) for member_id in member_ids]
+        missing = [i for i, info in enumerate(infos) if info is UNKNOWN_MEMBER]
+        if missing:
+            results = await asyncio.gather(
+                *(guild.fetch_member(member_ids[i]) for i in missing), return_exceptions=True
+            )
+            for i, member in zip(missing, results):
+                if not isinstance(member, BaseException):
+                    infos[i] = self.update(member)
+        return infos
+
+    async def resolve_members(self, guild, member_ids: Iterable[int]) -> list:
+        """멤버 객체 조회 - 길드 캐시에 없는 멤버만 fetch_member를 동시에 호출 (못 찾으면 None)"""
+        member_ids = list(member_ids)
+        members = [guild.get_member(member_id) for member_id in member_ids]
+        missing = [i for i, member in enumerate(members) if member is None]
+        if missing:
+            results = await asyncio.gather(
+                *(guild.fetch_member(member_ids[i]) for i in missing), return_exceptions=True
+            )
+            for i, member in zip(missing, results):
+                if isinstance(member, BaseException):
+                    print(f"유저 정보 가져오기 실패 (ID: {member_ids[i]}): {member}")
+                else:
+                    members[i] = member
+        for member in members:
+            if member is not None:
+                self.update(member)
+        return members
+
+    def register(self, bot) -> None:
+        """봇 멤버 이벤트에 연결"""
+        async def on_member_join(member):
+            self.update(member)
+
+        async def on_member_update(before, after):
+            self.update(after)
+
+        async def on_member_remove(member):
+            self.remove(member.guild.id, member.id)
+
+        bot.add_listener(on_member_join)
+        bot.add_listener(on_member_update)
+        bot.add_listener(on_member_remove)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+member_cache = MemberCache()
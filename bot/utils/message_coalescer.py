@@ -0,0 +1,110 @@
+"""채널별 활동 메시지 묶음 전송
+
+참가/취소/홍보 같은 한 줄 알림은 바로 보내지 않고 모아 두었다가
+DIGEST_INTERVAL마다 한 메시지로 보낸다. 채널 전송 한도를 아껴서
+시작 안내처럼 중요한 메시지(send_now)가 밀리지 않게 한다.
+"""
+import asyncio
+import weakref
+from collections import deque
+from typing import Dict
+
+import discord
+
+DIGEST_INTERVAL = 3.0
+MAX_MESSAGE_LENGTH = 2000  # 디스코드 메시지 최대 길이
+
+# 프로세스 전체 누적 통계 (채널별 전송기가 정리되어도 남는다)
+_totals = {'digests_sent': 0, 'lines_sent': 0, 'rate_limited': 0}
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return isinstance(error, discord.RateLimited) or (
+        isinstance(error, discord.HTTPException) and error.status == 429
+    )
+
+
+class MessageCoalescer:
+    def __init__(self, channel, interval: float = DIGEST_INTERVAL):
+        self.channel = channel
+        self.interval = interval
+        self._lines = deque()
+        self._task = None
+        self.digests_sent = 0
+        self.lines_sent = 0
+        self.rate_limited = 0
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        setattr(self, name, getattr(self, name) + amount)
+        _totals[name] += amount
+
+    def add(self, line: str) -> None:
+        """낮은 우선순위 알림 - 다음 묶음에 포함"""
+        self._lines.append(line)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_later())
+
+    async def send_now(self, *args, **kwargs):
+        """높은 우선순위 메시지 - 대기열을 거치지 않고 바로 전송"""
+        try:
+            return await self.channel.send(*args, **kwargs)
+        except discord.HTTPException as e:
+            if _is_rate_limited(e):
+                self._count('rate_limited')
+            raise
+
+    async def _flush_later(self):
+        while self._lines:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """모아 둔 알림을 메시지 길이 한도에 맞춰 전송"""
+        while self._lines:
+            batch = []
+            length = 0
+            while self._lines and length + len(self._lines[0]) + 1 <= MAX_MESSAGE_LENGTH:
+                line = self._lines.popleft()
+                batch.append(line)
+                length += len(line) + 1
+            if not batch:  # 한 줄이 한도보다 길면 잘라서 보낸다
+                batch.append(self._lines.popleft()[:MAX_MESSAGE_LENGTH])
+
+            try:
+                await self.channel.send("\n".join(batch))
+            except discord.HTTPException as e:
+                if _is_rate_limited(e):
+                    # 요청 한도 초과 - 다음 주기에 다시 보낸다
+                    self._count('rate_limited')
+                    self._lines.extendleft(reversed(batch))
+                else:
+                    print(f"❌ 활동 알림 전송 실패: {e}")
+                return
+            self._count('digests_sent')
+            self._count('lines_sent', len(batch))
+
+    @property
+    def queued(self) -> int:
+        return len(self._lines)
+
+
+_coalescers: "weakref.WeakValueDictionary[int, MessageCoalescer]" = weakref.WeakValueDictionary()
+
+
+def coalescer_for(channel) -> MessageCoalescer:
+    """채널별 묶음 전송기 (채널을 쓰는 뷰가 사라지면 함께 정리)"""
+    coalescer = _coalescers.get(channel.id)
+    if coalescer is None:
+        coalescer = MessageCoalescer(channel)
+        _coalescers[channel.id] = coalescer
+    return coalescer
+
+
+def coalescer_stats() -> Dict[str, int]:
+    """현재 대기 줄 수(살아 있는 채널) + 프로세스 전체 누적 묶음/줄 수, 429 횟수"""
+    coalescers = list(_coalescers.values())
+    return {
+        'channels': len(coalescers),
+        'queued': sum(c.queued for c in coalescers),
+        **_totals
+    }
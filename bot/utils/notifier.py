@@ -0,0 +1,60 @@
+"""참가자 DM 일괄 발송
+
+동시 발송 수를 제한해 병렬로 DM을 보낸다. 디스코드 요청 제한(route bucket)은
+discord.py HTTP 클라이언트가 버킷별로 지켜 주고 (429면 기다렸다 재시도),
+DM은 채널마다 버킷이 따로라 동시에 보내도 서로 막지 않는다.
+유저 객체와 DM 채널은 봇 캐시에 있으면 그대로 쓰고 없을 때만 조회/생성한다.
+"""
+import asyncio
+from typing import Iterable, List, NamedTuple, Optional
+
+import discord
+
+DM_CONCURRENCY = 10
+
+
+class DeliveryResult(NamedTuple):
+    user_id: str
+    ok: bool
+    error: Optional[str] = None
+
+
+async def _get_user(client, user_id: int):
+    user = client.get_user(user_id)
+    if user is None:
+        user = await client.fetch_user(user_id)
+    return user
+
+
+async def send_dm(client, user_id, content: str) -> DeliveryResult:
+    """한 명에게 DM 발송 - 실패 사유를 결과로 반환 (예외를 던지지 않음)"""
+    try:
+        user = await _get_user(client, int(user_id))
+        channel = user.dm_channel or await user.create_dm()
+        await channel.send(content)
+        return DeliveryResult(str(user_id), True)
+    except ValueError:
+        return DeliveryResult(str(user_id), False, '잘못된 유저 ID')
+    except discord.Forbidden:
+        return DeliveryResult(str(user_id), False, 'DM 차단')
+    except discord.NotFound:
+        return DeliveryResult(str(user_id), False, '유저 없음')
+    except discord.HTTPException as e:
+        return DeliveryResult(str(user_id), False, f'HTTP {e.status}')
+
+
+async def send_dms(client, user_ids: Iterable, content: str,
+                   concurrency: int = DM_CONCURRENCY) -> List[DeliveryResult]:
+    """여러 명에게 동시에 DM 발송 (입력 순서대로 결과 반환)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def deliver(user_id):
+        async with semaphore:
+            return await send_dm(client, user_id, content)
+
+    results = await asyncio.gather(*(deliver(user_id) for user_id in user_ids))
+    failed = [result for result in results if not result.ok]
+    print(f"📨 DM 발송: 성공 {len(results) - len(failed)}명, 실패 {len(failed)}명")
+    for result in failed:
+        print(f"   - {result.user_id}: {result.error}")
+    return results
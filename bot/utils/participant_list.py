@@ -0,0 +1,54 @@
+"""정렬된 참가자 목록
+
+(정렬 키, 참가 순번, 유저 id) 튜플을 정렬된 상태로 유지한다.
+삽입/삭제 위치는 이분 탐색으로 찾고, 같은 티어끼리는 먼저 참가한 순서를 지킨다.
+"""
+import itertools
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterator, List, Tuple
+
+Entry = Tuple[float, int, int]
+
+
+class ParticipantList:
+    def __init__(self, sort_key: Callable[[int], float]):
+        self._sort_key = sort_key
+        self._entries: List[Entry] = []
+        self._by_id: Dict[int, Entry] = {}
+        self._sequence = itertools.count()
+
+    def add(self, user_id: int) -> None:
+        if user_id in self._by_id:
+            return
+        entry = (self._sort_key(user_id), next(self._sequence), user_id)
+        insort(self._entries, entry)
+        self._by_id[user_id] = entry
+
+    def remove(self, user_id: int) -> None:
+        """참가자 제거 (없으면 ValueError - list.remove와 같다)"""
+        entry = self._by_id.pop(user_id, None)
+        if entry is None:
+            raise ValueError(f"{user_id} not in participants")
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def refresh(self, user_id: int) -> None:
+        """정렬 키가 바뀌었을 때 (닉네임 티어 변경) 위치 다시 잡기"""
+        entry = self._by_id.get(user_id)
+        if entry is None or entry[0] == self._sort_key(user_id):
+            return
+        del self._entries[bisect_left(self._entries, entry)]
+        entry = (self._sort_key(user_id), entry[1], user_id)
+        insort(self._entries, entry)
+        self._by_id[user_id] = entry
+
+    def __contains__(self, user_id) -> bool:
+        return user_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[int]:
+        return (entry[2] for entry in self._entries)
+
+    def __getitem__(self, index: int) -> int:
+        return self._entries[index][2]
@@ -0,0 +1,98 @@
+"""내전 모집 상태 저장소 (SQLite)
+
+모집 메시지의 상태(참가자, 대기자, 진행 상태)를 로컬 SQLite 파일에 보관해
+봇이 재시작해도 on_ready에서 같은 메시지에 버튼 뷰를 다시 연결할 수 있게 한다.
+- kind: 'lobby' (bot/main.py 모집) / 'participant' (ParticipantView 모집)
+- 마지막 변경 후 RECRUIT_TTL이 지난 모집은 정리 작업(start_sweeper)이 지운다.
+"""
+import asyncio
+import os
+import sqlite3
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import msgspec
+
+from shared.config import Config
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+Entry = Tuple[str, int, dict]  # (모집 id, 메시지 id, 상태)
+
+
+class RecruitmentStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or Config.RECRUIT_STORE_PATH
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # 봇은 이벤트 루프 스레드 하나에서만 쓰므로 연결 하나를 재사용한다
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS recruitments (
+                    recruit_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    message_id INTEGER,
+                    state BLOB NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_recruitments_updated_at ON recruitments (updated_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def save(self, recruit_id: str, kind: str, message_id: Optional[int], state: dict) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO recruitments (recruit_id, kind, message_id, state, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (recruit_id, kind, message_id, _encoder.encode(state), time.time())
+        )
+
+    def delete(self, recruit_id: str) -> None:
+        self._connect().execute("DELETE FROM recruitments WHERE recruit_id = ?", (recruit_id,))
+
+    def load(self, kind: str) -> List[Entry]:
+        rows = self._connect().execute(
+            "SELECT recruit_id, message_id, state FROM recruitments WHERE kind = ? ORDER BY updated_at",
+            (kind,)
+        ).fetchall()
+        return [(recruit_id, message_id, _decoder.decode(state)) for recruit_id, message_id, state in rows]
+
+    def sweep(self, kind: str, ttl: float, now: Optional[float] = None) -> List[Entry]:
+        """ttl 동안 변경이 없던 모집을 지우고 지운 항목 반환"""
+        cutoff = (time.time() if now is None else now) - ttl
+        connection = self._connect()
+        rows = connection.execute(
+            "SELECT recruit_id, message_id, state FROM recruitments WHERE kind = ? AND updated_at <= ?",
+            (kind, cutoff)
+        ).fetchall()
+        if rows:
+            connection.executemany(
+                "DELETE FROM recruitments WHERE recruit_id = ?", [(row[0],) for row in rows]
+            )
+        return [(recruit_id, message_id, _decoder.decode(state)) for recruit_id, message_id, state in rows]
+
+    def start_sweeper(self, kind: str, on_expired: Callable[[str, int, dict], Awaitable[None]]) -> asyncio.Task:
+        """RECRUIT_SWEEP_INTERVAL마다 오래된 모집 정리 (항목마다 on_expired 호출)"""
+        async def sweeper():
+            while True:
+                await asyncio.sleep(Config.RECRUIT_SWEEP_INTERVAL)
+                for recruit_id, message_id, state in self.sweep(kind, Config.RECRUIT_TTL):
+                    try:
+                        await on_expired(recruit_id, message_id, state)
+                    except Exception as e:
+                        print(f"❌ 만료된 모집 정리 실패 ({recruit_id}): {e}")
+
+        return asyncio.create_task(sweeper())
+
+
+recruitment_store = RecruitmentStore()
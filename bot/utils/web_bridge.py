@@ -0,0 +1,48 @@
+"""봇 -> 웹서버 연결
+
+로컬 이벤트 버스(shared/event_bus.py)로 먼저 보내고, 웹 워커가 처리 완료를 알려오지 않으면
+(연결 없음, 처리 실패, 응답 시간 초과) HTTP API를 쓴다.
+웹서버가 보내는 드래프트 진행/확정 이벤트 핸들러는 bot/main.py에서 event_bus.on으로 등록한다.
+"""
+import discord
+
+from bot.utils.web_client import web_client
+from shared.constants import POSITIONS
+from shared.event_bus import EventBusServer, SESSION_CREATED
+
+TEAM_LABELS = {'blue': '🔵 블루팀', 'red': '🔴 레드팀'}
+
+event_bus = EventBusServer()
+
+
+async def create_web_session(session_data) -> bool:
+    """웹서버에 게임 세션 생성 (HTTP 대체 경로도 실패하면 WebServerUnavailable)"""
+    reply = await event_bus.request(SESSION_CREATED, session_data)
+    if reply is not None and reply.get('ok'):
+        return True
+    if reply is not None:
+        print(f"⚠️ 이벤트 버스 세션 생성 실패 - HTTP로 재시도: {reply.get('error')}")
+
+    response = await web_client.post_json('/api/session/create', session_data)
+    if not response.ok:
+        print(f"❌ 웹서버 세션 생성 실패 ({response.status}): {response.text}")
+    return response.ok
+
+
+def build_result_embed(data) -> discord.Embed:
+    """확정된 드래프트 결과 임베드"""
+    embed = discord.Embed(
+        title=f"🏆 {data.get('title', '나비내전')} 밴픽 결과",
+        description=f"세션 `{data['session_id']}`",
+        color=0x9932cc
+    )
+    teams = (data.get('final_data') or {}).get('teams') or {}
+    for team, label in TEAM_LABELS.items():
+        lines = []
+        for position in POSITIONS:
+            slot = (teams.get(team) or {}).get(position) or {}
+            player = (slot.get('player') or {}).get('display_name', '-')
+            champion = (slot.get('champion') or {}).get('korean_name', '-')
+            lines.append(f"`{position}` {player} - {champion}")
+        embed.add_field(name=label, value="\n".join(lines), inline=True)
+    return embed
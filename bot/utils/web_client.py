@@ -0,0 +1,185 @@
+"""봇 -> 웹서버 비동기 HTTP 클라이언트
+
+디스코드 이벤트 루프를 막지 않도록 aiohttp 세션 하나(연결 풀)를 봇 전체가 공유한다.
+- 호출마다 전체 마감 시간 (재시도 포함)
+- 연결 실패/시간 초과/5xx/응답 해석 실패는 지수 백오프 + 지터로 재시도
+- 웹서버가 계속 실패하면 회로 차단기가 열려 일정 시간 바로 실패 처리
+- 최근 요청 지연 시간 통계
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, NamedTuple, Optional
+
+import aiohttp
+
+from shared.config import Config
+
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 2.0
+
+
+class WebServerUnavailable(Exception):
+    """웹서버에 연결할 수 없음 (재시도 소진 또는 회로 차단)"""
+
+
+class WebResponse(NamedTuple):
+    status: int
+    data: Any
+    text: str
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold번이면 reset_timeout 동안 요청 차단
+
+    차단 시간이 지나면 요청 하나만 시험으로 보내고 (half-open) 성공하면 닫는다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == 'closed':
+            return True
+        if state == 'half_open' and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_running = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def release_trial(self) -> None:
+        """시험 요청이 결과 기록 없이 끝났을 때(취소 등) 다음 요청이 다시 시험할 수 있게 한다"""
+        self._trial_running = False
+
+
+class WebClient:
+    def __init__(self, base_url: Optional[str] = None, timeout: Optional[float] = None,
+                 retries: Optional[int] = None, pool_size: int = 20):
+        self.base_url = (base_url or Config.WEB_INTERNAL_URL).rstrip('/')
+        self.timeout = timeout if timeout is not None else Config.WEB_CLIENT_TIMEOUT
+        self.retries = retries if retries is not None else Config.WEB_CLIENT_RETRIES
+        self.pool_size = pool_size
+        self.breaker = CircuitBreaker()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._latencies = deque(maxlen=500)
+        self.requests = 0
+        self.failures = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # 이벤트 루프 안에서 처음 쓸 때 만든다
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            )
+        return self._session
+
+    async def request(self, method: str, path: str, json: Any = None,
+                      timeout: Optional[float] = None) -> WebResponse:
+        """요청 전송 - 응답(4xx 포함)을 받으면 반환, 끝내 연결하지 못하면 WebServerUnavailable"""
+        if not self.breaker.allow():
+            raise WebServerUnavailable("웹서버 회로 차단 중")
+
+        trial = self.breaker.state == 'half_open'
+        try:
+            return await self._attempt(method, path, json, timeout)
+        finally:
+            # 취소되거나 예상 못 한 예외로 끝나도 half-open 시험 표시가 남지 않게
+            if trial:
+                self.breaker.release_trial()
+
+    async def _attempt(self, method: str, path: str, json: Any, timeout: Optional[float]) -> WebResponse:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout)
+        last_error = None
+
+        for attempt in range(self.retries + 1):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            started = time.perf_counter()
+            self.requests += 1
+            try:
+                async with self._get_session().request(
+                    method, f"{self.base_url}{path}", json=json,
+                    timeout=aiohttp.ClientTimeout(total=remaining)
+                ) as response:
+                    text = await response.text()
+                    data = None
+                    if response.content_type == 'application/json':
+                        data = await response.json()
+                self._latencies.append(time.perf_counter() - started)
+
+                if response.status < 500:
+                    self.breaker.record_success()
+                    return WebResponse(response.status, data, text)
+                last_error = f"HTTP {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                # ValueError: 깨진 JSON/인코딩 등 응답 해석 실패도 실패로 센다
+                last_error = repr(e)
+
+            self.failures += 1
+            if attempt < self.retries:
+                # 지수 백오프 + 전체 지터 (동시에 실패한 요청들이 같이 몰리지 않게)
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                await asyncio.sleep(min(delay, max(0, deadline - loop.time())))
+
+        self.breaker.record_failure()
+        raise WebServerUnavailable(f"{method} {path} 실패: {last_error or '시간 초과'}")
+
+    async def post_json(self, path: str, data: Any, timeout: Optional[float] = None) -> WebResponse:
+        return await self.request('POST', path, json=data, timeout=timeout)
+
+    async def get_json(self, path: str, timeout: Optional[float] = None) -> WebResponse:
+        return await self.request('GET', path, timeout=timeout)
+
+    def stats(self):
+        """요청 수, 실패 수, 최근 지연 시간(ms) 통계, 회로 상태"""
+        latencies = sorted(self._latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 1)
+
+        return {
+            'requests': self.requests,
+            'failures': self.failures,
+            'latency_ms': {'p50': percentile(0.5), 'p95': percentile(0.95), 'max': percentile(1.0)},
+            'circuit': self.breaker.state
+        }
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+web_client = WebClient()
@@ -14,7 +14,7 @@ class GameStartView(View):
         self.participants = participants
         self.send_to_web_server = send_to_web_server_func  # 웹서버 전송 함수
 
-    @discord.ui.button(label="🦋 나비 내전 시작", style=discord.ButtonStyle.green)
+    @discord.ui.button(label="🦋 나비 내전 시작", style=discord.ButtonStyle.green, custom_id='nabi:recruit:start')
     async def start_game(self, interaction: discord.Interaction, button: Button):
         if interaction.user != self.host and not interaction.user.guild_permissions.administrator:
             await interaction.response.send_message("내전 시작은 주최자만 할 수 있습니다!", ephemeral=True)
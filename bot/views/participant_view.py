@@ -4,49 +4,103 @@ import asyncio
 import discord
 from discord.ui import Button, View
 from shared.constants import MAX_PARTICIPANTS, RANDOM_MESSAGES
-from bot.utils.nickname_parser import get_tier_sort_key
+from bot.utils.member_cache import member_cache
+from bot.utils.participant_list import ParticipantList
 from bot.views.game_start_view import GameStartView
-import requests
+from bot.utils.web_client import WebServerUnavailable
+from bot.utils.web_bridge import create_web_session
+from bot.utils.message_coalescer import coalescer_for
+from bot.utils.recruitment_store import recruitment_store
 import uuid
 from datetime import datetime
 
+# 연속 클릭을 모아 임베드를 한 번만 수정하는 간격 (초)
+EMBED_UPDATE_DELAY = 1.0
+
+# 모집 메시지 id -> 연결된 뷰 (만료/종료 때 stop()으로 해제)
+active_views = {}
+
 class ParticipantView(View):
+    """모집 버튼 - 상태를 recruitment_store에 저장하고 재시작 후 같은 custom_id로 다시 연결된다"""
     def __init__(self, thread, embed_message, host, title, format_user_info_func):
         super().__init__(timeout=None)
-        self.participants = []
+        self.participants = ParticipantList(self.tier_key)
         self.waitlist = []
         self.thread = thread
+        self.activity = coalescer_for(thread)  # 참가/취소 알림은 묶어서 전송
         self.embed_message = embed_message
         self.host = host
         self.game_started = False
         self.title = title
         self.format_user_info = format_user_info_func  # 유저 정보 포맷팅 함수
+        self.start_message_id = None  # 시작 확인 메시지 (GameStartView)
+        self._embed_task = None
+        self._embed_dirty = False
+        active_views[self.recruit_id] = self
+
+    @property
+    def recruit_id(self):
+        return str(self.embed_message.id)
+
+    def to_state(self):
+        return {
+            'channel_id': self.embed_message.channel.id,
+            'thread_id': self.thread.id,
+            'host_id': self.host.id,
+            'title': self.title,
+            'participants': list(self.participants),
+            'waitlist': self.waitlist,
+            'game_started': self.game_started,
+            'start_message_id': self.start_message_id
+        }
+
+    @classmethod
+    def from_state(cls, thread, embed_message, host, state, format_user_info_func):
+        view = cls(thread, embed_message, host, state['title'], format_user_info_func)
+        for user_id in state['participants']:
+            view.participants.add(user_id)
+        view.waitlist = state['waitlist']
+        view.game_started = state['game_started']
+        view.start_message_id = state['start_message_id']
+        return view
 
-    def sort_participants(self):
-        def tier_key(user_id):
-            try:
-                for member in self.embed_message.guild.members:
-                    if member.id == user_id:
-                        return get_tier_sort_key(member.display_name)
-            except:
-                pass
-            return float('inf')
-        self.participants.sort(key=tier_key)
+    def save(self):
+        recruitment_store.save(self.recruit_id, 'participant', self.embed_message.id, self.to_state())
+
+    def finish(self):
+        """모집 종료 - 저장된 상태 삭제, 버튼 뷰 해제"""
+        recruitment_store.delete(self.recruit_id)
+        active_views.pop(self.recruit_id, None)
+        self.stop()
+
+    def start_view(self):
+        """시작 확인 버튼 뷰"""
+        return GameStartView(
+            self.thread, 
+            self.host, 
+            self.embed_message, 
+            self.title, 
+            list(self.participants),
+            self.send_to_web_server  # 웹서버 전송 함수 전달
+        )
+
+    def tier_key(self, user_id):
+        """티어 정렬 키 (멤버 캐시 조회)"""
+        return member_cache.get(self.embed_message.guild, user_id).sort_key
 
     async def send_to_web_server(self):
         """웹서버로 세션 데이터 전송"""
         try:
             session_id = str(uuid.uuid4())[:8]
             
-            # 참가자 정보 수집
+            # 참가자 정보 수집 (캐시에 없는 멤버만 동시에 조회)
+            user_ids = list(self.participants)
+            members = await member_cache.resolve_members(self.embed_message.guild, user_ids)
             participants_data = []
-            for user_id in self.participants:
-                try:
-                    member = await self.embed_message.guild.fetch_member(user_id)
-                    user_info = self.format_user_info(member)
-                    participants_data.append(user_info)
-                except Exception as e:
-                    print(f"유저 정보 가져오기 실패 (ID: {user_id}): {e}")
+            for user_id, member in zip(user_ids, members):
+                if member is not None:
+                    participants_data.append(self.format_user_info(member))
+                else:
                     # 실패한 경우 기본 정보로 대체
                     participants_data.append({
                         'discord_id': str(user_id),
@@ -67,15 +121,8 @@ class ParticipantView(View):
                 'title': self.title
             }
             
-            # 웹서버로 POST 요청
-            response = requests.post(
-                'http://localhost:5000/api/session/create',
-                json=session_data,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
+            # 웹서버에 세션 생성 (이벤트 버스, 끊겨 있으면 HTTP)
+            if await create_web_session(session_data):
                 # 밴픽 페이지 링크 전송
                 embed = discord.Embed(
                     title="🦋 밴픽 페이지가 생성되었습니다!",
@@ -98,17 +145,18 @@ class ParticipantView(View):
                     inline=True
                 )
                 
-                await self.thread.send(embed=embed)
+                await self.activity.send_now(embed=embed)
+                self.finish()
                 return True
             else:
-                await self.thread.send(f"❌ 웹서버 연결 실패: {response.text}")
+                await self.activity.send_now("❌ 웹서버 세션 생성에 실패했습니다.")
                 return False
                 
-        except requests.exceptions.RequestException:
-            await self.thread.send("❌ 웹서버에 연결할 수 없습니다. 웹서버가 실행 중인지 확인해주세요.")
+        except WebServerUnavailable:
+            await self.activity.send_now("❌ 웹서버에 연결할 수 없습니다. 웹서버가 실행 중인지 확인해주세요.")
             return False
         except Exception as e:
-            await self.thread.send(f"❌ 세션 생성 중 오류 발생: {str(e)}")
+            await self.activity.send_now(f"❌ 세션 생성 중 오류 발생: {str(e)}")
             return False
 
     async def check_full(self):
@@ -123,94 +171,105 @@ class ParticipantView(View):
             )
             embed.set_footer(text="🦋 내전을 시작하려면 아래 버튼을 눌러주세요.")
 
-            view = GameStartView(
-                self.thread, 
-                self.host, 
-                self.embed_message, 
-                self.title, 
-                self.participants,
-                self.send_to_web_server  # 웹서버 전송 함수 전달
-            )
-            await self.thread.send(embed=embed, view=view)
+            message = await self.activity.send_now(embed=embed, view=self.start_view())
+            self.start_message_id = message.id
+            self.save()
 
-    @discord.ui.button(label="참가하기", style=discord.ButtonStyle.green)
+    @discord.ui.button(label="참가하기", style=discord.ButtonStyle.green, custom_id='nabi:recruit:join')
     async def join(self, interaction: discord.Interaction, button: Button):
+        # 응답 시간(3초) 안에 바로 확인 응답 - 이후 작업은 그 뒤에 처리
+        await interaction.response.defer()
         user_id = interaction.user.id
+        member_cache.update(interaction.user)
 
         if user_id in self.participants or user_id in self.waitlist:
-            await interaction.response.send_message("이미 참가자 또는 대기자 명단에 있습니다!", ephemeral=True)
+            await interaction.followup.send("이미 참가자 또는 대기자 명단에 있습니다!", ephemeral=True)
             return
 
         if len(self.participants) < MAX_PARTICIPANTS:
-            self.participants.append(user_id)
-            self.sort_participants()
-            await self.update_embed(interaction)
+            self.participants.add(user_id)
+            self.save()
+            self.schedule_embed_update()
             await self.check_full()
         else:
             self.waitlist.append(user_id)
-            await interaction.response.send_message("참가 인원이 가득 찼습니다. 대기자로 추가되었습니다!", ephemeral=True)
-            await self.update_embed(interaction)
+            self.save()
+            self.schedule_embed_update()
+            await interaction.followup.send("참가 인원이 가득 찼습니다. 대기자로 추가되었습니다!", ephemeral=True)
 
-        await self.thread.send(f"🦋 {interaction.user.mention} 님이 나비 내전에 참가했습니다! 🎉")
+        self.activity.add(f"🦋 {interaction.user.mention} 님이 나비 내전에 참가했습니다! 🎉")
 
-    @discord.ui.button(label="참가취소", style=discord.ButtonStyle.red)
+    @discord.ui.button(label="참가취소", style=discord.ButtonStyle.red, custom_id='nabi:recruit:cancel')
     async def cancel(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.defer()
         user_id = interaction.user.id
 
         if user_id in self.participants:
             self.participants.remove(user_id)
             if self.waitlist:
                 next_participant_id = self.waitlist.pop(0)
-                self.participants.append(next_participant_id)
-                self.sort_participants()
-                next_member = await interaction.guild.fetch_member(next_participant_id)
-                next_participant_name = next_member.display_name if next_member else f"알 수 없는 사용자 (ID: {next_participant_id})"
-                await self.thread.send(f"**_🦋 대기자에서 참가자로 이동: {next_participant_name}_**")
-            await self.update_embed(interaction)
-            await self.thread.send(f"**_🦋 참가 취소: {interaction.user.display_name}_**")
+                self.participants.add(next_participant_id)
+                self.schedule_embed_update()
+                [next_member] = await member_cache.resolve(interaction.guild, [next_participant_id])
+                next_participant_name = next_member.display_name or f"알 수 없는 사용자 (ID: {next_participant_id})"
+                self.activity.add(f"**_🦋 대기자에서 참가자로 이동: {next_participant_name}_**")
+            self.save()
+            self.schedule_embed_update()
+            self.activity.add(f"**_🦋 참가 취소: {interaction.user.display_name}_**")
         elif user_id in self.waitlist:
             self.waitlist.remove(user_id)
-            await self.update_embed(interaction)
-            await self.thread.send(f"**_🦋 대기 취소: {interaction.user.display_name}_**")
+            self.save()
+            self.schedule_embed_update()
+            self.activity.add(f"**_🦋 대기 취소: {interaction.user.display_name}_**")
         else:
-            await interaction.response.send_message("참가자나 대기자 명단에 없습니다!", ephemeral=True)
+            await interaction.followup.send("참가자나 대기자 명단에 없습니다!", ephemeral=True)
 
-    @discord.ui.button(emoji="📢", label="", style=discord.ButtonStyle.blurple)
+    @discord.ui.button(emoji="📢", label="", style=discord.ButtonStyle.blurple, custom_id='nabi:recruit:notify')
     async def notify(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.defer()
         remaining_slots = MAX_PARTICIPANTS - len(self.participants)
         random_message = random.choice(RANDOM_MESSAGES).format(remaining_slots)
 
         await interaction.channel.send(f"@everyone {random_message}")
-        await self.thread.send(f"**_🦋 홍보 알림: {interaction.user.display_name}님이 나비 내전 참여를 홍보했습니다!_**")
-        await interaction.response.defer()
+        self.activity.add(f"**_🦋 홍보 알림: {interaction.user.display_name}님이 나비 내전 참여를 홍보했습니다!_**")
 
-    @discord.ui.button(emoji="❌", label="", style=discord.ButtonStyle.gray)
+    @discord.ui.button(emoji="❌", label="", style=discord.ButtonStyle.gray, custom_id='nabi:recruit:delete')
     async def delete_message(self, interaction: discord.Interaction, button: Button):
         if interaction.user == self.host or interaction.user.guild_permissions.administrator:
+            self.finish()
             await self.embed_message.delete()
         else:
             await interaction.response.send_message("이 버튼은 주최자 또는 관리자만 사용할 수 있습니다.", ephemeral=True)
 
-    async def update_embed(self, interaction):
+    def schedule_embed_update(self):
+        """임베드 수정 예약 - EMBED_UPDATE_DELAY 동안의 변경을 모아 한 번만 수정"""
+        self._embed_dirty = True
+        if self._embed_task is None or self._embed_task.done():
+            self._embed_task = asyncio.create_task(self._flush_embed())
+
+    async def _flush_embed(self):
+        # 수정 중에 들어온 변경은 다음 간격에 한 번 더 반영
+        while self._embed_dirty:
+            await asyncio.sleep(EMBED_UPDATE_DELAY)
+            self._embed_dirty = False
+            await self.update_embed()
+
+    async def update_embed(self):
         try:
             embed = self.embed_message.embeds[0]
+            guild = self.embed_message.guild
             remaining_slots = MAX_PARTICIPANTS - len(self.participants)
             
-            participant_list = []
-            for user_id in self.participants:
-                try:
-                    member = await interaction.guild.fetch_member(user_id)
-                    participant_list.append(f"🦋 {member.display_name}")
-                except:
-                    participant_list.append(f"🦋 알 수 없는 사용자 (ID: {user_id})")
+            # 캐시에 없던 멤버를 한 번에 조회하고, 새로 알게 된 티어로 순서 보정
+            await member_cache.resolve(guild, list(self.participants) + self.waitlist)
+            for user_id in list(self.participants):
+                self.participants.refresh(user_id)
+            
+            def label(user_id):
+                return member_cache.display_name(guild, user_id) or f"알 수 없는 사용자 (ID: {user_id})"
             
-            waitlist_list = []
-            for user_id in self.waitlist:
-                try:
-                    member = await interaction.guild.fetch_member(user_id)
-                    waitlist_list.append(f"⏳ {member.display_name}")
-                except:
-                    waitlist_list.append(f"⏳ 알 수 없는 사용자 (ID: {user_id})")
+            participant_list = [f"🦋 {label(user_id)}" for user_id in self.participants]
+            waitlist_list = [f"⏳ {label(user_id)}" for user_id in self.waitlist]
             
             embed.description = (
                 f"**🦋 남은 자리: {remaining_slots}명**\n\n"
@@ -220,10 +279,5 @@ class ParticipantView(View):
                 ("\n".join(waitlist_list) if waitlist_list else "없음")
             )
             await self.embed_message.edit(embed=embed, view=self)
-            await interaction.response.defer()
         except Exception as e:
             print(f"업데이트 중 오류 발생: {str(e)}")
-            try:
-                await interaction.response.defer()
-            except:
-                pass
@@ -14,6 +14,7 @@ class Player(Base):
     nickname = Column(String(100), nullable=False)
     current_tier = Column(String(20), nullable=True)
     highest_tier = Column(String(20), nullable=True)
+    rating = Column(Float, default=1000.0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_game_at = Column(DateTime, nullable=True)
@@ -25,6 +26,7 @@ class Player(Base):
         Index('idx_discord_id', 'discord_id'),
         Index('idx_nickname', 'nickname'),
         Index('idx_current_tier', 'current_tier'),
+        Index('idx_rating', 'rating'),
         Index('idx_last_game_at', 'last_game_at'),
     )
 
@@ -1,65 +1,314 @@
-"""나비 내전 시스템 전체 실행 스크립트"""
+"""나비 내전 시스템 전체 실행 스크립트
+
+1. 챔피언 데이터: name.csv가 마지막 로드 이후 바뀌었을 때만 로더 실행
+2. 봇과 웹서버를 동시에 시작
+3. 실제 준비 상태를 확인 (웹: /healthz 응답, 봇: on_ready 준비 파일)
+단계별 소요 시간을 출력한다.
+
+감독 모드 (--supervise, --workers N):
+- 웹 워커 N개(FLASK_PORT, FLASK_PORT+1, ...) + 봇을 실행하고 앞단 프록시가 분산한다
+- 비정상 종료된 프로세스는 백오프(1, 2, 4 ... 30초) 후 재시작
+- SIGTERM/Ctrl+C: 모든 자식에 SIGTERM 전달 (웹 워커는 진행 중인 이벤트를 마치고 세션 저장)
+- SIGHUP: 웹 워커부터 하나씩 순차 재시작 (새 워커가 준비된 뒤 다음 워커로)
+"""
+import argparse
+import signal
 import subprocess
 import sys
 import time
 import os
-from multiprocessing import Process
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent
+sys.path.insert(0, str(project_root))
+
+from shared.config import Config
+from shared.champion_catalog import champion_source_hash, last_loaded_hash
+from shared.readiness import clear_ready, is_ready
+
+PROBE_INTERVAL = 0.2
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+STABLE_AFTER = 60.0  # 이만큼 살아 있었으면 백오프 초기화
+
+timings = []
+
+@contextmanager
+def phase(name):
+    """단계별 소요 시간 기록"""
+    started = time.monotonic()
+    yield
+    elapsed = time.monotonic() - started
+    timings.append((name, elapsed))
+    print(f"⏱️ {name}: {elapsed:.2f}초")
+
+def web_probe(port):
+    """웹서버 /healthz 응답 확인"""
+    def probe(service):
+        url = f"http://127.0.0.1:{port}/healthz"
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                return response.status == 200
+        except OSError:
+            return False
+    return probe
+
+def bot_is_ready(service):
+    """봇이 게이트웨이 READY 후 준비 파일을 썼는지 확인"""
+    return is_ready(service.process.pid)
+
+class Service:
+    def __init__(self, name, script, probe, env=None):
+        self.name = name
+        self.script = script
+        self.probe = probe
+        self.env = env or {}
+        self.process = None
+        self.started_at = None
+        self.ready_at = None
+        self.failures = 0
+        self.restart_at = None
+
+    def start(self):
+        print(f"🦋 {self.name} 시작...")
+        self.started_at = time.monotonic()
+        self.ready_at = None
+        # 새 세션으로 실행 - Ctrl+C가 자식에 직접 가지 않고 실행기가 SIGTERM으로 전달한다
+        self.process = subprocess.Popen(
+            [sys.executable, self.script],
+            cwd=str(project_root),
+            env=dict(os.environ, **self.env),
+            start_new_session=True
+        )
+
+    def check_ready(self):
+        if self.ready_at is None and self.probe(self):
+            self.ready_at = time.monotonic()
+            timings.append((f"{self.name} 준비", self.ready_at - self.started_at))
+            print(f"✅ {self.name} 준비 완료 ({self.ready_at - self.started_at:.2f}초)")
+        return self.ready_at is not None
+
+    def exited(self):
+        return self.process is not None and self.process.poll() is not None
+
+    def terminate(self):
+        """SIGTERM 전달 (웹 워커는 이벤트를 마무리하고 종료)"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+    def wait_stopped(self, timeout):
+        if self.process is None:
+            return
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            print(f"⚠️ {self.name}가 {timeout:.0f}초 안에 종료되지 않아 강제 종료합니다.")
+            self.process.kill()
+            self.process.wait()
+
+    def stop(self, timeout=None):
+        self.terminate()
+        self.wait_stopped(timeout or Config.SHUTDOWN_TIMEOUT + 5)
+
+    def schedule_restart(self):
+        """비정상 종료 후 재시작 시각 예약 (지수 백오프)"""
+        if time.monotonic() - self.started_at >= STABLE_AFTER:
+            self.failures = 0
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** self.failures)
+        self.failures += 1
+        self.restart_at = time.monotonic() + delay
+        print(f"⚠️ {self.name} 종료 (코드 {self.process.returncode}) - {delay:.0f}초 후 재시작")
+
+def stop_all(services):
+    """모든 서비스에 동시에 SIGTERM을 보내고 종료 대기"""
+    for service in services:
+        service.terminate()
+    for service in services:
+        service.wait_stopped(Config.SHUTDOWN_TIMEOUT + 5)
+
+class Supervisor:
+    """자식 프로세스 감시 - 재시작, 순차 재시작, 정상 종료"""
+
+    def __init__(self, services):
+        self.services = services
+        self.stopping = False
+        self.reload_requested = False
+
+    def _on_stop(self, signum, frame):
+        self.stopping = True
+
+    def _on_reload(self, signum, frame):
+        self.reload_requested = True
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        print(f"👀 감독 모드 실행 중 (PID {os.getpid()}) - SIGHUP: 순차 재시작, SIGTERM: 종료")
+
+        while not self.stopping:
+            if self.reload_requested:
+                self.reload_requested = False
+                self.rolling_restart()
+
+            now = time.monotonic()
+            for service in self.services:
+                if service.restart_at is not None:
+                    if now >= service.restart_at:
+                        service.restart_at = None
+                        service.start()
+                elif service.exited():
+                    service.schedule_restart()
+                else:
+                    service.check_ready()
+            time.sleep(0.5)
+
+        print("\n🦋 나비 내전 시스템을 종료합니다...")
+        stop_all(self.services)
 
-def run_bot():
-    """디스코드 봇 실행"""
-    print("🦋 나비 내전 디스코드 봇 시작...")
-    os.system("python bot/main.py")
+    def rolling_restart(self):
+        """웹 워커부터 하나씩 재시작 - 새 프로세스가 준비된 뒤 다음으로 넘어간다"""
+        print("🔄 순차 재시작 시작")
+        ordered = sorted(self.services, key=lambda service: service.script == "bot/main.py")
+        for service in ordered:
+            if self.stopping:
+                return
+            service.stop()
+            service.restart_at = None
+            service.start()
 
-def run_web_server():
-    """웹 서버 실행"""
-    print("🦋 나비 내전 웹 서버 시작...")
-    os.system("python web/app_enhanced.py")
+            deadline = time.monotonic() + Config.STARTUP_TIMEOUT
+            while not self.stopping and not service.check_ready():
+                if service.exited() or time.monotonic() > deadline:
+                    print(f"❌ {service.name} 재시작 실패 - 순차 재시작 중단")
+                    return
+                time.sleep(PROBE_INTERVAL)
+        print("✅ 순차 재시작 완료")
+
+def start_champion_loader():
+    """챔피언 데이터가 바뀌었으면 로더를 백그라운드로 실행 (아니면 None)
+
+    로더는 한 트랜잭션으로 반영하고 카탈로그 버전을 올리므로
+    웹서버가 먼저 떠 있어도 안전하다.
+    """
+    source_hash = champion_source_hash()
+    if source_hash is not None and source_hash == last_loaded_hash():
+        print("⏭️ 챔피언 데이터 변경 없음 - 로드 생략")
+        return None
+
+    print("🦋 챔피언 데이터 로딩...")
+    loader = subprocess.Popen([sys.executable, "scripts/load_champions.py"], cwd=str(project_root))
+    loader.started_at = time.monotonic()
+    return loader
+
+def wait_until_ready(services, loader, timeout):
+    """모든 서비스가 준비되고 로더가 끝날 때까지 대기 - 실패하면 False"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for service in services:
+            if service.exited():
+                print(f"❌ {service.name}가 시작 중에 종료되었습니다 (코드 {service.process.returncode})")
+                return False
+            service.check_ready()
+
+        if loader is not None and loader.poll() is not None:
+            timings.append(("챔피언 데이터 로드", time.monotonic() - loader.started_at))
+            if loader.returncode != 0:
+                print("⚠️ 챔피언 데이터 로드 실패 - 기존 데이터로 계속 실행합니다.")
+            loader = None
+
+        if loader is None and all(service.ready_at is not None for service in services):
+            return True
+        time.sleep(PROBE_INTERVAL)
+
+    waiting = [service.name for service in services if service.ready_at is None]
+    print(f"❌ 준비 시간 초과 ({timeout:.0f}초): {', '.join(waiting) or '챔피언 데이터 로드'}")
+    return False
+
+def build_services(workers):
+    """봇 + 웹 워커 목록"""
+    services = [Service("디스코드 봇", "bot/main.py", bot_is_ready)]
+
+    env = {}
+    if workers > 1:
+        # 워커끼리 드래프트 상태를 공유해야 하므로 메모리 저장소는 쓸 수 없다
+        if Config.SESSION_STORE == 'memory':
+            print("ℹ️ 웹 워커가 여러 개라 세션 저장소를 sqlite로 사용합니다.")
+            env['SESSION_STORE'] = 'sqlite'
+        if not Config.SOCKETIO_MESSAGE_QUEUE:
+            print("⚠️ SOCKETIO_MESSAGE_QUEUE가 없으면 다른 워커에 접속한 참가자에게 실시간 이벤트가 전달되지 않습니다.")
+
+    for worker in range(workers):
+        port = Config.FLASK_PORT + worker
+        name = "웹 서버" if workers == 1 else f"웹 워커 {worker} (:{port})"
+        worker_env = dict(env, FLASK_PORT=str(port), WEB_WORKER_ID=str(worker))
+        services.append(Service(name, "web/app_enhanced.py", web_probe(port), worker_env))
+    return services
 
 def main():
+    parser = argparse.ArgumentParser(description='나비 내전 시스템 실행')
+    parser.add_argument('--supervise', action='store_true', help='감독 모드 (자동 재시작, 순차 재시작)')
+    parser.add_argument('--workers', type=int, default=Config.WEB_WORKERS, help='웹 워커 수 (2 이상이면 감독 모드)')
+    args = parser.parse_args()
+    supervise = args.supervise or args.workers > 1
+
     print("🦋" + "="*60)
     print("🦋 나비 내전 시스템 통합 실행")
     print("🦋" + "="*60)
-    
+    started = time.monotonic()
+
     # 챔피언 데이터 로드 확인
-    if not os.path.exists("name.csv"):
+    if not os.path.exists(Config.CHAMPION_CSV_PATH):
         print("❌ name.csv 파일이 없습니다. 챔피언 데이터를 먼저 업로드해주세요.")
         return
-    
-    # 챔피언 데이터 로드
-    print("🦋 챔피언 데이터 로딩...")
-    try:
-        subprocess.run([sys.executable, "scripts/load_champions.py"], check=True)
-    except subprocess.CalledProcessError:
-        print("❌ 챔피언 데이터 로드 실패")
-        return
-    
+
+    with phase("챔피언 데이터 확인"):
+        loader = start_champion_loader()
+
+    services = build_services(max(1, args.workers))
+
     print("\n🦋 시스템 시작 중...")
     print("🦋 Ctrl+C로 종료할 수 있습니다.")
     print("🦋" + "="*60)
-    
+
     try:
-        # 봇과 웹서버를 별도 프로세스로 실행
-        bot_process = Process(target=run_bot)
-        web_process = Process(target=run_web_server)
-        
-        bot_process.start()
-        time.sleep(2)  # 봇이 먼저 시작되도록 대기
-        web_process.start()
-        
-        print("🦋 디스코드 봇과 웹 서버가 실행되었습니다!")
+        # 봇과 웹서버를 동시에 시작
+        clear_ready()
+        with phase("프로세스 시작"):
+            for service in services:
+                service.start()
+
+        with phase("준비 대기"):
+            ready = wait_until_ready(services, loader, Config.STARTUP_TIMEOUT)
+
+        if not ready:
+            stop_all(services)
+            sys.exit(1)
+
+        print(f"🦋 디스코드 봇과 웹 서버가 실행되었습니다! (총 {time.monotonic() - started:.2f}초)")
+        for name, elapsed in timings:
+            print(f"   - {name}: {elapsed:.2f}초")
         print("🦋 디스코드에서 !내전1 명령어로 테스트해보세요!")
-        
-        # 프로세스 대기
-        bot_process.join()
-        web_process.join()
-        
+
+        if supervise:
+            Supervisor(services).run()
+            return
+
+        # 둘 중 하나가 종료되면 전체 종료
+        while not any(service.exited() for service in services):
+            time.sleep(1)
+        for service in services:
+            if service.exited():
+                print(f"⚠️ {service.name}가 종료되었습니다 (코드 {service.process.returncode})")
+
     except KeyboardInterrupt:
         print("\n🦋 나비 내전 시스템을 종료합니다...")
-        bot_process.terminate()
-        web_process.terminate()
-        bot_process.join()
-        web_process.join()
-        print("🦋 시스템이 정상적으로 종료되었습니다.")
+    finally:
+        stop_all(services)
+        clear_ready()
+    print("🦋 시스템이 정상적으로 종료되었습니다.")
 
 if __name__ == "__main__":
     main()
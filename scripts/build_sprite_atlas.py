@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+챔피언 초상화 스프라이트 아틀라스 생성 스크립트
+
+로컬 이미지 저장소(import_champion_images.py로 가져온 이미지)의 초상화를
+몇 장의 아틀라스 이미지로 묶고, 영문 이름 -> 위치 매핑을 CSS/JSON으로 만든다.
+챔피언 그리드가 초상화마다 요청을 보내는 대신 아틀라스 몇 장만 받으면 된다.
+
+사용법:
+    python scripts/build_sprite_atlas.py [--tile 96] [--columns 16] [--rows 8] [--force]
+
+평소에는 load_champions.py / import_champion_images.py가 카탈로그 버전을 올릴 때
+자동으로 증분 갱신한다 (shared/sprite_atlas.py). 이 스크립트는 칸 크기를 바꾸거나
+--force로 전체를 다시 그릴 때 쓴다.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from shared.sprite_atlas import Image, build_atlas, DEFAULT_TILE, DEFAULT_COLUMNS, DEFAULT_ROWS
+    print("🦋 모듈 임포트 성공!")
+except ImportError as e:
+    print(f"❌ 모듈 임포트 실패: {e}")
+    sys.exit(1)
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='챔피언 스프라이트 아틀라스 생성')
+    parser.add_argument('--tile', type=int, default=DEFAULT_TILE, help='초상화 한 칸 크기(px)')
+    parser.add_argument('--columns', type=int, default=DEFAULT_COLUMNS, help='시트 가로 칸 수')
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help='시트 최대 세로 칸 수')
+    parser.add_argument('--force', action='store_true', help='배치를 새로 하고 모든 시트 다시 그리기')
+    args = parser.parse_args()
+
+    print("🦋 스프라이트 아틀라스 생성 시작")
+    print("=" * 50)
+
+    if Image is None:
+        print("❌ Pillow가 설치되어 있지 않습니다: pip install Pillow")
+        sys.exit(1)
+
+    if build_atlas(args.tile, args.columns, args.rows, args.force) is None:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
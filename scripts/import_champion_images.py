@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+챔피언 초상화를 로컬 이미지 저장소로 가져오는 스크립트
+
+사용법:
+    python scripts/import_champion_images.py <이미지 폴더 또는 .zip 묶음> [--dry-run]
+
+파일 이름(확장자 제외)을 챔피언 영문 이름과 비교해 매칭한다
+(대소문자/기호 무시, 'Aatrox.png', 'kai_sa.png', ddragon 'MonkeyKing.png' 모두 가능).
+가져온 이미지는 내용 해시 이름으로 저장되고 champions.image_url 이 로컬 경로로 바뀐다.
+"""
+
+import sys
+import csv
+import argparse
+import zipfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from shared.database import Database
+    from shared.champion_catalog import bump_catalog_version
+    from shared.image_store import image_store, champion_key, IMAGE_EXTENSIONS
+    from shared.sprite_atlas import rebuild_atlas
+    print("🦋 모듈 임포트 성공!")
+except ImportError as e:
+    print(f"❌ 모듈 임포트 실패: {e}")
+    sys.exit(1)
+
+# ddragon 파일 이름이 챔피언 이름과 다른 경우
+DDRAGON_ALIASES = {
+    'monkeyking': 'wukong',
+    'nunu': 'nunuwillump',
+    'renata': 'renataglasc',
+}
+
+def iter_source_images(source):
+    """(파일 이름, 확장자, 바이트) - 폴더 또는 zip 묶음"""
+    if source.is_dir():
+        for path in sorted(source.rglob('*')):
+            if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS:
+                yield path.stem, path.suffix.lower(), path.read_bytes()
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as bundle:
+            for info in bundle.infolist():
+                path = Path(info.filename)
+                if not info.is_dir() and path.suffix.lower() in IMAGE_EXTENSIONS:
+                    yield path.stem, path.suffix.lower(), bundle.read(info)
+    else:
+        raise ValueError(f"폴더 또는 zip 파일이 아닙니다: {source}")
+
+def load_champion_names(db):
+    """DB의 챔피언 영문 이름 (비어 있으면 name.csv)"""
+    rows = db.fetch_all("SELECT english_name FROM champions")
+    if rows:
+        return [row['english_name'] for row in rows]
+
+    print("⚠️ DB에 챔피언이 없어 name.csv 기준으로 매칭합니다.")
+    with open(project_root / 'name.csv', 'r', encoding='utf-8-sig') as file:
+        return [row['english_name'] for row in csv.DictReader(file)]
+
+def import_images(source, dry_run=False):
+    db = Database()
+    names_by_key = {champion_key(name): name for name in load_champion_names(db)}
+    manifest = image_store.load_manifest()
+
+    imported = 0
+    unmatched = []
+    updates = []
+    for stem, extension, data in iter_source_images(source):
+        key = champion_key(stem)
+        english_name = names_by_key.get(DDRAGON_ALIASES.get(key, key))
+        if english_name is None:
+            unmatched.append(stem)
+            continue
+
+        if dry_run:
+            print(f"   🔍 {stem}{extension} -> {english_name}")
+            imported += 1
+            continue
+
+        name = image_store.put(data, extension)
+        manifest[english_name] = name
+        updates.append((image_store.url_for(name), english_name))
+        imported += 1
+
+    if updates:
+        # 챔피언마다 자동 커밋하지 않고 한 트랜잭션으로 반영
+        with db.transaction() as cursor:
+            cursor.executemany("UPDATE champions SET image_url = %s WHERE english_name = %s", updates)
+
+    if not dry_run and imported:
+        image_store.save_manifest(manifest)
+        version = bump_catalog_version()
+        print(f"🔖 챔피언 카탈로그 버전 갱신: {version}")
+        rebuild_atlas()
+
+    missing = sorted(set(names_by_key.values()) - set(manifest))
+    print(f"✅ 이미지 {imported}개 가져옴 (저장소: {image_store.root})")
+    if unmatched:
+        print(f"⚠️ 매칭되지 않은 파일 {len(unmatched)}개: {', '.join(unmatched[:10])}")
+    if missing:
+        print(f"⚠️ 이미지가 없는 챔피언 {len(missing)}개: {', '.join(missing[:10])}")
+    return imported > 0
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='챔피언 이미지 가져오기')
+    parser.add_argument('source', type=Path, help='이미지 폴더 또는 zip 묶음')
+    parser.add_argument('--dry-run', action='store_true', help='매칭 결과만 출력')
+    args = parser.parse_args()
+
+    print("🦋 챔피언 이미지 가져오기 시작")
+    print("=" * 50)
+
+    try:
+        success = import_images(args.source, args.dry_run)
+    except (OSError, ValueError) as e:
+        print(f"❌ 이미지 가져오기 실패: {e}")
+        success = False
+
+    if not success:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
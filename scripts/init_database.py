@@ -49,7 +49,7 @@ def create_tables():
             summoner_name VARCHAR(100),
             wins INT DEFAULT 0,
             losses INT DEFAULT 0,
-            rating INT DEFAULT 1000,
+            rating FLOAT NOT NULL DEFAULT 1000,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
             INDEX idx_discord_id (discord_id),
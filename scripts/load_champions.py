@@ -2,11 +2,18 @@
 # -*- coding: utf-8 -*-
 """
 챔피언 데이터를 CSV에서 읽어 데이터베이스에 로드하는 스크립트 (수정된 테이블 구조용)
+
+기존 행과 비교해 바뀐 것만 한 트랜잭션으로 반영한다 (추가/수정은 다중 행 INSERT 한 번,
+삭제는 DELETE 한 번). 입력(CSV + 이미지 설정)이 마지막 로드와 같으면 아무것도 하지 않는다.
+
+사용법:
+    python scripts/load_champions.py [--force]
 """
 
 import sys
 import os
 import csv
+import argparse
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -16,103 +23,139 @@ sys.path.insert(0, str(project_root))
 try:
     from shared.config import Config
     from shared.database import Database
+    from shared.champion_catalog import (
+        bump_catalog_version, champion_source_hash, last_loaded_hash, record_loaded_hash
+    )
+    from shared.image_store import image_store
+    from shared.sprite_atlas import rebuild_atlas
     print("🦋 모듈 임포트 성공!")
 except ImportError as e:
     print(f"❌ 모듈 임포트 실패: {e}")
     print("💡 shared 모듈들이 있는지 확인해주세요.")
     sys.exit(1)
 
-def load_champions_from_csv():
+UPSERT_QUERY = """
+INSERT INTO champions (english_name, korean_name, image_url)
+VALUES (%s, %s, %s)
+ON DUPLICATE KEY UPDATE
+korean_name = VALUES(korean_name),
+image_url = VALUES(image_url)
+"""
+
+def read_csv_rows(csv_path):
+    """CSV 파일 읽기 (한글 인코딩 처리)"""
+    encodings = ['utf-8', 'cp949', 'euc-kr']
+
+    for encoding in encodings:
+        try:
+            with open(csv_path, 'r', encoding=encoding) as file:
+                return list(csv.reader(file))
+        except UnicodeDecodeError:
+            continue
+    return []
+
+def build_desired_rows(data_rows):
+    """CSV 행 -> {영문명: (영문명, 한글명, 이미지 URL)}"""
+    # 로컬 이미지 저장소 (import_champion_images.py로 가져온 이미지)
+    image_manifest = image_store.load_manifest()
+
+    desired = {}
+    for index, row in enumerate(data_rows):
+        # 첫 번째 컬럼을 영어명, 두 번째 컬럼을 한글명으로 가정
+        english_name = row[0].strip() if len(row) > 0 else f"Champion_{index}"
+        korean_name = row[1].strip() if len(row) > 1 else english_name
+        if not english_name:
+            continue
+
+        # 이미지 URL (로컬 이미지 우선, 없으면 Riot Games CDN)
+        image_url = image_store.champion_url(english_name, image_manifest)
+        if image_url is None:
+            champion_key = english_name.lower().replace(' ', '').replace("'", "").replace('.', '')
+            image_url = f"{Config.CHAMPION_IMAGE_CDN}{champion_key.capitalize()}.png"
+
+        desired[english_name] = (english_name, korean_name, image_url)
+    return desired
+
+def load_champions_from_csv(force=False):
     """CSV 파일에서 챔피언 데이터를 읽어 데이터베이스에 저장"""
-    
+
     # CSV 파일 경로 확인
-    csv_path = project_root / 'name.csv'
+    csv_path = Path(Config.CHAMPION_CSV_PATH)
     if not csv_path.exists():
         print(f"❌ CSV 파일을 찾을 수 없습니다: {csv_path}")
         print("💡 name.csv 파일을 프로젝트 루트에 업로드해주세요.")
         return False
-    
+
+    source_hash = champion_source_hash(str(csv_path))
+    if not force and source_hash == last_loaded_hash():
+        print("⏭️ CSV가 마지막 로드 이후 바뀌지 않아 건너뜁니다. (--force로 강제 실행)")
+        return True
+
     try:
         print(f"📁 CSV 파일 로드 중: {csv_path}")
-        
-        # CSV 파일 읽기 (한글 인코딩 처리)
-        champions_data = []
-        encodings = ['utf-8', 'cp949', 'euc-kr']
-        
-        for encoding in encodings:
-            try:
-                with open(csv_path, 'r', encoding=encoding) as file:
-                    reader = csv.reader(file)
-                    champions_data = list(reader)
-                    break
-            except UnicodeDecodeError:
-                continue
-        
+        champions_data = read_csv_rows(csv_path)
+
         if not champions_data:
             print("❌ CSV 파일을 읽을 수 없습니다.")
             return False
-        
+
         # 헤더와 데이터 분리
-        headers = champions_data[0] if champions_data else []
-        data_rows = champions_data[1:] if len(champions_data) > 1 else []
-        
-        print(f"📊 총 {len(data_rows)}개의 챔피언 데이터 발견")
+        headers = champions_data[0]
+        desired = build_desired_rows(champions_data[1:])
+
+        print(f"📊 총 {len(desired)}개의 챔피언 데이터 발견")
         print(f"🔍 컬럼: {headers}")
-        
+
         # 데이터베이스 연결
         db = Database()
-        
-        # 기존 챔피언 데이터 삭제 (선택적)
-        print("🗑️ 기존 챔피언 데이터 정리 중...")
-        db.execute_query("DELETE FROM champions")
-        
-        # 챔피언 데이터 삽입
-        success_count = 0
-        error_count = 0
-        
-        for index, row in enumerate(data_rows):
-            try:
-                # 첫 번째 컬럼을 영어명, 두 번째 컬럼을 한글명으로 가정
-                english_name = row[0].strip() if len(row) > 0 else f"Champion_{index}"
-                korean_name = row[1].strip() if len(row) > 1 else english_name
-                
-                # 이미지 URL (Riot Games CDN 사용)
-                champion_key = english_name.lower().replace(' ', '').replace("'", "").replace('.', '')
-                image_url = f"https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/{champion_key.capitalize()}.png"
-                
-                # 챔피언 데이터 삽입 (수정된 컬럼명 사용)
-                query = """
-                INSERT INTO champions (english_name, korean_name, image_url) 
-                VALUES (%s, %s, %s)
-                ON DUPLICATE KEY UPDATE 
-                korean_name = VALUES(korean_name),
-                image_url = VALUES(image_url)
-                """
-                
-                db.execute_query(query, (english_name, korean_name, image_url))
-                success_count += 1
-                
-            except Exception as e:
-                print(f"❌ 챔피언 데이터 삽입 실패 [{index}]: {e}")
-                error_count += 1
-                continue
-        
+
+        # 한 트랜잭션 안에서 비교 후 반영 - 진행 중인 드래프트에 빈 테이블이 보이지 않는다
+        with db.transaction() as cursor:
+            cursor.execute("SELECT english_name, korean_name, image_url FROM champions FOR UPDATE")
+            existing = {
+                row['english_name']: (row['english_name'], row['korean_name'], row['image_url'])
+                for row in cursor.fetchall()
+            }
+
+            upserts = [row for name, row in desired.items() if existing.get(name) != row]
+            deletes = [name for name in existing if name not in desired]
+            inserted = sum(1 for row in upserts if row[0] not in existing)
+
+            if upserts:
+                cursor.executemany(UPSERT_QUERY, upserts)
+            if deletes:
+                placeholders = ', '.join(['%s'] * len(deletes))
+                cursor.execute(f"DELETE FROM champions WHERE english_name IN ({placeholders})", deletes)
+
         print(f"✅ 챔피언 데이터 로드 완료!")
-        print(f"   - 성공: {success_count}개")
-        print(f"   - 실패: {error_count}개")
-        
-        return success_count > 0
-        
+        print(f"   - 추가: {inserted}개")
+        print(f"   - 수정: {len(upserts) - inserted}개")
+        print(f"   - 삭제: {len(deletes)}개")
+        print(f"   - 변경 없음: {len(desired) - len(upserts)}개")
+
+        # 실행 중인 웹서버의 챔피언 카탈로그 캐시 무효화
+        if upserts or deletes:
+            version = bump_catalog_version()
+            print(f"🔖 챔피언 카탈로그 버전 갱신: {version}")
+            rebuild_atlas()
+
+        record_loaded_hash(source_hash)
+        return len(desired) > 0
+
     except Exception as e:
         print(f"❌ CSV 파일 처리 실패: {e}")
         return False
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='챔피언 데이터 로드')
+    parser.add_argument('--force', action='store_true', help='CSV가 바뀌지 않아도 다시 비교/반영')
+    args = parser.parse_args()
+
     print("🦋 챔피언 데이터 로더 시작 (수정된 구조)")
     print("=" * 50)
-    
-    if load_champions_from_csv():
+
+    if load_champions_from_csv(args.force):
         print("🎉 챔피언 데이터 로드 성공!")
     else:
         print("💥 챔피언 데이터 로드 실패!")
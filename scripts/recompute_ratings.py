@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+플레이어 레이팅 전체 재계산 스크립트
+
+games/game_participants의 결과가 기록된 모든 경기를 순서대로 다시 적용해
+players.rating을 새로 계산한다. K 값을 바꿔 보거나 레이팅을 초기화할 때 사용한다.
+
+사용법:
+    python scripts/recompute_ratings.py [--k 32] [--dry-run]
+
+players 테이블에 rating 컬럼이 없으면 먼저 추가하고, 예전 INT 컬럼이면 FLOAT으로 바꾼다
+(INT 컬럼은 Elo 변화량의 소수점을 버려서 경기마다 오차가 쌓인다).
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from shared.database import Database
+    from shared.rating import INITIAL_RATING, K_FACTOR, recompute_all_ratings
+    print("🦋 모듈 임포트 성공!")
+except ImportError as e:
+    print(f"❌ 모듈 임포트 실패: {e}")
+    sys.exit(1)
+
+def ensure_rating_column(db):
+    """예전 스키마로 만든 players 테이블에 FLOAT rating 컬럼 추가 (INT면 변환)"""
+    column = db.fetch_one(
+        "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'players' AND COLUMN_NAME = 'rating'"
+    )
+    if column is None:
+        print("🔧 players.rating 컬럼 추가 중...")
+        db.execute_query(f"ALTER TABLE players ADD COLUMN rating FLOAT NOT NULL DEFAULT {INITIAL_RATING}")
+        db.execute_query("ALTER TABLE players ADD INDEX idx_rating (rating)")
+    elif column['DATA_TYPE'].lower() not in ('float', 'double'):
+        print(f"🔧 players.rating 컬럼 {column['DATA_TYPE']} -> FLOAT 변환 중...")
+        db.execute_query(f"ALTER TABLE players MODIFY COLUMN rating FLOAT NOT NULL DEFAULT {INITIAL_RATING}")
+
+def main():
+    parser = argparse.ArgumentParser(description="플레이어 레이팅 전체 재계산")
+    parser.add_argument('--k', type=float, default=K_FACTOR, help=f"K 값 (기본 {K_FACTOR:g})")
+    parser.add_argument('--dry-run', action='store_true', help="DB에 쓰지 않고 결과만 출력")
+    args = parser.parse_args()
+    
+    db = Database()
+    if not db.connect():
+        sys.exit(1)
+    if not args.dry_run:
+        ensure_rating_column(db)
+    
+    started = time.perf_counter()
+    ratings = recompute_all_ratings(db, k=args.k, dry_run=args.dry_run)
+    elapsed = time.perf_counter() - started
+    
+    print(f"✅ {len(ratings)}명 레이팅 재계산 완료 ({elapsed:.2f}초)")
+    for player_id, rating in sorted(ratings.items(), key=lambda item: -item[1])[:10]:
+        print(f"   #{player_id}: {rating:.0f}")
+    if args.dry_run:
+        print("ℹ️ --dry-run: DB는 변경하지 않았습니다.")
+
+if __name__ == "__main__":
+    main()
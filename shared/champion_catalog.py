@@ -0,0 +1,183 @@
+"""챔피언 카탈로그 프로세스 캐시
+
+champions 테이블은 scripts/load_champions.py 실행 시에만 바뀌므로
+프로세스당 한 번만 읽어 불변 스냅샷으로 보관한다.
+로더가 버전 스탬프 파일을 갱신하면 다음 조회 때 다시 읽는다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Tuple
+
+from .config import Config
+from .database import Database
+from .image_store import image_store
+
+# 데이터베이스 연결 실패 시 사용할 더미 챔피언
+FALLBACK_CHAMPIONS = [
+    {
+        'id': 1,
+        'english_name': 'Aatrox',
+        'korean_name': '아트록스',
+        'image_url': f'{Config.CHAMPION_IMAGE_CDN}Aatrox.png'
+    },
+    {
+        'id': 2,
+        'english_name': 'Ahri',
+        'korean_name': '아리',
+        'image_url': f'{Config.CHAMPION_IMAGE_CDN}Ahri.png'
+    }
+]
+
+CATALOG_QUERY = "SELECT id, english_name, korean_name, image_url FROM champions ORDER BY english_name"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """한 시점의 챔피언 카탈로그 (불변)"""
+    stamp: Optional[Tuple[int, int]]
+    champions: Tuple[MappingProxyType, ...]
+    by_name: MappingProxyType
+    champions_json: bytes
+    etag: str
+    loaded_at: float
+    fallback: bool = False
+
+
+class ChampionCatalog:
+    def __init__(self, stamp_path: Optional[str] = None, retry_interval: float = 30.0):
+        self.stamp_path = stamp_path or Config.CHAMPION_CATALOG_STAMP
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    def _read_stamp(self) -> Optional[Tuple[int, int]]:
+        """버전 스탬프 파일의 (inode, mtime) - 로더가 os.replace로 갱신하면 바뀐다"""
+        try:
+            st = os.stat(self.stamp_path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns)
+
+    def _is_fresh(self, snapshot: Optional[CatalogSnapshot], stamp) -> bool:
+        if snapshot is None or snapshot.stamp != stamp:
+            return False
+        if snapshot.fallback:
+            return time.monotonic() - snapshot.loaded_at < self.retry_interval
+        return True
+
+    def get(self) -> CatalogSnapshot:
+        """현재 카탈로그 스냅샷 반환 (필요할 때만 DB 조회)"""
+        stamp = self._read_stamp()
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot, stamp):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot, stamp):
+                return snapshot
+            self._snapshot = self._load(stamp)
+            return self._snapshot
+
+    def invalidate(self):
+        """다음 조회 시 강제로 다시 읽기"""
+        with self._lock:
+            self._snapshot = None
+
+    @property
+    def version(self) -> Optional[str]:
+        """마지막으로 로드된 카탈로그의 ETag (로드 전이면 None)"""
+        snapshot = self._snapshot
+        return snapshot.etag if snapshot else None
+
+    def _load(self, stamp) -> CatalogSnapshot:
+        rows = []
+        try:
+            db = Database()
+            try:
+                rows = db.fetch_all(CATALOG_QUERY)
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"❌ 챔피언 카탈로그 로드 실패: {e}")
+
+        fallback = not rows
+        if fallback:
+            print("⚠️ 챔피언 카탈로그가 비어 있어 더미 데이터를 사용합니다.")
+            rows = FALLBACK_CHAMPIONS
+        else:
+            print(f"✅ 챔피언 카탈로그 로드: {len(rows)}개")
+
+        champions = tuple(MappingProxyType(dict(row)) for row in rows)
+        champions_json = json.dumps(
+            [dict(champ) for champ in champions],
+            ensure_ascii=False,
+            separators=(',', ':')
+        ).encode('utf-8')
+        etag = hashlib.sha1(champions_json).hexdigest()[:16]
+
+        return CatalogSnapshot(
+            stamp=stamp,
+            champions=champions,
+            by_name=MappingProxyType({champ['english_name']: champ for champ in champions}),
+            champions_json=champions_json,
+            etag=etag,
+            loaded_at=time.monotonic(),
+            fallback=fallback
+        )
+
+
+def bump_catalog_version(stamp_path: Optional[str] = None) -> str:
+    """카탈로그 버전 스탬프 갱신 - 챔피언 데이터를 바꾼 뒤 호출"""
+    path = stamp_path or Config.CHAMPION_CATALOG_STAMP
+    version = str(time.time_ns())
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(tmp_path, path)
+    return version
+
+
+def champion_source_hash(csv_path: Optional[str] = None) -> Optional[str]:
+    """챔피언 로드 입력 해시 - CSV 내용 + 이미지 URL을 결정하는 설정/매니페스트
+
+    CSV가 없으면 None.
+    """
+    try:
+        with open(csv_path or Config.CHAMPION_CSV_PATH, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    digest = hashlib.sha256(data)
+    digest.update(Config.CHAMPION_IMAGE_CDN.encode('utf-8'))
+    digest.update(json.dumps(image_store.load_manifest(), sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def last_loaded_hash(stamp_path: Optional[str] = None) -> Optional[str]:
+    """마지막으로 성공한 챔피언 로드의 입력 해시"""
+    try:
+        with open(stamp_path or Config.CHAMPION_LOAD_STAMP, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def record_loaded_hash(source_hash: str, stamp_path: Optional[str] = None) -> None:
+    path = stamp_path or Config.CHAMPION_LOAD_STAMP
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(source_hash)
+    os.replace(tmp_path, path)
+
+
+champion_catalog = ChampionCatalog()
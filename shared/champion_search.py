@@ -0,0 +1,153 @@
+"""챔피언 이름 검색 인덱스
+
+챔피언 카탈로그 스냅샷으로 프로세스 메모리에 인덱스를 만든다.
+- 접두어 테이블: 이름의 모든 접두어 -> 챔피언 (트라이를 해시 테이블로 펼친 것)
+- n-gram 색인: 1/2글자 조각 -> 챔피언, 중간 일치 후보를 좁힐 때 사용
+- 초성 키: '아트록스' -> 'ㅇㅌㄹㅅ' 를 같은 구조로 색인해 'ㅇㅌㄹ' 검색 지원
+
+키는 소문자로 바꾸고 공백/기호를 뺀 형태다 ("Kai'Sa" -> 'kaisa').
+카탈로그 ETag가 바뀌면 다음 검색 때 인덱스를 다시 만든다.
+"""
+import threading
+from typing import List, Optional
+
+from .champion_catalog import champion_catalog, ChampionCatalog
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21 * 28
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+# 일치 종류별 순위 (작을수록 앞)
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_INITIALS = 2
+RANK_SUBSTRING = 3
+
+
+def normalize(text: str) -> str:
+    """검색 키 정규화 - 소문자, 글자/숫자만 남김"""
+    return ''.join(ch for ch in text.lower() if ch.isalnum())
+
+
+def hangul_initials(text: str) -> str:
+    """한글 음절을 초성으로 변환 ('아트록스' -> 'ㅇㅌㄹㅅ'), 그 외 글자는 그대로"""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSEONG[(code - HANGUL_BASE) // JUNGSEONG_COUNT])
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def is_initials_query(query: str) -> bool:
+    return bool(query) and all(ch in CHOSEONG_SET for ch in query)
+
+
+class ChampionSearchIndex:
+    """한 카탈로그 스냅샷에 대한 불변 검색 인덱스"""
+
+    def __init__(self, champions, ngram: int = 2):
+        self.champions = tuple(champions)
+        self.ngram = ngram
+        self._names = []       # 챔피언별 이름 키 (영문, 한글)
+        self._initials = []    # 챔피언별 초성 키
+        self._name_prefix = {}
+        self._initials_prefix = {}
+        self._name_grams = {}
+        self._initials_grams = {}
+
+        for index, champ in enumerate(self.champions):
+            names = tuple(key for key in (normalize(champ['english_name']), normalize(champ['korean_name'])) if key)
+            initials = hangul_initials(normalize(champ['korean_name']))
+            self._names.append(names)
+            self._initials.append(initials)
+
+            for key in names:
+                self._add_key(key, index, self._name_prefix, self._name_grams)
+            if initials:
+                self._add_key(initials, index, self._initials_prefix, self._initials_grams)
+
+    def _add_key(self, key, index, prefixes, grams):
+        for end in range(1, len(key) + 1):
+            prefixes.setdefault(key[:end], set()).add(index)
+        for size in range(1, self.ngram + 1):
+            for start in range(len(key) - size + 1):
+                grams.setdefault(key[start:start + size], set()).add(index)
+
+    def _candidates(self, query, grams):
+        """n-gram 교집합으로 중간 일치 후보 추리기"""
+        size = min(self.ngram, len(query))
+        candidates = None
+        for start in range(len(query) - size + 1):
+            posting = grams.get(query[start:start + size])
+            if not posting:
+                return set()
+            candidates = set(posting) if candidates is None else candidates & posting
+        return candidates or set()
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[dict]:
+        """이름/초성 검색 - 정확히 일치 > 접두어 > 초성 > 중간 일치 순"""
+        if is_initials_query(query.strip()):
+            return self._search_keys(query.strip(), self._initials_prefix, self._initials_grams,
+                                     lambda index: (self._initials[index],), RANK_INITIALS, limit)
+
+        key = normalize(query)
+        if not key:
+            return []
+        return self._search_keys(key, self._name_prefix, self._name_grams,
+                                 lambda index: self._names[index], RANK_PREFIX, limit)
+
+    def _search_keys(self, key, prefixes, grams, keys_of, prefix_rank, limit):
+        ranked = {}
+        for index in prefixes.get(key, ()):
+            exact = key in keys_of(index)
+            ranked[index] = (RANK_EXACT if exact else prefix_rank, 0)
+
+        for index in self._candidates(key, grams):
+            if index in ranked:
+                continue
+            positions = [name.find(key) for name in keys_of(index)]
+            positions = [pos for pos in positions if pos >= 0]
+            if positions:
+                ranked[index] = (RANK_SUBSTRING, min(positions))
+
+        order = sorted(
+            ranked,
+            key=lambda index: ranked[index] + (len(self.champions[index]['korean_name']),
+                                               self.champions[index]['korean_name'])
+        )
+        if limit:
+            order = order[:limit]
+        return [self.champions[index] for index in order]
+
+
+class ChampionSearch:
+    """카탈로그 버전을 따라가는 검색 인덱스"""
+
+    def __init__(self, catalog: ChampionCatalog):
+        self.catalog = catalog
+        self._lock = threading.Lock()
+        self._etag = None
+        self._index: Optional[ChampionSearchIndex] = None
+
+    def index(self) -> ChampionSearchIndex:
+        snapshot = self.catalog.get()
+        if self._index is not None and self._etag == snapshot.etag:
+            return self._index
+
+        with self._lock:
+            if self._index is None or self._etag != snapshot.etag:
+                self._index = ChampionSearchIndex(snapshot.champions)
+                self._etag = snapshot.etag
+                print(f"🔎 챔피언 검색 인덱스 생성: {len(snapshot.champions)}개")
+            return self._index
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[dict]:
+        return self.index().search(query, limit)
+
+
+champion_search = ChampionSearch(champion_catalog)
@@ -1,9 +1,12 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 # .env 파일 로드
 load_dotenv()
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 class Config:
     # 디스코드 봇 설정
     DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
@@ -14,6 +17,8 @@ class Config:
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
     DB_NAME = os.getenv('DB_NAME', 'lol_tournament')
     DB_PORT = int(os.getenv('DB_PORT', 3306))
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
     
     # Flask 설정
     FLASK_HOST = os.getenv('FLASK_HOST', '0.0.0.0')
@@ -23,8 +28,57 @@ class Config:
     # 세션 설정
     SECRET_KEY = os.getenv('SECRET_KEY', 'nabi-tournament-secret-key')
     
-    # 챔피언 이미지 CDN
-    CHAMPION_IMAGE_CDN = "https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/"
+    # 게임 세션 저장소 (memory: 단일 프로세스, sqlite: 여러 웹 워커 공유)
+    SESSION_STORE = os.getenv('SESSION_STORE', 'memory')
+    SESSION_STORE_PATH = os.getenv('SESSION_STORE_PATH', str(PROJECT_ROOT / 'data' / 'sessions.db'))
+    SESSION_MAX_SESSIONS = int(os.getenv('SESSION_MAX_SESSIONS', 500))
+    SESSION_IDLE_TTL = float(os.getenv('SESSION_IDLE_TTL', 3600))
+    SESSION_SWEEP_INTERVAL = float(os.getenv('SESSION_SWEEP_INTERVAL', 60))
+    SESSION_ARCHIVE = os.getenv('SESSION_ARCHIVE', 'True').lower() == 'true'
+    
+    # 밴픽 턴 제한 시간 (초)
+    DRAFT_TURN_SECONDS = int(os.getenv('DRAFT_TURN_SECONDS', 30))
+    
+    # 챔피언 이미지 CDN (로컬 이미지가 없을 때 사용)
+    DDRAGON_VERSION = os.getenv('DDRAGON_VERSION', '14.1.1')
+    CHAMPION_IMAGE_CDN = f"https://ddragon.leagueoflegends.com/cdn/{DDRAGON_VERSION}/img/champion/"
+    
+    # 로컬 챔피언 이미지 저장소 (scripts/import_champion_images.py가 채움)
+    CHAMPION_IMAGE_DIR = os.getenv('CHAMPION_IMAGE_DIR', str(PROJECT_ROOT / 'data' / 'champion_images'))
+    CHAMPION_IMAGE_URL_PREFIX = '/img/champion/'
+
+    # 챔피언 카탈로그 버전 스탬프 (load_champions.py가 갱신)
+    CHAMPION_CATALOG_STAMP = os.getenv('CHAMPION_CATALOG_STAMP', str(PROJECT_ROOT / '.champion_catalog_version'))
+    
+    # 챔피언 원본 CSV와 마지막으로 로드한 입력 해시 (같으면 load_champions.py가 건너뜀)
+    CHAMPION_CSV_PATH = os.getenv('CHAMPION_CSV_PATH', str(PROJECT_ROOT / 'name.csv'))
+    CHAMPION_LOAD_STAMP = os.getenv('CHAMPION_LOAD_STAMP', str(PROJECT_ROOT / 'data' / 'champions_loaded.sha256'))
+
+    # 실행기(run_nabi_system.py) 준비 확인
+    BOT_READY_FILE = os.getenv('BOT_READY_FILE', str(PROJECT_ROOT / 'data' / 'bot.ready'))
+    STARTUP_TIMEOUT = float(os.getenv('STARTUP_TIMEOUT', 60))
+    
+    # 감독 모드 (run_nabi_system.py --supervise)
+    WEB_WORKERS = int(os.getenv('WEB_WORKERS', 1))
+    SHUTDOWN_TIMEOUT = float(os.getenv('SHUTDOWN_TIMEOUT', 15))
+    SESSION_SNAPSHOT_PATH = os.getenv('SESSION_SNAPSHOT_PATH', str(PROJECT_ROOT / 'data' / 'sessions.snapshot'))
+    
+    # 여러 웹 워커 간 소켓 이벤트 전달 (예: redis://localhost:6379/0, 비우면 사용 안 함)
+    SOCKETIO_MESSAGE_QUEUE = os.getenv('SOCKETIO_MESSAGE_QUEUE') or None
+
+    # 봇 -> 웹서버 내부 API 호출
+    WEB_INTERNAL_URL = os.getenv('WEB_INTERNAL_URL', f"http://127.0.0.1:{FLASK_PORT}")
+    WEB_CLIENT_TIMEOUT = float(os.getenv('WEB_CLIENT_TIMEOUT', 5))
+    WEB_CLIENT_RETRIES = int(os.getenv('WEB_CLIENT_RETRIES', 2))
+
+    # 봇 <-> 웹서버 로컬 이벤트 버스 (유닉스 소켓, 봇이 생성)
+    EVENT_BUS_PATH = os.getenv('EVENT_BUS_PATH', str(PROJECT_ROOT / 'data' / 'event_bus.sock'))
+    EVENT_BUS_REPLY_TIMEOUT = float(os.getenv('EVENT_BUS_REPLY_TIMEOUT', 3))
+
+    # 디스코드 모집 상태 저장소 (봇 재시작 후 모집 메시지 복원, 오래된 모집 정리)
+    RECRUIT_STORE_PATH = os.getenv('RECRUIT_STORE_PATH', str(PROJECT_ROOT / 'data' / 'recruitments.db'))
+    RECRUIT_TTL = float(os.getenv('RECRUIT_TTL', 6 * 3600))
+    RECRUIT_SWEEP_INTERVAL = float(os.getenv('RECRUIT_SWEEP_INTERVAL', 300))
 
     # 서버 호스트 설정
     SERVER_HOST = os.getenv('SERVER_HOST', 'localhost')
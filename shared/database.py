@@ -1,94 +1,326 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
+from mysql.connector.errors import PoolError
 from .config import Config
 
+# 서버와의 연결이 끊겼음을 뜻하는 에러 코드 (이 경우에만 재연결 후 재시도)
+CONNECTION_LOST_ERRORS = {
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED,
+    errorcode.CR_CONNECTION_ERROR,
+    errorcode.CR_CONN_HOST_ERROR,
+}
+
+# 끊긴 뒤 다시 보내도 안전한 읽기 전용 쿼리 (쓰기는 서버에 이미 반영됐을 수 있어 재시도하지 않는다)
+READ_ONLY_PREFIXES = ('SELECT', 'SHOW', 'DESC', 'EXPLAIN')
+
+
+def is_read_only(query):
+    return query.lstrip().upper().startswith(READ_ONLY_PREFIXES)
+
+
+class PoolTimeout(PoolError):
+    """풀에서 연결을 기다리다 시간 초과"""
+
+
+class ConnectionPool:
+    """스레드 안전한 고정 크기 MySQL 연결 풀
+
+    연결 상태 확인(ping)은 매 쿼리마다 하지 않고, 오래 쉬었던 연결을
+    꺼낼 때와 쿼리 중 연결 끊김 에러가 났을 때만 한다.
+    """
+
+    def __init__(self, max_size=10, timeout=10.0, idle_check=300.0, **connect_kwargs):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_check = idle_check
+        self.connect_kwargs = connect_kwargs
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (connection, 반납 시각)
+        self._size = 0
+        self._stats = {
+            'created': 0,
+            'acquired': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'discarded': 0,
+            'reconnects': 0,
+            'in_use': 0,
+            'peak_in_use': 0,
+        }
+
+    def _create(self):
+        connection = mysql.connector.connect(autocommit=True, **self.connect_kwargs)
+        with self._cond:
+            self._stats['created'] += 1
+        print(f"✅ 데이터베이스 연결 성공: {Config.DB_HOST}:{Config.DB_PORT}")
+        return connection
+
+    def acquire(self):
+        """연결 대여 (풀이 가득 차면 timeout 동안 대기)"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        connection = None
+        released_at = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    # 가장 최근에 반납된 연결부터 사용 (LIFO)
+                    connection, released_at = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeout(f"연결 풀 대기 시간 초과 ({self.timeout}초)")
+                self._cond.wait(remaining)
+
+            wait_time = time.monotonic() - started
+            self._stats['acquired'] += 1
+            if waited:
+                self._stats['waits'] += 1
+                self._stats['wait_time_total'] += wait_time
+                self._stats['wait_time_max'] = max(self._stats['wait_time_max'], wait_time)
+            self._stats['in_use'] += 1
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], self._stats['in_use'])
+
+        try:
+            if connection is None:
+                connection = self._create()
+            elif time.monotonic() - released_at > self.idle_check and not self._ping(connection):
+                self._close_quietly(connection)
+                with self._cond:
+                    self._stats['reconnects'] += 1
+                connection = self._create()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._stats['in_use'] -= 1
+                self._cond.notify()
+            raise
+
+        return connection
+
+    def release(self, connection):
+        """연결 반납"""
+        with self._cond:
+            self._idle.append((connection, time.monotonic()))
+            self._stats['in_use'] -= 1
+            self._cond.notify()
+
+    def discard(self, connection):
+        """끊긴 연결 폐기 (풀 자리는 비워 둔다)"""
+        self._close_quietly(connection)
+        with self._cond:
+            self._size -= 1
+            self._stats['in_use'] -= 1
+            self._stats['discarded'] += 1
+            self._cond.notify()
+
+    def stats(self):
+        """풀 사용 현황"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self._size
+            stats['idle'] = len(self._idle)
+            stats['max_size'] = self.max_size
+        stats['wait_time_avg'] = stats['wait_time_total'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
+
+    def close_all(self):
+        """대기 중인 연결 모두 종료"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    @staticmethod
+    def _ping(connection):
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스 공용 연결 풀 (웹서버, 봇, 스크립트 공통)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    max_size=Config.DB_POOL_SIZE,
+                    timeout=Config.DB_POOL_TIMEOUT,
+                    host=Config.DB_HOST,
+                    port=Config.DB_PORT,
+                    user=Config.DB_USER,
+                    password=Config.DB_PASSWORD,
+                    database=Config.DB_NAME,
+                    charset='utf8mb4',
+                    collation='utf8mb4_unicode_ci'
+                )
+    return _pool
+
+
+def get_pool_stats():
+    """연결 풀 통계 (풀이 아직 없으면 None)"""
+    return _pool.stats() if _pool else None
+
+
 class Database:
     def __init__(self):
-        self.connection = None
-        self.connect()
-    
+        self.pool = get_pool()
+
     def connect(self):
-        """데이터베이스 연결"""
+        """데이터베이스 연결 확인 (풀에서 연결 하나를 빌려 본다)"""
         try:
-            self.connection = mysql.connector.connect(
-                host=Config.DB_HOST,
-                port=Config.DB_PORT,
-                user=Config.DB_USER,
-                password=Config.DB_PASSWORD,
-                database=Config.DB_NAME,
-                charset='utf8mb4',
-                collation='utf8mb4_unicode_ci'
-            )
-            if self.connection.is_connected():
-                print(f"✅ 데이터베이스 연결 성공: {Config.DB_HOST}:{Config.DB_PORT}")
-                return True
+            connection = self.pool.acquire()
+            self.pool.release(connection)
+            return True
         except Error as e:
             print(f"❌ 데이터베이스 연결 실패: {e}")
             return False
-    
+
+    def _run(self, work, retry=False):
+        """풀에서 연결을 빌려 work(connection) 실행 - retry면 연결이 끊겼을 때 한 번 재시도"""
+        for attempt in range(2 if retry else 1):
+            connection = self.pool.acquire()
+            try:
+                result = work(connection)
+            except Error as e:
+                if e.errno not in CONNECTION_LOST_ERRORS:
+                    self.pool.release(connection)
+                    raise
+                self.pool.discard(connection)
+                if retry and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                self.pool.discard(connection)
+                raise
+            self.pool.release(connection)
+            return result
+
     def execute_query(self, query, params=None):
         """쿼리 실행"""
+        def work(connection):
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params or ())
+                if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE')):
+                    connection.commit()
+                    return cursor.lastrowid
+                else:
+                    return cursor.fetchall()
+            finally:
+                cursor.close()
+
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
-            
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or ())
-            
-            if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE')):
-                self.connection.commit()
-                return cursor.lastrowid
-            else:
-                return cursor.fetchall()
-                
+            return self._run(work, retry=is_read_only(query))
         except Error as e:
             print(f"❌ 쿼리 실행 실패: {e}")
             print(f"   쿼리: {query}")
             if params:
                 print(f"   파라미터: {params}")
             return None
+
+    @contextmanager
+    def transaction(self):
+        """한 연결에서 여러 쿼리를 하나의 트랜잭션으로 실행
+
+        with db.transaction() as cursor: 블록이 정상 종료되면 커밋, 예외가 나면 롤백한다.
+        연결이 끊기면 재시도하지 않고 예외를 그대로 올린다.
+        """
+        connection = self.pool.acquire()
+        healthy = True
+        try:
+            connection.start_transaction()
+            cursor = connection.cursor(dictionary=True)
+            try:
+                yield cursor
+                connection.commit()
+            except BaseException:
+                try:
+                    connection.rollback()
+                except Error:
+                    healthy = False
+                raise
+            finally:
+                try:
+                    cursor.close()
+                except Error:
+                    healthy = False
+        except Error as e:
+            if e.errno in CONNECTION_LOST_ERRORS:
+                healthy = False
+            raise
         finally:
-            if 'cursor' in locals():
-                cursor.close()
-    
+            if healthy:
+                self.pool.release(connection)
+            else:
+                self.pool.discard(connection)
+
     def fetch_one(self, query, params=None):
         """단일 결과 조회"""
+        def work(connection):
+            cursor = connection.cursor(dictionary=True, buffered=True)
+            try:
+                cursor.execute(query, params or ())
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
-            
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, params or ())
-            result = cursor.fetchone()
-            return result
-            
+            return self._run(work, retry=is_read_only(query))
         except Error as e:
             print(f"❌ 단일 조회 실패: {e}")
             return None
-        finally:
-            if 'cursor' in locals():
-                cursor.close()
-    
+
     def fetch_all(self, query, params=None):
         """전체 결과 조회"""
+        def work(connection):
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params or ())
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
-            
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, params or ())
-            result = cursor.fetchall()
-            return result
-            
+            return self._run(work, retry=is_read_only(query))
         except Error as e:
             print(f"❌ 전체 조회 실패: {e}")
             return []
-        finally:
-            if 'cursor' in locals():
-                cursor.close()
-    
+
     def close(self):
-        """연결 종료"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            print("✅ 데이터베이스 연결 종료")
+        """연결 종료 (풀 연결은 프로세스가 끝날 때까지 재사용)"""
+        pass
@@ -0,0 +1,95 @@
+"""단일 백그라운드 작업으로 돌아가는 마감 시각 스케줄러
+
+모든 진행 중인 드래프트의 턴 마감 시각을 하나의 힙에 넣고, 백그라운드 작업
+하나가 가장 이른 마감만 확인한다. 세션마다 스레드/그린렛을 만들지 않으므로
+수백 개의 드래프트도 같은 비용으로 처리된다.
+
+키(세션 ID)당 유효한 마감은 하나뿐이다. 다시 예약하면 이전 힙 항목은
+토큰이 달라져 꺼낼 때 버려진다 (lazy deletion).
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Hashable, Optional
+
+
+class DeadlineScheduler:
+    def __init__(self, on_expire: Callable[[Hashable, object], None],
+                 sleep: Callable[[float], None] = time.sleep,
+                 spawn: Optional[Callable] = None,
+                 max_sleep: float = 0.25):
+        self.on_expire = on_expire
+        self.sleep = sleep
+        self.spawn = spawn
+        self.max_sleep = max_sleep
+
+        self._lock = threading.Lock()
+        self._heap = []            # (deadline, seq, key, token)
+        self._tokens = {}          # key -> 현재 유효한 (deadline, token)
+        self._seq = itertools.count()
+        self._started = False
+        self._running = False
+        self.fired = 0
+
+    def schedule(self, key, deadline: float, token=None):
+        """key의 마감 시각 예약 (기존 예약은 대체된다)"""
+        with self._lock:
+            if self._tokens.get(key) == (deadline, token):
+                return
+            self._tokens[key] = (deadline, token)
+            heapq.heappush(self._heap, (deadline, next(self._seq), key, token))
+        self._ensure_started()
+
+    def cancel(self, key):
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    def pending(self):
+        """예약된 마감 수"""
+        return len(self._tokens)
+
+    def _ensure_started(self):
+        if self._started or self.spawn is None:
+            return
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        self.spawn(self.run)
+
+    def _pop_expired(self, now):
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, _, key, token = heapq.heappop(self._heap)
+                if self._tokens.get(key) == (deadline, token):
+                    del self._tokens[key]
+                    expired.append((key, token))
+            next_deadline = self._heap[0][0] if self._heap else None
+        return expired, next_deadline
+
+    def run_pending(self, now: Optional[float] = None):
+        """마감이 지난 항목 처리 후 다음 마감 시각 반환"""
+        expired, next_deadline = self._pop_expired(time.time() if now is None else now)
+        for key, token in expired:
+            self.fired += 1
+            try:
+                self.on_expire(key, token)
+            except Exception as e:
+                print(f"❌ 타이머 처리 실패 ({key}): {e}")
+        return next_deadline
+
+    def run(self):
+        """백그라운드 루프"""
+        self._running = True
+        print("⏱️ 드래프트 타이머 시작")
+        while self._running:
+            next_deadline = self.run_pending()
+            delay = self.max_sleep
+            if next_deadline is not None:
+                delay = min(delay, max(0.0, next_deadline - time.time()))
+            self.sleep(delay)
+
+    def stop(self):
+        self._running = False
@@ -0,0 +1,199 @@
+"""서버 권한 밴픽 엔진
+
+DRAFT_PHASES를 모듈 로드 시 한 번 정수 턴 테이블로 컴파일하고,
+사용된 챔피언은 챔피언 id를 비트 위치로 하는 비트셋으로 관리한다.
+비트셋은 JSON/msgpack으로 그대로 저장되도록 32비트 정수 리스트로 둔다.
+모든 검증은 턴 테이블 인덱싱과 비트 연산뿐이라 O(1)이다.
+
+드래프트 상태(game_state['draft'])는 dict이며 엔진 자체는 상태를 갖지 않는다.
+상태 변경은 SessionStore.update_state() 안에서 apply()를 호출해 원자적으로 한다.
+"""
+import random
+from typing import NamedTuple, Optional
+
+from .config import Config
+from .constants import DRAFT_PHASES, POSITIONS, TEAMS
+
+TEAM_NAMES = tuple(team.lower() for team in TEAMS)   # ('blue', 'red')
+ACTION_NAMES = ('ban', 'pick')
+ACTION_BAN = 0
+ACTION_PICK = 1
+WORD_BITS = 32
+
+
+class Turn(NamedTuple):
+    index: int
+    team: int     # TEAM_NAMES 인덱스
+    action: int   # ACTION_BAN / ACTION_PICK
+    slot: int     # 밴: 팀 내 밴 순번, 픽: POSITIONS 인덱스
+    name: str     # 'blue_ban_1' 형식 (currentTurn 값)
+
+    @property
+    def team_name(self):
+        return TEAM_NAMES[self.team]
+
+    @property
+    def action_name(self):
+        return ACTION_NAMES[self.action]
+
+    @property
+    def position(self):
+        return POSITIONS[self.slot] if self.action == ACTION_PICK else None
+
+
+class DraftError(Exception):
+    """허용되지 않는 밴픽 요청"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def compile_turn_table(phases=DRAFT_PHASES):
+    """밴픽 단계 정의를 턴 테이블(튜플)로 컴파일
+
+    픽 순서대로 각 팀의 포지션이 POSITIONS 순으로 채워진다 (1픽 TOP, 2픽 JUG ...).
+    """
+    counters = {(team, action): 0 for team in range(len(TEAM_NAMES)) for action in (ACTION_BAN, ACTION_PICK)}
+    table = []
+    for phase_name, phase in phases.items():
+        action = ACTION_PICK if phase_name.startswith('PICK') else ACTION_BAN
+        for team_name in phase['order']:
+            team = TEAM_NAMES.index(team_name.lower())
+            slot = counters[(team, action)]
+            counters[(team, action)] += 1
+            name = f"{TEAM_NAMES[team]}_{ACTION_NAMES[action]}_{slot + 1}"
+            table.append(Turn(len(table), team, action, slot, name))
+    return tuple(table)
+
+
+class DraftEngine:
+    def __init__(self, phases=DRAFT_PHASES, turn_seconds=30):
+        self.turn_seconds = turn_seconds
+        self.turns = compile_turn_table(phases)
+        self.total_turns = len(self.turns)
+        self._team_index = {name: i for i, name in enumerate(TEAM_NAMES)}
+        self._action_index = {name: i for i, name in enumerate(ACTION_NAMES)}
+
+    def new_draft(self):
+        """초기 드래프트 상태"""
+        return {
+            'bans': {team: [] for team in TEAM_NAMES},
+            'picks': {team: [] for team in TEAM_NAMES},
+            'lineup': {team: {position: None for position in POSITIONS} for team in TEAM_NAMES},
+            'turn': 0,
+            'used': [],
+            'currentTurn': self.turns[0].name,
+            'timer': self.turn_seconds,
+            'deadline': None
+        }
+
+    def current_turn(self, draft) -> Optional[Turn]:
+        """현재 턴 (드래프트가 끝났으면 None)"""
+        index = draft.get('turn', 0)
+        return self.turns[index] if index < self.total_turns else None
+
+    def is_completed(self, draft):
+        return draft.get('turn', 0) >= self.total_turns
+
+    def is_used(self, draft, champion_id):
+        words = draft.get('used', [])
+        word = champion_id // WORD_BITS
+        return word < len(words) and bool(words[word] >> (champion_id % WORD_BITS) & 1)
+
+    @staticmethod
+    def _mark_used(draft, champion_id):
+        words = draft.setdefault('used', [])
+        word = champion_id // WORD_BITS
+        if word >= len(words):
+            words.extend([0] * (word + 1 - len(words)))
+        words[word] |= 1 << (champion_id % WORD_BITS)
+
+    def start_clock(self, draft, now):
+        """현재 턴의 마감 시각 설정 (끝난 드래프트면 None)"""
+        draft['deadline'] = None if self.is_completed(draft) else now + self.turn_seconds
+        return draft['deadline']
+
+    def random_available(self, draft, champions, rng=random):
+        """시간 초과 시 자동 선택할 챔피언 (남은 챔피언 중 무작위)"""
+        available = [champ for champ in champions if not self.is_used(draft, champ['id'])]
+        return rng.choice(available) if available else None
+
+    def validate(self, draft, team, action, champion, turn_index=None, actor_team=None) -> Turn:
+        """요청 검증 후 현재 턴 반환 - 허용되지 않으면 DraftError
+
+        actor_team은 서버가 확인한 요청자의 팀 (None이면 서버 자동 처리).
+        """
+        turn = self.current_turn(draft)
+        if turn is None:
+            raise DraftError('completed', '드래프트가 이미 끝났습니다.')
+        if actor_team is not None and actor_team != turn.team_name:
+            raise DraftError('not_your_team', f'{turn.team_name} 팀 참가자만 진행할 수 있습니다.')
+        if turn_index is not None and turn_index != turn.index:
+            raise DraftError('stale_turn', '이미 지나간 턴입니다.')
+        if self._team_index.get(team) != turn.team:
+            raise DraftError('wrong_team', f'{turn.team_name} 팀의 차례입니다.')
+        if self._action_index.get(action) != turn.action:
+            raise DraftError('wrong_action', f'지금은 {turn.action_name} 차례입니다.')
+        if champion is None:
+            raise DraftError('unknown_champion', '알 수 없는 챔피언입니다.')
+        if self.is_used(draft, champion['id']):
+            raise DraftError('champion_used', '이미 밴/픽된 챔피언입니다.')
+        return turn
+
+    def apply(self, draft, team, action, champion, turn_index=None, now=None, actor_team=None):
+        """검증 후 드래프트 상태에 반영하고 변경 내용을 반환
+
+        검증이 끝난 뒤에만 상태를 바꾸므로 실패 시 draft는 그대로다.
+        now가 주어지면 다음 턴의 마감 시각도 함께 설정한다.
+        """
+        turn = self.validate(draft, team, action, champion, turn_index, actor_team)
+
+        name = champion['korean_name']
+        if turn.action == ACTION_BAN:
+            draft['bans'][turn.team_name].append(name)
+        else:
+            draft['picks'][turn.team_name].append(name)
+            draft['lineup'][turn.team_name][turn.position] = {
+                'english_name': champion['english_name'],
+                'korean_name': champion['korean_name'],
+                'image_url': champion['image_url']
+            }
+
+        self._mark_used(draft, champion['id'])
+        return self._advance(draft, turn, turn.action_name, champion, now)
+
+    def skip(self, draft, turn_index=None, now=None):
+        """남은 챔피언이 없을 때 현재 턴을 비워 두고 넘긴다 (밴은 없음, 픽은 빈 자리)"""
+        turn = self.current_turn(draft)
+        if turn is None:
+            raise DraftError('completed', '드래프트가 이미 끝났습니다.')
+        if turn_index is not None and turn_index != turn.index:
+            raise DraftError('stale_turn', '이미 지나간 턴입니다.')
+        return self._advance(draft, turn, 'skip', None, now)
+
+    def _advance(self, draft, turn, action_name, champion, now):
+        draft['turn'] = turn.index + 1
+        next_turn = self.current_turn(draft)
+        draft['currentTurn'] = next_turn.name if next_turn else 'completed'
+        if now is not None:
+            self.start_clock(draft, now)
+
+        champion = champion or {}
+        return {
+            'turn': turn.index,
+            'team': turn.team_name,
+            'action': action_name,
+            'position': turn.position,
+            'champion_english': champion.get('english_name'),
+            'champion_korean': champion.get('korean_name'),
+            'image_url': champion.get('image_url'),
+            'next_turn': draft['turn'],
+            'currentTurn': draft['currentTurn'],
+            'deadline': draft.get('deadline'),
+            'completed': next_turn is None
+        }
+
+
+draft_engine = DraftEngine(turn_seconds=Config.DRAFT_TURN_SECONDS)
@@ -0,0 +1,280 @@
+"""봇 <-> 웹서버 로컬 이벤트 버스 (유닉스 도메인 소켓)
+
+프레임: 4바이트 길이(big-endian) + msgpack으로 인코딩한 Event.
+봇이 소켓 파일을 열고(EventBusServer, asyncio) 웹 워커들이 접속한다(EventBusClient, 스레드).
+- 봇 -> 웹: session_created (연결된 웹 워커 하나에 전달 - 워커끼리는 세션 저장소를 공유)
+- 웹 -> 봇: draft_progress, draft_confirmed
+상대가 연결되어 있지 않으면 send/publish가 False를 반환하므로 호출 측에서 대체 경로를 쓴다.
+처리 결과가 필요한 이벤트는 EventBusServer.request로 보낸다 - 웹 워커가 핸들러를 실행한 뒤
+같은 request_id의 reply 이벤트로 성공 여부를 돌려주고, 시간 안에 답이 없으면 None.
+"""
+import asyncio
+import os
+import socket
+import struct
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional
+
+import msgspec
+
+from .config import Config
+
+SESSION_CREATED = 'session_created'
+DRAFT_PROGRESS = 'draft_progress'
+DRAFT_CONFIRMED = 'draft_confirmed'
+REPLY = 'reply'
+
+MAX_FRAME_SIZE = 4 * 1024 * 1024
+_HEADER = struct.Struct('>I')
+
+
+class Event(msgspec.Struct):
+    type: str
+    data: Dict[str, Any]
+    ts: float = 0.0
+    request_id: str = ''
+
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(Event)
+
+
+def encode_frame(event_type: str, data: Dict[str, Any], request_id: str = '') -> bytes:
+    body = _encoder.encode(Event(event_type, data, time.time(), request_id))
+    return _HEADER.pack(len(body)) + body
+
+
+def decode_frame_length(header: bytes) -> int:
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"이벤트 프레임이 너무 큽니다: {length} bytes")
+    return length
+
+
+class _Handlers:
+    def __init__(self):
+        self._handlers = defaultdict(list)
+
+    def on(self, event_type: str):
+        """이벤트 핸들러 등록 데코레이터 - handler(data)"""
+        def decorator(handler: Callable):
+            self._handlers[event_type].append(handler)
+            return handler
+        return decorator
+
+    def _dispatch(self, event: Event):
+        results = []
+        for handler in self._handlers.get(event.type, []):
+            try:
+                results.append(handler(event.data))
+            except Exception as e:
+                print(f"❌ 이벤트 처리 실패 ({event.type}): {e}")
+        return results
+
+
+class EventBusServer(_Handlers):
+    """봇 쪽 - asyncio 유닉스 소켓 서버 (핸들러는 일반 함수 또는 코루틴)"""
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__()
+        self.path = path or Config.EVENT_BUS_PATH
+        self._server = None
+        self._writers = []
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def peers(self) -> int:
+        return len(self._writers)
+
+    async def start(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 이전 실행이 남긴 소켓 파일 정리
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._server = await asyncio.start_unix_server(self._handle_peer, path=self.path)
+        print(f"🔌 이벤트 버스 대기 중: {self.path}")
+
+    async def _handle_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.append(writer)
+        print(f"🔌 이벤트 버스 연결 (웹 {self.peers}개)")
+        try:
+            while True:
+                length = decode_frame_length(await reader.readexactly(_HEADER.size))
+                event = _decoder.decode(await reader.readexactly(length))
+                if event.type == REPLY:
+                    self._resolve(event)
+                    continue
+                for result in self._dispatch(event):
+                    if asyncio.iscoroutine(result):
+                        try:
+                            await result
+                        except Exception as e:
+                            print(f"❌ 이벤트 처리 실패 ({event.type}): {e}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except (ValueError, msgspec.DecodeError) as e:
+            print(f"⚠️ 잘못된 이벤트 프레임 - 연결 종료: {e}")
+        finally:
+            self._writers.remove(writer)
+            writer.close()
+            print(f"🔌 이벤트 버스 연결 해제 (웹 {self.peers}개)")
+
+    def _resolve(self, event: Event) -> None:
+        future = self._pending.get(event.request_id)
+        if future is not None and not future.done():
+            future.set_result(event.data)
+
+    async def send(self, event_type: str, data: Dict[str, Any]) -> bool:
+        """연결된 웹 워커 하나에 이벤트 전달 (연결이 없으면 False)"""
+        return await self._write(encode_frame(event_type, data))
+
+    async def request(self, event_type: str, data: Dict[str, Any],
+                      timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """웹 워커 하나에 이벤트를 보내고 처리 결과({'ok', 'error'})를 기다림 (연결이 없거나 시간 초과면 None)"""
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            if not await self._write(encode_frame(event_type, data, request_id)):
+                return None
+            return await asyncio.wait_for(future, timeout or Config.EVENT_BUS_REPLY_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"⏰ 이벤트 버스 응답 없음 ({event_type})")
+            return None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _write(self, frame: bytes) -> bool:
+        for writer in list(self._writers):
+            try:
+                writer.write(frame)
+                await writer.drain()
+                return True
+            except ConnectionError:
+                continue
+        return False
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._writers):
+            writer.close()
+
+
+class EventBusClient(_Handlers):
+    """웹 쪽 - 블로킹 소켓 클라이언트 (run()을 백그라운드 작업으로 실행, 끊기면 재접속)"""
+
+    def __init__(self, path: Optional[str] = None, retry_interval: float = 1.0):
+        super().__init__()
+        self.path = path or Config.EVENT_BUS_PATH
+        self.retry_interval = retry_interval
+        self._sock = None
+        self._send_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> bool:
+        """봇에 이벤트 전달 (연결이 없으면 False)"""
+        sock = self._sock
+        if sock is None:
+            return False
+        frame = encode_frame(event_type, data)
+        try:
+            with self._send_lock:
+                sock.sendall(frame)
+            return True
+        except OSError:
+            self._disconnect(sock)
+            return False
+
+    def run(self) -> None:
+        announced = False
+        while not self._stopped.is_set():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                if not announced:
+                    print(f"⏳ 이벤트 버스 대기 중 (봇 미실행?): {self.path}")
+                    announced = True
+                self._stopped.wait(self.retry_interval)
+                continue
+
+            announced = False
+            self._sock = sock
+            print(f"🔌 이벤트 버스 연결: {self.path}")
+            try:
+                while True:
+                    length = decode_frame_length(self._recv_exactly(sock, _HEADER.size))
+                    event = _decoder.decode(self._recv_exactly(sock, length))
+                    if event.request_id:
+                        self._answer(sock, event)
+                    else:
+                        self._dispatch(event)
+            except (OSError, EOFError):
+                pass
+            except (ValueError, msgspec.DecodeError) as e:
+                print(f"⚠️ 잘못된 이벤트 프레임 - 재접속: {e}")
+            self._disconnect(sock)
+            print("🔌 이벤트 버스 연결 끊김")
+
+    def _answer(self, sock, event: Event) -> None:
+        """요청 이벤트를 처리하고 reply로 결과 전달 (핸들러가 없거나 하나라도 실패하면 ok=False)"""
+        handlers = self._handlers.get(event.type, [])
+        error = None if handlers else f"처리할 수 없는 이벤트: {event.type}"
+        for handler in handlers:
+            try:
+                handler(event.data)
+            except Exception as e:
+                print(f"❌ 이벤트 처리 실패 ({event.type}): {e}")
+                error = str(e)
+        frame = encode_frame(REPLY, {'ok': error is None, 'error': error}, event.request_id)
+        try:
+            with self._send_lock:
+                sock.sendall(frame)
+        except OSError:
+            pass  # 연결이 끊겼으면 recv 루프가 재접속한다
+
+    @staticmethod
+    def _recv_exactly(sock, size: int) -> bytes:
+        chunks = []
+        while size:
+            chunk = sock.recv(size)
+            if not chunk:
+                raise EOFError
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def _disconnect(self, sock) -> None:
+        if self._sock is sock:
+            self._sock = None
+        try:
+            # 다른 스레드의 recv도 바로 깨우도록 shutdown 후 close
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._sock is not None:
+            self._disconnect(self._sock)
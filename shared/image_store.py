@@ -0,0 +1,92 @@
+"""챔피언 이미지 로컬 저장소 (내용 주소 방식)
+
+이미지 파일은 내용의 SHA-256 해시를 이름으로 저장한다 (<sha256>.png).
+같은 이름이면 내용도 같으므로 웹서버는 영구 캐시(immutable) 헤더로 제공할 수 있고,
+이미지가 바뀌면 새 이름(=새 URL)이 생긴다.
+
+manifest.json 은 영문 챔피언 이름 -> 파일 이름 매핑이다.
+scripts/import_champion_images.py 가 채우고 load_champions.py 가 읽는다.
+atlas.json / atlas.css 는 shared/sprite_atlas.py 가 만드는 스프라이트 위치 정보다.
+"""
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from .config import Config
+
+IMAGE_EXTENSIONS = {'.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.webp': 'image/webp'}
+IMAGE_NAME_PATTERN = re.compile(r'^[0-9a-f]{64}\.(png|jpg|jpeg|webp)$')
+ATLAS_JSON = 'atlas.json'
+ATLAS_CSS = 'atlas.css'
+
+
+def champion_key(name: str) -> str:
+    """파일 이름/챔피언 이름 비교용 키 ("Kai'Sa" -> 'kaisa', 'Dr. Mundo' -> 'drmundo')"""
+    return ''.join(ch for ch in name.lower() if ch.isalnum())
+
+
+class ImageStore:
+    def __init__(self, root: Optional[str] = None, url_prefix: Optional[str] = None):
+        self.root = Path(root or Config.CHAMPION_IMAGE_DIR)
+        self.url_prefix = url_prefix or Config.CHAMPION_IMAGE_URL_PREFIX
+        self.manifest_path = self.root / 'manifest.json'
+
+    def put(self, data: bytes, extension: str) -> str:
+        """이미지 저장 후 파일 이름 반환 (이미 있으면 쓰지 않는다)"""
+        extension = extension.lower()
+        if extension not in IMAGE_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 이미지 형식: {extension}")
+
+        name = hashlib.sha256(data).hexdigest() + extension
+        path = self.root / name
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return name
+
+    def path_for(self, name: str) -> Optional[Path]:
+        """파일 이름 검증 후 경로 반환 (잘못된 이름이면 None)"""
+        if not IMAGE_NAME_PATTERN.match(name):
+            return None
+        return self.root / name
+
+    def url_for(self, name: str) -> str:
+        return f"{self.url_prefix}{name}"
+
+    def load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest: Dict[str, str]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(f"manifest.json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def load_atlas(self) -> dict:
+        """스프라이트 아틀라스 정보 (없으면 빈 dict)"""
+        try:
+            with open(self.root / ATLAS_JSON, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def champion_url(self, english_name: str, manifest: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """로컬에 저장된 챔피언 이미지 URL (없으면 None)"""
+        manifest = self.load_manifest() if manifest is None else manifest
+        name = manifest.get(english_name)
+        if name and (self.root / name).exists():
+            return self.url_for(name)
+        return None
+
+
+image_store = ImageStore()
@@ -19,7 +19,7 @@ class Player:
     summoner_name: str = ""
     wins: int = 0
     losses: int = 0
-    rating: int = 1000
+    rating: float = 1000.0
     created_at: Optional[datetime] = None
 
 @dataclass
@@ -1,4 +1,4 @@
-"""닉네임 파싱 유틸리티"""
+"""닉네임 파싱 유틸리티 (봇 멤버 캐시와 팀 밸런서가 같이 쓴다)"""
 from shared.constants import TIER_ORDER, TIER_NAMES
 
 def parse_tier_from_nickname(nickname: str) -> str:
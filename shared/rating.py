@@ -0,0 +1,228 @@
+"""플레이어 레이팅 (팀 Elo)
+
+팀 레이팅 = 팀원 레이팅 평균. 경기 결과 하나마다 이긴 팀 팀원 모두 +delta, 진 팀 팀원 모두 -delta:
+    delta = K_FACTOR * (1 - 블루팀 기대 승률)   (블루 승리 시, 레드 승리면 부호 반대)
+- create_game_record: 확정된 드래프트로 games/game_participants 행 생성 (웹서버가 결과 확정 때 호출)
+- record_game_result: 결과 한 건 기록 + 그 경기 참가자 레이팅만 갱신 (경기당 상수 시간)
+- recompute_all_ratings: games/game_participants 전체 기록으로 모든 레이팅 재계산
+  (상수 조정/초기화용 - 행 정리와 경기 묶기는 NumPy, 경기 순서대로 누적하는 부분만 반복문)
+"""
+import json
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .database import Database
+
+INITIAL_RATING = 1000.0
+K_FACTOR = 32.0
+RATING_SCALE = 400.0  # 400점 차 = 기대 승률 약 91%
+
+WINNER_TEAMS = ('blue', 'red')
+
+
+class RatingChange(NamedTuple):
+    player_id: int
+    discord_id: str
+    team: str
+    before: float
+    after: float
+
+    @property
+    def delta(self) -> float:
+        return self.after - self.before
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """rating 쪽이 이길 기대 확률"""
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / RATING_SCALE))
+
+
+def rating_delta(blue_ratings: Sequence[float], red_ratings: Sequence[float], blue_won: bool,
+                 k: float = K_FACTOR) -> float:
+    """블루팀 팀원에게 더할 레이팅 변화량 (레드팀은 같은 값을 뺀다)"""
+    blue = sum(blue_ratings) / len(blue_ratings)
+    red = sum(red_ratings) / len(red_ratings)
+    return k * ((1.0 if blue_won else 0.0) - expected_score(blue, red))
+
+
+GAME_INSERT_QUERY = """
+    INSERT INTO games (session_id, title, host_discord_id, status, draft_data, created_at, started_at)
+    VALUES (%s, %s, %s, 'in_progress', %s, UTC_TIMESTAMP(), UTC_TIMESTAMP())
+"""
+
+PLAYER_UPSERT_QUERY = """
+    INSERT INTO players (discord_id, nickname, rating) VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE nickname = VALUES(nickname)
+"""
+
+
+def create_game_record(session_id: str, title: str, host_discord_id: str, state: dict,
+                       db: Optional[Database] = None) -> Optional[int]:
+    """확정된 드래프트 상태로 경기 1행 + 참가자 행 생성 (선수는 없으면 추가) - 경기 id 반환
+
+    같은 세션으로 다시 호출하면 새 행을 만들지 않고 기존 경기 id를 반환한다.
+    디스코드 id가 아닌 테스트용 참가자는 기록하지 않는다 (기록할 참가자가 없으면 None).
+    """
+    names = {
+        str(p['discord_id']): p.get('display_name') or p.get('username') or str(p['discord_id'])
+        for p in state.get('participants', [])
+    }
+    lineup = state['draft']['lineup']
+    seats = [
+        (discord_id, team, position, (lineup[team][position] or {}).get('english_name'))
+        for discord_id, (team, position) in state.get('player_slots', {}).items()
+        if discord_id.isdigit() and team in WINNER_TEAMS
+    ]
+    if not seats:
+        return None
+
+    draft_data = json.dumps({
+        'bans': state['draft']['bans'], 'picks': state['draft']['picks'], 'teams': state['teams']
+    }, ensure_ascii=False)
+
+    with (db or Database()).transaction() as cursor:
+        cursor.execute("SELECT id FROM games WHERE session_id = %s FOR UPDATE", (session_id,))
+        game = cursor.fetchone()
+        if game is not None:
+            return game['id']  # 이미 기록된 세션
+
+        cursor.execute(GAME_INSERT_QUERY, (session_id, title, host_discord_id, draft_data))
+        game_id = cursor.lastrowid
+        cursor.executemany(PLAYER_UPSERT_QUERY, [
+            (discord_id, names.get(discord_id, discord_id), INITIAL_RATING) for discord_id, *_ in seats
+        ])
+        placeholders = ', '.join(['%s'] * len(seats))
+        cursor.execute(
+            f"SELECT id, discord_id FROM players WHERE discord_id IN ({placeholders})",
+            [discord_id for discord_id, *_ in seats]
+        )
+        player_ids = {row['discord_id']: row['id'] for row in cursor.fetchall()}
+        cursor.executemany(
+            "INSERT INTO game_participants (game_id, player_id, team, position, champion) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [(game_id, player_ids[discord_id], team, position, champion)
+             for discord_id, team, position, champion in seats]
+        )
+    return game_id
+
+
+GAME_PARTICIPANTS_QUERY = """
+    SELECT gp.player_id, p.discord_id, gp.team, p.rating
+    FROM game_participants gp JOIN players p ON p.id = gp.player_id
+    WHERE gp.game_id = %s
+    FOR UPDATE
+"""
+
+
+def record_game_result(game_id: int, winner_team: str, db: Optional[Database] = None,
+                       k: float = K_FACTOR) -> List[RatingChange]:
+    """경기 승리 팀 기록 + 참가자 레이팅 갱신 (한 트랜잭션, 이미 기록된 경기면 ValueError)"""
+    if winner_team not in WINNER_TEAMS:
+        raise ValueError(f"알 수 없는 팀입니다: {winner_team}")
+
+    with (db or Database()).transaction() as cursor:
+        cursor.execute("SELECT winner_team FROM games WHERE id = %s FOR UPDATE", (game_id,))
+        game = cursor.fetchone()
+        if game is None:
+            raise ValueError(f"경기를 찾을 수 없습니다: {game_id}")
+        if game['winner_team'] in WINNER_TEAMS:
+            raise ValueError(f"이미 결과가 기록된 경기입니다: {game_id}")
+
+        cursor.execute(GAME_PARTICIPANTS_QUERY, (game_id,))
+        rows = cursor.fetchall()
+        ratings = {team: [row['rating'] for row in rows if row['team'] == team] for team in WINNER_TEAMS}
+        if not ratings['blue'] or not ratings['red']:
+            raise ValueError(f"양 팀 참가자가 모두 있어야 합니다: {game_id}")
+
+        delta = rating_delta(ratings['blue'], ratings['red'], winner_team == 'blue', k)
+        changes = [
+            RatingChange(
+                row['player_id'], row['discord_id'], row['team'], row['rating'],
+                row['rating'] + (delta if row['team'] == 'blue' else -delta)
+            )
+            for row in rows if row['team'] in WINNER_TEAMS
+        ]
+
+        cursor.execute(
+            "UPDATE games SET winner_team = %s, status = 'completed', "
+            "completed_at = COALESCE(completed_at, UTC_TIMESTAMP()) WHERE id = %s",
+            (winner_team, game_id)
+        )
+        cursor.execute(
+            "UPDATE game_participants SET is_winner = (team = %s) WHERE game_id = %s",
+            (winner_team, game_id)
+        )
+        cursor.executemany(
+            "UPDATE players SET rating = %s WHERE id = %s",
+            [(change.after, change.player_id) for change in changes]
+        )
+    return changes
+
+
+def compute_ratings(game_ids: Sequence[int], player_ids: Sequence[int], on_blue: Sequence[bool],
+                    blue_won: Sequence[bool], k: float = K_FACTOR,
+                    initial: float = INITIAL_RATING) -> Dict[int, float]:
+    """경기 순서대로 정렬된 참가 기록(행마다 경기/선수/블루 여부/블루 승리)으로 최종 레이팅 계산"""
+    game_ids = np.asarray(game_ids)
+    if game_ids.size == 0:
+        return {}
+
+    players, player_index = np.unique(np.asarray(player_ids), return_inverse=True)
+    on_blue = np.asarray(on_blue, dtype=bool)
+    blue_won = np.asarray(blue_won, dtype=bool)
+
+    # 같은 경기 행끼리 묶기 - 경기 id가 바뀌는 위치가 경계
+    starts = np.concatenate(([0], np.flatnonzero(game_ids[1:] != game_ids[:-1]) + 1))
+    ends = np.append(starts[1:], game_ids.size)
+
+    ratings = [initial] * len(players)
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        members = player_index[start:end].tolist()
+        blue_mask = on_blue[start:end].tolist()
+        blue = [member for member, is_blue in zip(members, blue_mask) if is_blue]
+        red = [member for member, is_blue in zip(members, blue_mask) if not is_blue]
+        if not blue or not red:
+            continue
+
+        delta = rating_delta(
+            [ratings[member] for member in blue], [ratings[member] for member in red],
+            bool(blue_won[start]), k
+        )
+        for member in blue:
+            ratings[member] += delta
+        for member in red:
+            ratings[member] -= delta
+
+    return dict(zip(players.tolist(), ratings))
+
+
+HISTORY_QUERY = """
+    SELECT g.id AS game_id, gp.player_id, gp.team, g.winner_team
+    FROM games g JOIN game_participants gp ON gp.game_id = g.id
+    WHERE g.winner_team IN ('blue', 'red') AND gp.team IN ('blue', 'red')
+    ORDER BY COALESCE(g.completed_at, g.created_at), g.id
+"""
+
+
+def recompute_all_ratings(db: Optional[Database] = None, k: float = K_FACTOR,
+                          dry_run: bool = False) -> Dict[int, float]:
+    """전체 경기 기록으로 모든 레이팅 재계산 (경기 기록이 없는 선수는 INITIAL_RATING)"""
+    db = db or Database()
+    rows = db.fetch_all(HISTORY_QUERY)
+    ratings = compute_ratings(
+        [row['game_id'] for row in rows],
+        [row['player_id'] for row in rows],
+        [row['team'] == 'blue' for row in rows],
+        [row['winner_team'] == 'blue' for row in rows],
+        k
+    )
+
+    if not dry_run:
+        with db.transaction() as cursor:
+            cursor.execute("UPDATE players SET rating = %s", (INITIAL_RATING,))
+            cursor.executemany(
+                "UPDATE players SET rating = %s WHERE id = %s",
+                [(rating, player_id) for player_id, rating in ratings.items()]
+            )
+    return ratings
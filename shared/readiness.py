@@ -0,0 +1,39 @@
+"""서비스 준비 상태 표시 파일
+
+런처(run_nabi_system.py)가 봇의 준비 완료(게이트웨이 READY)를 알 수 있도록
+봇이 on_ready에서 준비 파일을 쓴다. 파일에는 봇 프로세스의 PID가 들어 있어
+이전 실행이 남긴 파일과 구분된다.
+"""
+import os
+import time
+from typing import Optional
+
+from .config import Config
+
+
+def mark_ready(path: Optional[str] = None) -> None:
+    """현재 프로세스가 준비되었음을 기록"""
+    path = path or Config.BOT_READY_FILE
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"{os.getpid()} {time.time()}")
+    os.replace(tmp_path, path)
+
+
+def clear_ready(path: Optional[str] = None) -> None:
+    try:
+        os.remove(path or Config.BOT_READY_FILE)
+    except FileNotFoundError:
+        pass
+
+
+def is_ready(pid: int, path: Optional[str] = None) -> bool:
+    """pid 프로세스가 준비 파일을 썼는지 확인"""
+    try:
+        with open(path or Config.BOT_READY_FILE, 'r', encoding='utf-8') as f:
+            return f.read().split()[0] == str(pid)
+    except (OSError, IndexError):
+        return False
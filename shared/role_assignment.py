@@ -0,0 +1,156 @@
+"""포지션 자동 배정
+
+참가자별 선호 포지션 순위(shared.constants.POSITIONS)를 받아 10명 x 10자리(팀 x 포지션)
+배정을 한 번에 계산한다. 비용 = 선호 순위 비용 합 + BALANCE_WEIGHT * 양 팀 전력 차.
+전력 차 때문에 자리별 비용이 서로 독립이 아니므로, 126가지 팀 분할(team_balancer.split_masks)
+x 팀 안 포지션 순열 5! = 120가지를 NumPy로 모두 계산해 최소 비용 배정을 정확히 찾는다.
+
+게임 상태에는 teams(자리 -> 이름)와 함께 player_slots(discord_id -> [팀, 포지션]) 역색인을 두어
+자리 이동/나가기를 10칸 전체를 훑지 않고 바로 처리한다.
+"""
+import itertools
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .constants import POSITIONS
+from .team_balancer import BalancePlayer, player_strengths, split_masks
+
+TEAM_NAMES = ('blue', 'red')
+PREFERENCE_COSTS = (0, 1, 3, 6, 10)  # 1지망 ~ 5지망
+UNRANKED_COST = 10                   # 선호 목록에 없는 포지션
+BALANCE_WEIGHT = 0.03                # 전력 100점 차(티어 한 단계) = 3지망 배정 한 번
+
+
+class PositionError(Exception):
+    """허용되지 않는 포지션 요청"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class RoleAssignment(NamedTuple):
+    lineup: Dict[str, Dict[str, BalancePlayer]]  # 팀 -> 포지션 -> 참가자
+    preference_cost: float
+    difference: float
+
+    def to_dict(self) -> dict:
+        return {
+            'teams': {
+                team: {position: player._asdict() for position, player in slots.items()}
+                for team, slots in self.lineup.items()
+            },
+            'preference_cost': self.preference_cost,
+            'difference': round(self.difference, 1)
+        }
+
+
+def normalize_preferences(preferences: Sequence[str]) -> List[str]:
+    """선호 포지션 목록 정리 (대문자, 중복 제거) - 모르는 포지션이면 PositionError"""
+    result = []
+    for position in preferences or []:
+        position = str(position).upper()
+        if position not in POSITIONS:
+            raise PositionError('unknown_position', f'알 수 없는 포지션입니다: {position}')
+        if position not in result:
+            result.append(position)
+    return result
+
+
+def preference_matrix(players: Sequence[BalancePlayer], preferences: Dict[str, Sequence[str]]) -> np.ndarray:
+    """참가자 x 포지션 비용 행렬 (선호를 안 낸 참가자는 모든 포지션 비용 0)"""
+    costs = np.zeros((len(players), len(POSITIONS)))
+    for i, player in enumerate(players):
+        ranked = preferences.get(player.discord_id)
+        if not ranked:
+            continue
+        costs[i, :] = UNRANKED_COST
+        for rank, position in enumerate(ranked):
+            costs[i, POSITIONS.index(position)] = PREFERENCE_COSTS[min(rank, len(PREFERENCE_COSTS) - 1)]
+    return costs
+
+
+@lru_cache(maxsize=None)
+def _position_permutations() -> np.ndarray:
+    perms = np.array(list(itertools.permutations(range(len(POSITIONS)))))
+    perms.setflags(write=False)
+    return perms
+
+
+def assign_roles(players: Sequence[BalancePlayer], preferences: Dict[str, Sequence[str]],
+                 balance_weight: float = BALANCE_WEIGHT) -> RoleAssignment:
+    """선호 비용 + 전력 차 가중합이 최소인 10인 배정"""
+    slot_count = len(TEAM_NAMES) * len(POSITIONS)
+    if len(players) != slot_count:
+        raise PositionError('player_count', f'{slot_count}명이 모여야 배정할 수 있습니다 (현재 {len(players)}명)')
+
+    strengths = player_strengths(players)
+    costs = preference_matrix(players, preferences)
+    masks = split_masks(len(players))
+    perms = _position_permutations()
+
+    # 분할마다 팀 구성원 번호 (분할 수, 5)
+    blue_members = np.nonzero(masks)[1].reshape(len(masks), -1)
+    red_members = np.nonzero(~masks)[1].reshape(len(masks), -1)
+
+    # (분할 수, 순열 수) - 팀 안에서 i번째 구성원이 perms[p, i] 포지션을 맡을 때 비용 합
+    blue_costs = costs[blue_members[:, None, :], perms[None, :, :]].sum(axis=2)
+    red_costs = costs[red_members[:, None, :], perms[None, :, :]].sum(axis=2)
+    blue_perm = blue_costs.argmin(axis=1)
+    red_perm = red_costs.argmin(axis=1)
+
+    splits = np.arange(len(masks))
+    preference_cost = blue_costs[splits, blue_perm] + red_costs[splits, red_perm]
+    difference = np.abs(2 * (masks @ strengths) - strengths.sum())
+    best = int(np.argmin(preference_cost + balance_weight * difference))
+
+    lineup = {}
+    for team, members, perm in (
+        ('blue', blue_members[best], perms[blue_perm[best]]),
+        ('red', red_members[best], perms[red_perm[best]])
+    ):
+        by_position = {POSITIONS[position_index]: players[member] for member, position_index in zip(members, perm)}
+        lineup[team] = {position: by_position[position] for position in POSITIONS}
+
+    return RoleAssignment(lineup, float(preference_cost[best]), float(difference[best]))
+
+
+def apply_assignment(state: dict, assignment: RoleAssignment) -> None:
+    """계산된 배정을 게임 상태(teams, player_slots)에 반영"""
+    state['teams'] = {
+        team: {position: player.name for position, player in slots.items()}
+        for team, slots in assignment.lineup.items()
+    }
+    state['player_slots'] = {
+        player.discord_id: [team, position]
+        for team, slots in assignment.lineup.items()
+        for position, player in slots.items()
+    }
+
+
+def place_player(state: dict, discord_id: str, name: str, team: str,
+                 position: str) -> Optional[List[str]]:
+    """참가자를 빈 자리로 이동하고 비워진 이전 자리 반환"""
+    if team not in TEAM_NAMES or position not in POSITIONS:
+        raise PositionError('unknown_slot', '알 수 없는 자리입니다.')
+    if state['teams'][team][position] is not None:
+        raise PositionError('slot_taken', '이미 선택된 포지션입니다.')
+
+    slots = state.setdefault('player_slots', {})
+    previous = slots.get(discord_id)
+    if previous is not None:
+        state['teams'][previous[0]][previous[1]] = None
+    state['teams'][team][position] = name
+    slots[discord_id] = [team, position]
+    return previous
+
+
+def remove_player(state: dict, discord_id: str) -> Optional[List[str]]:
+    """참가자를 자리에서 빼고 비워진 자리 반환 (자리가 없으면 None)"""
+    previous = state.setdefault('player_slots', {}).pop(discord_id, None)
+    if previous is not None:
+        state['teams'][previous[0]][previous[1]] = None
+    return previous
@@ -0,0 +1,375 @@
+"""게임 세션 저장소
+
+웹서버가 진행 중인 드래프트(세션 정보 + 게임 상태)를 보관하는 곳.
+- MemorySessionStore: 단일 프로세스용 (기본값)
+- SQLiteSessionStore: 같은 서버의 여러 웹 워커가 공유하는 파일 저장소 (WAL)
+
+상태 변경은 항상 update_state()로 한다. 콜백이 실행되는 동안 다른
+스레드/프로세스는 같은 저장소에 쓸 수 없으므로 읽기-수정-쓰기가 원자적이다.
+게임 상태의 'version'은 생성 시 0이고 update_state() 때마다 1씩 증가한다.
+
+저장소 크기는 제한된다. 생성/수정/touch()가 최근 사용 시각을 갱신하고,
+- max_sessions를 넘으면 가장 오래 쓰이지 않은 세션부터 (LRU)
+- idle_ttl 동안 쓰이지 않은 세션은 sweep() 때
+제거된다. 제거 직후 on_evict(session_id, session_data, state)가 호출된다.
+"""
+import copy
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+import msgspec
+
+from .config import Config
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+
+class SessionNotFound(KeyError):
+    """존재하지 않는 세션"""
+
+
+class SessionStore(ABC):
+    """세션 저장소 공통 인터페이스"""
+
+    def __init__(self, max_sessions: Optional[int] = None, idle_ttl: Optional[float] = None,
+                 on_evict: Optional[Callable[[str, dict, dict], None]] = None):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self.evicted = {'lru': 0, 'idle': 0}
+
+    @abstractmethod
+    def create(self, session_id: str, session_data: dict, state: dict) -> None:
+        """세션 생성 (이미 있으면 덮어쓴다)"""
+
+    @abstractmethod
+    def get_session(self, session_id: str) -> Optional[dict]:
+        """세션 정보 조회 (없으면 None)"""
+
+    @abstractmethod
+    def get_state(self, session_id: str) -> Optional[dict]:
+        """게임 상태 조회 (없으면 None)"""
+
+    @abstractmethod
+    def update_state(self, session_id: str, mutate: Callable[[dict], object]):
+        """게임 상태를 원자적으로 수정하고 mutate의 반환값을 돌려준다
+
+        mutate가 호출될 때 state['version']은 이미 새 버전으로 올라가 있다.
+        mutate가 예외를 던지면 상태(version 포함)는 바뀌지 않는다.
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """세션 삭제 후 존재했는지 반환"""
+
+    @abstractmethod
+    def touch(self, session_id: str) -> None:
+        """최근 사용 시각 갱신 (LRU/유휴 판단용)"""
+
+    @abstractmethod
+    def sweep(self, now: Optional[float] = None) -> int:
+        """유휴 시간이 지난 세션 제거 후 제거한 수 반환"""
+
+    @abstractmethod
+    def session_ids(self) -> Iterable[str]:
+        """저장된 세션 ID 목록"""
+
+    def snapshot(self, path: str) -> int:
+        """모든 세션을 파일로 저장 (재시작 전 메모리 저장소 보존용) 후 세션 수 반환"""
+        entries = []
+        for session_id in self.session_ids():
+            session_data = self.get_session(session_id)
+            state = self.get_state(session_id)
+            if session_data is not None and state is not None:
+                entries.append((session_id, session_data, state))
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_encoder.encode(entries))
+        os.replace(tmp_path, path)
+        return len(entries)
+
+    def restore(self, path: str) -> list:
+        """snapshot() 파일에서 세션 복원 후 파일 삭제 - 복원한 세션 ID 목록 반환"""
+        try:
+            with open(path, 'rb') as f:
+                entries = _decoder.decode(f.read())
+        except FileNotFoundError:
+            return []
+
+        for session_id, session_data, state in entries:
+            self.create(session_id, session_data, state)
+        os.remove(path)
+        return [entry[0] for entry in entries]
+
+    def stats(self) -> dict:
+        """세션 수와 제거 통계"""
+        return {
+            'live': len(self),
+            'max_sessions': self.max_sessions,
+            'idle_ttl': self.idle_ttl,
+            'evicted_lru': self.evicted['lru'],
+            'evicted_idle': self.evicted['idle']
+        }
+
+    def _evicted(self, reason: str, entries) -> int:
+        """제거된 세션 집계 후 on_evict 호출 (저장소 잠금 밖에서)"""
+        self.evicted[reason] += len(entries)
+        for session_id, session_data, state in entries:
+            print(f"🧹 세션 제거 ({reason}): {session_id}")
+            if self.on_evict is None:
+                continue
+            try:
+                self.on_evict(session_id, session_data, state)
+            except Exception as e:
+                print(f"❌ 세션 제거 처리 실패 ({session_id}): {e}")
+        return len(entries)
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get_session(session_id) is not None
+
+    def __len__(self) -> int:
+        return len(list(self.session_ids()))
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리 저장소 - 반환된 dict는 읽기 전용으로 취급할 것 (수정은 update_state)"""
+
+    def __init__(self, **limits):
+        super().__init__(**limits)
+        self._lock = threading.RLock()
+        self._sessions = {}
+        self._states = {}
+        self._touched = OrderedDict()  # session_id -> 최근 사용 시각 (오래된 순)
+
+    def _touch(self, session_id):
+        self._touched[session_id] = time.time()
+        self._touched.move_to_end(session_id)
+
+    def _pop(self, session_id):
+        self._touched.pop(session_id, None)
+        return session_id, self._sessions.pop(session_id, None), self._states.pop(session_id, None)
+
+    def create(self, session_id, session_data, state):
+        state.setdefault('version', 0)
+        with self._lock:
+            self._sessions[session_id] = session_data
+            self._states[session_id] = state
+            self._touch(session_id)
+
+            evicted = []
+            while self.max_sessions and len(self._sessions) > self.max_sessions:
+                evicted.append(self._pop(next(iter(self._touched))))
+        self._evicted('lru', evicted)
+
+    def get_session(self, session_id):
+        return self._sessions.get(session_id)
+
+    def get_state(self, session_id):
+        return self._states.get(session_id)
+
+    def update_state(self, session_id, mutate):
+        with self._lock:
+            state = self._states.get(session_id)
+            if state is None:
+                raise SessionNotFound(session_id)
+
+            # 사본을 수정하고 성공했을 때만 교체 - 실패하면 SQLite 저장소처럼 전부 되돌린다
+            state = copy.deepcopy(state)
+            state['version'] = state.get('version', 0) + 1
+            result = mutate(state)
+            self._states[session_id] = state
+            self._touch(session_id)
+            return result
+
+    def delete(self, session_id):
+        with self._lock:
+            return self._pop(session_id)[1] is not None
+
+    def touch(self, session_id):
+        with self._lock:
+            if session_id in self._sessions:
+                self._touch(session_id)
+
+    def sweep(self, now=None):
+        if not self.idle_ttl:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.idle_ttl
+        with self._lock:
+            expired = []
+            for session_id, touched_at in self._touched.items():
+                if touched_at > cutoff:
+                    break
+                expired.append(session_id)
+            evicted = [self._pop(session_id) for session_id in expired]
+        return self._evicted('idle', evicted)
+
+    def session_ids(self):
+        return list(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite(WAL) 파일 저장소 - 여러 워커 프로세스가 같은 파일을 공유한다
+
+    세션은 msgpack으로 직렬화해 한 행에 저장하고, 쓰기는 트랜잭션 단위로 원자적이다.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0, **limits):
+        super().__init__(**limits)
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = self._connection()
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS game_sessions (
+                session_id TEXT PRIMARY KEY,
+                session BLOB NOT NULL,
+                state BLOB NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_game_sessions_updated_at ON game_sessions (updated_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def create(self, session_id, session_data, state):
+        state.setdefault('version', 0)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO game_sessions (session_id, session, state, updated_at) VALUES (?, ?, ?, ?)",
+            (session_id, _encoder.encode(session_data), _encoder.encode(state), time.time())
+        )
+        if self.max_sessions:
+            self._evicted('lru', self._delete_where(
+                "session_id IN (SELECT session_id FROM game_sessions ORDER BY updated_at "
+                "LIMIT max(0, (SELECT COUNT(*) FROM game_sessions) - ?))",
+                (self.max_sessions,)
+            ))
+
+    def _delete_where(self, condition, params):
+        """조건에 맞는 세션을 읽고 지운 뒤 (session_id, session, state) 목록 반환"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                f"SELECT session_id, session, state FROM game_sessions WHERE {condition}", params
+            ).fetchall()
+            connection.executemany(
+                "DELETE FROM game_sessions WHERE session_id = ?", [(row[0],) for row in rows]
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return [(row[0], _decoder.decode(row[1]), _decoder.decode(row[2])) for row in rows]
+
+    def get_session(self, session_id):
+        row = self._connection().execute(
+            "SELECT session FROM game_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return _decoder.decode(row[0]) if row else None
+
+    def get_state(self, session_id):
+        row = self._connection().execute(
+            "SELECT state FROM game_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return _decoder.decode(row[0]) if row else None
+
+    def update_state(self, session_id, mutate):
+        connection = self._connection()
+        # BEGIN IMMEDIATE: 읽기 전에 쓰기 잠금을 잡아 다른 워커와의 경합을 막는다
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT state FROM game_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                raise SessionNotFound(session_id)
+
+            state = _decoder.decode(row[0])
+            state['version'] = state.get('version', 0) + 1
+            result = mutate(state)
+            connection.execute(
+                "UPDATE game_sessions SET state = ?, updated_at = ? WHERE session_id = ?",
+                (_encoder.encode(state), time.time(), session_id)
+            )
+            connection.execute("COMMIT")
+            return result
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def delete(self, session_id):
+        cursor = self._connection().execute(
+            "DELETE FROM game_sessions WHERE session_id = ?", (session_id,)
+        )
+        return cursor.rowcount > 0
+
+    def touch(self, session_id):
+        self._connection().execute(
+            "UPDATE game_sessions SET updated_at = ? WHERE session_id = ?", (time.time(), session_id)
+        )
+
+    def sweep(self, now=None):
+        if not self.idle_ttl:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.idle_ttl
+        return self._evicted('idle', self._delete_where("updated_at <= ?", (cutoff,)))
+
+    def session_ids(self):
+        rows = self._connection().execute("SELECT session_id FROM game_sessions").fetchall()
+        return [row[0] for row in rows]
+
+    def __contains__(self, session_id):
+        row = self._connection().execute(
+            "SELECT 1 FROM game_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM game_sessions").fetchone()[0]
+
+
+def create_session_store(backend: Optional[str] = None,
+                         on_evict: Optional[Callable[[str, dict, dict], None]] = None) -> SessionStore:
+    """설정(SESSION_STORE)에 맞는 저장소 생성"""
+    backend = (backend or Config.SESSION_STORE).lower()
+    limits = {
+        'max_sessions': Config.SESSION_MAX_SESSIONS,
+        'idle_ttl': Config.SESSION_IDLE_TTL,
+        'on_evict': on_evict
+    }
+    if backend == 'memory':
+        return MemorySessionStore(**limits)
+    if backend == 'sqlite':
+        return SQLiteSessionStore(Config.SESSION_STORE_PATH, **limits)
+    raise ValueError(f"알 수 없는 세션 저장소: {backend}")
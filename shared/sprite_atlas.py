@@ -0,0 +1,181 @@
+"""챔피언 초상화 스프라이트 아틀라스
+
+로컬 이미지 저장소의 초상화를 몇 장의 아틀라스 이미지로 묶고, 영문 이름 -> 위치
+매핑을 CSS/JSON으로 만든다 (atlas.json / atlas.css, /sprites/ 로 제공).
+
+증분 갱신:
+- 챔피언은 이전 아틀라스의 칸을 그대로 유지하고, 새 챔피언은 빈 칸(삭제로 생긴 칸 포함)이나
+  마지막 시트 뒤에 들어간다. 챔피언 하나가 추가되어도 그 칸이 있는 시트만 다시 그린다.
+- 시트 구성 해시가 같으면 이미지를 다시 그리지 않고, 새 아틀라스에서 빠진 시트 파일은 지운다.
+카탈로그가 바뀌면 load_champions.py / import_champion_images.py가 rebuild_atlas()를 호출한다.
+"""
+import hashlib
+import io
+import json
+from typing import List, Optional
+
+from .image_store import image_store, ATLAS_JSON, ATLAS_CSS
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DEFAULT_TILE = 96
+DEFAULT_COLUMNS = 16
+DEFAULT_ROWS = 8
+
+
+def sheet_signature(entries, tile, columns):
+    """시트 구성 해시 - 같으면 시트 이미지도 같다"""
+    raw = json.dumps([entries, tile, columns], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def render_sheet(entries, tile, columns):
+    """초상화들을 한 장의 PNG로 묶기 (None 칸은 비워 둔다)"""
+    rows = (len(entries) + columns - 1) // columns
+    sheet = Image.new('RGBA', (columns * tile, rows * tile), (0, 0, 0, 0))
+    for index, entry in enumerate(entries):
+        if entry is None:
+            continue
+        with Image.open(image_store.root / entry[1]) as portrait:
+            portrait = portrait.convert('RGBA').resize((tile, tile), Image.LANCZOS)
+            sheet.paste(portrait, ((index % columns) * tile, (index // columns) * tile))
+
+    buffer = io.BytesIO()
+    sheet.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue(), rows
+
+
+def css_string(value):
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def build_css(atlas):
+    """아틀라스 CSS - 위치를 %로 지정해 요소 크기에 맞게 늘어난다"""
+    lines = [
+        "/* shared/sprite_atlas.py 가 생성한 파일 - 직접 수정하지 마세요 */",
+        ".champion-sprite { display: block; width: 100%; height: 100%; background-repeat: no-repeat; }",
+    ]
+    for index, sheet in enumerate(atlas['sheets']):
+        lines.append(
+            f".champion-sprite.sheet-{index} {{ background-image: url({sheet['url']}); "
+            f"background-size: {sheet['columns'] * 100}% {sheet['rows'] * 100}%; }}"
+        )
+
+    for english_name, sprite in atlas['champions'].items():
+        sheet = atlas['sheets'][sprite['sheet']]
+        x = sprite['col'] * 100 / (sheet['columns'] - 1) if sheet['columns'] > 1 else 0
+        y = sprite['row'] * 100 / (sheet['rows'] - 1) if sheet['rows'] > 1 else 0
+        lines.append(
+            f".champion-sprite[data-champion={css_string(english_name)}] "
+            f"{{ background-position: {x:.4f}% {y:.4f}%; }}"
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def plan_layout(names, previous_slots: List[List[Optional[str]]], per_sheet: int) -> List[List[Optional[str]]]:
+    """시트별 칸 배치 - 기존 챔피언은 자리 유지, 사라진 챔피언 칸은 비우고 새 챔피언으로 채운다"""
+    names = set(names)
+    slots = [[name if name in names else None for name in sheet] for sheet in previous_slots]
+    placed = {name for sheet in slots for name in sheet if name is not None}
+
+    free = [(i, j) for i, sheet in enumerate(slots) for j, name in enumerate(sheet) if name is None]
+    free.reverse()
+    for name in sorted(names - placed):
+        if free:
+            i, j = free.pop()
+            slots[i][j] = name
+            continue
+        if not slots or len(slots[-1]) >= per_sheet:
+            slots.append([])
+        slots[-1].append(name)
+
+    # 시트 끝의 빈 칸과 빈 시트는 잘라 낸다 (시트 재사용은 번호가 아니라 구성 해시로 판단)
+    for sheet in slots:
+        while sheet and sheet[-1] is None:
+            sheet.pop()
+    return [sheet for sheet in slots if sheet]
+
+
+def build_atlas(tile=DEFAULT_TILE, columns=DEFAULT_COLUMNS, rows_per_sheet=DEFAULT_ROWS, force=False):
+    """아틀라스 생성/갱신 - 새로 그린 시트 수 반환 (이미지가 없으면 None)"""
+    manifest = image_store.load_manifest()
+    files = {
+        english_name: file_name for english_name, file_name in manifest.items()
+        if (image_store.root / file_name).exists()
+    }
+    if not files:
+        print("❌ 로컬 챔피언 이미지가 없습니다. import_champion_images.py를 먼저 실행하세요.")
+        return None
+
+    per_sheet = columns * rows_per_sheet
+    previous_atlas = image_store.load_atlas()
+    same_grid = previous_atlas.get('tile') == tile and previous_atlas.get('columns') == columns
+    previous_sheets = previous_atlas.get('sheets', [])
+    previous_slots = [sheet.get('slots', []) for sheet in previous_sheets] if same_grid and not force else []
+    reusable = {} if force else {
+        sheet['signature']: sheet for sheet in previous_sheets
+        if image_store.path_for(sheet['file']) and image_store.path_for(sheet['file']).exists()
+    }
+
+    atlas = {'tile': tile, 'columns': columns, 'sheets': [], 'champions': {}}
+    rendered = 0
+    for sheet_index, slots in enumerate(plan_layout(files, previous_slots, per_sheet)):
+        chunk = [(name, files[name]) if name is not None else None for name in slots]
+        signature = sheet_signature(chunk, tile, columns)
+
+        sheet = reusable.get(signature)
+        if sheet is None:
+            data, rows = render_sheet(chunk, tile, columns)
+            file_name = image_store.put(data, '.png')
+            sheet = {
+                'signature': signature,
+                'file': file_name,
+                'url': image_store.url_for(file_name),
+                'columns': columns,
+                'rows': rows
+            }
+            rendered += 1
+        atlas['sheets'].append(dict(sheet, slots=slots))
+
+        for index, name in enumerate(slots):
+            if name is not None:
+                atlas['champions'][name] = {
+                    'sheet': sheet_index,
+                    'col': index % columns,
+                    'row': index // columns
+                }
+
+    atlas['version'] = hashlib.sha1(
+        json.dumps(atlas, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    ).hexdigest()[:16]
+
+    json_path = image_store.root / ATLAS_JSON
+    json_path.write_text(json.dumps(atlas, ensure_ascii=False, indent=1), encoding='utf-8')
+    (image_store.root / ATLAS_CSS).write_text(build_css(atlas), encoding='utf-8')
+
+    # 새 아틀라스가 쓰지 않는 이전 시트 이미지 정리
+    current = {sheet['file'] for sheet in atlas['sheets']}
+    pruned = 0
+    for sheet in previous_sheets:
+        path = image_store.path_for(sheet['file'])
+        if sheet['file'] not in current and path is not None and path.exists():
+            path.unlink()
+            pruned += 1
+
+    print(f"✅ 스프라이트 아틀라스 생성: 챔피언 {len(files)}개, 시트 {len(atlas['sheets'])}장 "
+          f"(새로 그림 {rendered}장, 정리 {pruned}장)")
+    return rendered
+
+
+def rebuild_atlas():
+    """카탈로그 변경 후 호출 - Pillow나 로컬 이미지가 없으면 조용히 건너뛴다"""
+    if Image is None or not image_store.load_manifest():
+        return None
+    try:
+        return build_atlas()
+    except Exception as e:
+        print(f"⚠️ 스프라이트 아틀라스 갱신 실패: {e}")
+        return None
@@ -0,0 +1,171 @@
+"""팀 밸런스 계산
+
+참가자마다 전력 점수(티어 + 레이팅 + 승률 + 최근 경기)를 매기고,
+가능한 모든 5:5 분할을 NumPy로 한 번에 계산해 양 팀 전력 차가 가장 작은 분할을 고른다.
+10명이면 C(10,5) = 252가지 중 블루/레드만 바뀐 중복을 뺀 126가지다
+(0번 참가자가 항상 블루팀에 있는 분할만 만든다).
+"""
+import itertools
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import msgspec
+import numpy as np
+
+from .constants import TIER_ORDER
+from .database import Database
+from .nickname_parser import parse_tier_from_nickname
+from .rating import INITIAL_RATING
+
+# 티어 점수: 아이언 100 ~ 챌린저 1000
+TIER_POINTS = {tier: (len(TIER_ORDER) + 1 - order) * 100 for tier, order in TIER_ORDER.items()}
+BASE_RATING = INITIAL_RATING
+RATING_WEIGHT = 0.5       # 레이팅 200점 차이 = 티어 한 단계
+WIN_RATE_WEIGHT = 200.0   # 승률 60%면 +20
+FORM_WEIGHT = 50.0        # 최근 경기 전승이면 +50, 전패면 -50
+RECENT_GAMES = 10
+MIN_GAMES_FOR_WIN_RATE = 5
+
+
+class BalancePlayer(NamedTuple):
+    discord_id: str
+    name: str
+    tier: str = 'unknown'
+    rating: Optional[float] = None
+    win_rate: Optional[float] = None
+    games: int = 0
+    recent_form: float = 0.0  # 최근 경기 평균 (승 +1, 패 -1)
+
+
+class TeamSplit(NamedTuple):
+    blue: List[BalancePlayer]
+    red: List[BalancePlayer]
+    blue_strength: float
+    red_strength: float
+
+    @property
+    def difference(self) -> float:
+        return abs(self.blue_strength - self.red_strength)
+
+    def to_dict(self) -> dict:
+        return {
+            'blue': [player._asdict() for player in self.blue],
+            'red': [player._asdict() for player in self.red],
+            'blue_strength': round(self.blue_strength, 1),
+            'red_strength': round(self.red_strength, 1),
+            'difference': round(self.difference, 1)
+        }
+
+
+@lru_cache(maxsize=None)
+def split_masks(player_count: int) -> np.ndarray:
+    """블루팀 구성 마스크 (분할 수, 참가자 수) - 0번 참가자는 항상 블루팀"""
+    team_size = player_count // 2
+    rows = [
+        (0,) + rest for rest in itertools.combinations(range(1, player_count), team_size - 1)
+    ]
+    masks = np.zeros((len(rows), player_count), dtype=bool)
+    for i, members in enumerate(rows):
+        masks[i, list(members)] = True
+    masks.setflags(write=False)
+    return masks
+
+
+def recent_form(results: Iterable) -> float:
+    """최근 경기 결과 목록 -> -1.0 ~ 1.0 (True/False 또는 {'is_winner': bool} / {'win': bool})"""
+    values = []
+    for result in list(results or [])[-RECENT_GAMES:]:
+        if isinstance(result, dict):
+            result = result.get('is_winner', result.get('win'))
+        if result is not None:
+            values.append(1.0 if result else -1.0)
+    return sum(values) / len(values) if values else 0.0
+
+
+def player_strengths(players: Sequence[BalancePlayer]) -> np.ndarray:
+    """참가자별 전력 점수 - 티어를 모르면 같은 방 참가자 평균 티어 점수로 본다"""
+    tier_points = np.array([TIER_POINTS.get(player.tier, np.nan) for player in players], dtype=float)
+    known = tier_points[~np.isnan(tier_points)]
+    tier_points[np.isnan(tier_points)] = known.mean() if known.size else TIER_POINTS['g']
+
+    rating = np.array([
+        (player.rating - BASE_RATING) if player.rating is not None else 0.0 for player in players
+    ])
+    win_rate = np.array([
+        (player.win_rate - 0.5) if player.win_rate is not None and player.games >= MIN_GAMES_FOR_WIN_RATE else 0.0
+        for player in players
+    ])
+    form = np.array([player.recent_form for player in players])
+
+    return tier_points + RATING_WEIGHT * rating + WIN_RATE_WEIGHT * win_rate + FORM_WEIGHT * form
+
+
+def balance_teams(players: Sequence[BalancePlayer], top_k: int = 3) -> List[TeamSplit]:
+    """전력 차가 작은 순서로 top_k개의 분할 반환
+
+    전력 차가 같으면 양 팀 최고 전력 선수 차이가 작은 분할을 먼저 둔다.
+    """
+    if len(players) < 2 or len(players) % 2:
+        raise ValueError(f"짝수 인원만 나눌 수 있습니다 (현재 {len(players)}명)")
+
+    strengths = player_strengths(players)
+    masks = split_masks(len(players))
+
+    blue = masks @ strengths
+    red = strengths.sum() - blue
+    difference = np.abs(blue - red)
+    blue_top = np.where(masks, strengths, -np.inf).max(axis=1)
+    red_top = np.where(masks, -np.inf, strengths).max(axis=1)
+    order = np.lexsort((np.abs(blue_top - red_top), difference))[:top_k]
+
+    return [
+        TeamSplit(
+            [player for player, on_blue in zip(players, masks[i]) if on_blue],
+            [player for player, on_blue in zip(players, masks[i]) if not on_blue],
+            float(blue[i]),
+            float(red[i])
+        )
+        for i in order
+    ]
+
+
+PLAYER_STATS_QUERY = """
+    SELECT p.discord_id, p.rating, s.win_rate, s.total_games, s.recent_games
+    FROM players p LEFT JOIN player_stats s ON s.player_id = p.id
+    WHERE p.discord_id IN ({placeholders})
+"""
+
+
+def load_player_stats(discord_ids: Sequence[str], db=None) -> Dict[str, dict]:
+    """DB의 승률/최근 경기 (없는 선수는 빠진다, DB 오류면 빈 dict)"""
+    ids = [str(discord_id) for discord_id in discord_ids]
+    if not ids:
+        return {}
+    rows = (db or Database()).fetch_all(PLAYER_STATS_QUERY.format(placeholders=', '.join(['%s'] * len(ids))), ids)
+    return {row['discord_id']: row for row in rows or []}
+
+
+def build_players(participants: Iterable[dict], stats: Optional[Dict[str, dict]] = None) -> List[BalancePlayer]:
+    """세션 참가자 정보(discord_id, display_name) + DB 통계 -> BalancePlayer 목록"""
+    stats = stats or {}
+    players = []
+    for participant in participants:
+        discord_id = str(participant['discord_id'])
+        name = participant.get('display_name') or participant.get('username') or discord_id
+        row = stats.get(discord_id) or {}
+        recent = row.get('recent_games')
+        if isinstance(recent, (str, bytes)):  # JSON 컬럼이 문자열로 올 수 있다
+            try:
+                recent = msgspec.json.decode(recent)
+            except msgspec.DecodeError:
+                recent = None
+        players.append(BalancePlayer(
+            discord_id=discord_id,
+            name=name,
+            tier=parse_tier_from_nickname(name),
+            rating=row.get('rating'),
+            win_rate=row.get('win_rate'),
+            games=row.get('total_games') or 0,
+            recent_form=recent_form(recent)
+        ))
+    return players
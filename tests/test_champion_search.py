@@ -0,0 +1,69 @@
+"""챔피언 검색 - 초성/접두어/중간 일치"""
+import pytest
+
+from shared.champion_search import ChampionSearchIndex, hangul_initials, is_initials_query
+
+CHAMPIONS = [
+    {'id': 1, 'english_name': 'Aatrox', 'korean_name': '아트록스'},
+    {'id': 2, 'english_name': 'Ahri', 'korean_name': '아리'},
+    {'id': 3, 'english_name': "Kai'Sa", 'korean_name': '카이사'},
+    {'id': 4, 'english_name': 'Akshan', 'korean_name': '아크샨'},
+]
+
+
+@pytest.fixture(scope='module')
+def index():
+    return ChampionSearchIndex(CHAMPIONS)
+
+
+def names(results):
+    return [champ['english_name'] for champ in results]
+
+
+def test_hangul_initials():
+    assert hangul_initials('아트록스') == 'ㅇㅌㄹㅅ'
+    assert hangul_initials('a아') == 'aㅇ'
+    assert is_initials_query('ㅇㅌ')
+    assert not is_initials_query('ㅇ트')
+
+
+def test_initials_prefix_and_substring(index):
+    assert names(index.search('ㅇㅌㄹ')) == ['Aatrox']
+    assert names(index.search('ㅋㅇ')) == ["Kai'Sa"]
+    assert names(index.search('ㅇㅅ')) == ["Kai'Sa"]
+
+
+def test_exact_match_ranks_first(index):
+    assert names(index.search('아리')) == ['Ahri']
+    assert names(index.search('아'))[0] == 'Ahri'  # 접두어 중 이름이 짧은 순
+
+
+def test_english_key_ignores_symbols_and_case(index):
+    assert names(index.search('kaisa')) == ["Kai'Sa"]
+    assert names(index.search("KAI'S")) == ["Kai'Sa"]
+    assert names(index.search('tro')) == ['Aatrox']
+
+
+def test_limit_and_empty_query(index):
+    assert len(index.search('a', limit=2)) == 2
+    assert index.search('!!') == []
+    assert index.search('zzz') == []
+
+
+@pytest.mark.parametrize('raw, expected', [('1000', 50), ('0', 1), ('-5', 1), ('7', 7), ('abc', 20)])
+def test_search_route_clamps_limit(monkeypatch, index, raw, expected):
+    from flask import Flask
+    from web.api import champion_api
+
+    seen = []
+
+    def search(query, limit):
+        seen.append(limit)
+        return index.search(query, limit)
+
+    monkeypatch.setattr(champion_api.champion_search, 'search', search)
+    app = Flask(__name__)
+    app.register_blueprint(champion_api.champion_bp)
+    response = app.test_client().get(f'/api/champions/search?q=아&limit={raw}')
+    assert response.status_code == 200
+    assert seen == [expected]
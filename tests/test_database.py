@@ -0,0 +1,135 @@
+"""MySQL 연결 풀과 끊김 재시도 - 실제 서버 대신 가짜 연결"""
+import pytest
+from mysql.connector import Error, errorcode
+
+from shared.database import ConnectionPool, Database, PoolTimeout, is_read_only
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.lastrowid = 7
+
+    def execute(self, query, params=()):
+        self.connection.executed.append(query)
+        if self.connection.fail_with is not None:
+            raise Error(msg='연결 끊김', errno=self.connection.fail_with)
+
+    def fetchall(self):
+        return [{'id': 1}]
+
+    def fetchone(self):
+        return {'id': 1}
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.executed = []
+        self.closed = False
+        self.alive = True
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise Error(msg='ping 실패', errno=errorcode.CR_SERVER_GONE_ERROR)
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool(ConnectionPool):
+    """_create가 미리 준비한 연결을 차례로 내준다"""
+
+    def __init__(self, connections, **kwargs):
+        super().__init__(**kwargs)
+        self.pending = list(connections)
+        self.created = []
+
+    def _create(self):
+        connection = self.pending.pop(0) if self.pending else FakeConnection()
+        self.created.append(connection)
+        with self._cond:
+            self._stats['created'] += 1
+        return connection
+
+
+def make_db(*connections, **kwargs):
+    db = Database()
+    db.pool = FakePool(connections, **kwargs)
+    return db
+
+
+def test_read_only_detection():
+    assert is_read_only("  select * from players")
+    assert is_read_only("SHOW TABLES")
+    assert not is_read_only("UPDATE players SET rating = 1")
+    assert not is_read_only("INSERT INTO games VALUES (1)")
+    assert not is_read_only("ALTER TABLE players ADD COLUMN x INT")
+
+
+def test_read_is_retried_once_after_lost_connection():
+    lost, fresh = FakeConnection(errorcode.CR_SERVER_LOST), FakeConnection()
+    db = make_db(lost, fresh)
+    assert db.fetch_all("SELECT id FROM players") == [{'id': 1}]
+    assert lost.closed and len(fresh.executed) == 1
+    assert db.pool.stats()['discarded'] == 1
+
+
+def test_write_is_not_resent_after_lost_connection():
+    lost = FakeConnection(errorcode.CR_SERVER_LOST)
+    db = make_db(lost)
+    assert db.execute_query("UPDATE players SET rating = %s WHERE id = %s", (1010.5, 1)) is None
+    assert lost.executed == ["UPDATE players SET rating = %s WHERE id = %s"]
+    assert db.pool.created == [lost]
+    assert db.pool.stats()['discarded'] == 1
+
+
+def test_other_errors_keep_connection_and_do_not_retry():
+    broken = FakeConnection(errorcode.ER_PARSE_ERROR)
+    db = make_db(broken)
+    assert db.fetch_one("SELECT nonsense") is None
+    assert len(broken.executed) == 1 and not broken.closed
+    assert db.pool.stats()['idle'] == 1
+
+
+def test_pool_reuses_most_recent_connection():
+    pool = FakePool([], max_size=2)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert pool.acquire() is second
+    assert pool.stats()['created'] == 2
+
+
+def test_pool_times_out_when_full():
+    pool = FakePool([], max_size=1, timeout=0.05)
+    pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert pool.stats()['timeouts'] == 1
+
+
+def test_discard_frees_a_slot():
+    pool = FakePool([], max_size=1, timeout=0.05)
+    pool.discard(pool.acquire())
+    assert pool.acquire() is pool.created[1]
+    assert pool.stats()['size'] == 1
+
+
+def test_idle_connection_is_pinged_and_replaced():
+    pool = FakePool([], max_size=1, idle_check=0)
+    stale = pool.acquire()
+    pool.release(stale)
+    stale.alive = False
+    replacement = pool.acquire()
+    assert replacement is not stale and stale.closed
+    assert pool.stats()['reconnects'] == 1
@@ -0,0 +1,62 @@
+"""마감 스케줄러 - 힙 취소/재예약"""
+from shared.deadline_scheduler import DeadlineScheduler
+
+
+def make_scheduler():
+    fired = []
+    scheduler = DeadlineScheduler(lambda key, token: fired.append((key, token)))
+    return scheduler, fired
+
+
+def test_fires_in_deadline_order():
+    scheduler, fired = make_scheduler()
+    scheduler.schedule('b', 20.0, 1)
+    scheduler.schedule('a', 10.0, 1)
+    assert scheduler.run_pending(now=15.0) == 20.0
+    assert scheduler.run_pending(now=25.0) is None
+    assert fired == [('a', 1), ('b', 1)]
+    assert scheduler.pending() == 0
+
+
+def test_cancel_drops_pending_entry():
+    scheduler, fired = make_scheduler()
+    scheduler.schedule('a', 10.0, 1)
+    scheduler.cancel('a')
+    assert scheduler.pending() == 0
+    scheduler.run_pending(now=100.0)
+    assert fired == []
+
+
+def test_reschedule_replaces_previous_deadline():
+    scheduler, fired = make_scheduler()
+    scheduler.schedule('a', 10.0, 1)
+    scheduler.schedule('a', 30.0, 2)
+    assert scheduler.pending() == 1
+    scheduler.run_pending(now=20.0)
+    assert fired == []
+    scheduler.run_pending(now=30.0)
+    assert fired == [('a', 2)]
+
+
+def test_same_deadline_and_token_is_not_duplicated():
+    scheduler, fired = make_scheduler()
+    scheduler.schedule('a', 10.0, 1)
+    scheduler.schedule('a', 10.0, 1)
+    scheduler.run_pending(now=10.0)
+    assert fired == [('a', 1)]
+
+
+def test_callback_error_does_not_stop_other_keys():
+    calls = []
+
+    def on_expire(key, token):
+        calls.append(key)
+        if key == 'a':
+            raise RuntimeError('boom')
+
+    scheduler = DeadlineScheduler(on_expire)
+    scheduler.schedule('a', 1.0)
+    scheduler.schedule('b', 2.0)
+    scheduler.run_pending(now=5.0)
+    assert calls == ['a', 'b']
+    assert scheduler.fired == 2
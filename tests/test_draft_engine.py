@@ -0,0 +1,88 @@
+"""밴픽 엔진 - 턴 순서, 사용 비트셋 검증"""
+import pytest
+
+from shared.constants import DRAFT_PHASES, POSITIONS
+from shared.draft_engine import DraftEngine, DraftError, WORD_BITS
+
+
+def champion(champion_id):
+    return {
+        'id': champion_id,
+        'english_name': f'Champ{champion_id}',
+        'korean_name': f'챔피언{champion_id}',
+        'image_url': f'/img/{champion_id}.png'
+    }
+
+
+@pytest.fixture
+def engine():
+    return DraftEngine(turn_seconds=30)
+
+
+def test_turn_table_follows_phase_order(engine):
+    expected = [team.lower() for phase in DRAFT_PHASES.values() for team in phase['order']]
+    assert [turn.team_name for turn in engine.turns] == expected
+    assert engine.total_turns == 20
+    assert engine.turns[0].name == 'blue_ban_1'
+    assert engine.turns[6].name == 'blue_pick_1'
+
+
+def test_picks_fill_positions_in_order(engine):
+    blue_picks = [turn.position for turn in engine.turns if turn.team_name == 'blue' and turn.action_name == 'pick']
+    assert blue_picks == POSITIONS
+
+
+def test_full_draft_marks_everything_used(engine):
+    draft = engine.new_draft()
+    for index, turn in enumerate(engine.turns):
+        result = engine.apply(draft, turn.team_name, turn.action_name, champion(index))
+        assert result['turn'] == index
+    assert engine.is_completed(draft)
+    assert draft['currentTurn'] == 'completed'
+    assert all(engine.is_used(draft, index) for index in range(engine.total_turns))
+    assert all(draft['lineup'][team][position] for team in ('blue', 'red') for position in POSITIONS)
+
+
+@pytest.mark.parametrize('team, action, code', [
+    ('red', 'ban', 'wrong_team'),
+    ('blue', 'pick', 'wrong_action'),
+])
+def test_rejects_wrong_turn(engine, team, action, code):
+    draft = engine.new_draft()
+    with pytest.raises(DraftError) as error:
+        engine.apply(draft, team, action, champion(1))
+    assert error.value.code == code
+    assert draft['turn'] == 0 and draft['used'] == []
+
+
+def test_rejects_used_champion_across_words(engine):
+    draft = engine.new_draft()
+    high_id = WORD_BITS * 3 + 5
+    engine.apply(draft, 'blue', 'ban', champion(high_id))
+    assert len(draft['used']) == 4
+    assert engine.is_used(draft, high_id)
+    assert not engine.is_used(draft, high_id - 1)
+    assert not engine.is_used(draft, WORD_BITS * 10)
+
+    with pytest.raises(DraftError) as error:
+        engine.apply(draft, 'red', 'ban', champion(high_id))
+    assert error.value.code == 'champion_used'
+
+
+def test_rejects_stale_turn_and_other_team(engine):
+    draft = engine.new_draft()
+    engine.apply(draft, 'blue', 'ban', champion(1))
+    with pytest.raises(DraftError) as error:
+        engine.apply(draft, 'red', 'ban', champion(2), turn_index=0)
+    assert error.value.code == 'stale_turn'
+    with pytest.raises(DraftError) as error:
+        engine.apply(draft, 'red', 'ban', champion(2), actor_team='blue')
+    assert error.value.code == 'not_your_team'
+
+
+def test_skip_advances_without_using_champion(engine):
+    draft = engine.new_draft()
+    result = engine.skip(draft, turn_index=0, now=100.0)
+    assert result['action'] == 'skip' and result['champion_english'] is None
+    assert draft['turn'] == 1 and draft['used'] == []
+    assert draft['deadline'] == 130.0
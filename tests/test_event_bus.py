@@ -0,0 +1,101 @@
+"""봇 <-> 웹 이벤트 버스 - 프레임과 요청/응답"""
+import asyncio
+import socket
+import threading
+
+import pytest
+
+from shared.event_bus import (
+    MAX_FRAME_SIZE, EventBusClient, EventBusServer, _HEADER, _decoder, decode_frame_length, encode_frame
+)
+
+
+def test_frame_round_trip():
+    frame = encode_frame('session_created', {'session_id': 'abc', 'participants': [1, 2]}, 'r1')
+    length = decode_frame_length(frame[:_HEADER.size])
+    assert length == len(frame) - _HEADER.size
+    event = _decoder.decode(frame[_HEADER.size:])
+    assert (event.type, event.data, event.request_id) == ('session_created', {'session_id': 'abc', 'participants': [1, 2]}, 'r1')
+
+
+def test_plain_event_has_no_request_id():
+    frame = encode_frame('draft_progress', {})
+    assert _decoder.decode(frame[_HEADER.size:]).request_id == ''
+
+
+def test_oversized_frame_is_rejected():
+    with pytest.raises(ValueError):
+        decode_frame_length(_HEADER.pack(MAX_FRAME_SIZE + 1))
+
+
+async def wait_for_peer(server):
+    for _ in range(200):
+        if server.peers:
+            return
+        await asyncio.sleep(0.01)
+
+
+def run_with_client(path, client, scenario):
+    """봇 쪽 서버를 띄우고 웹 클라이언트가 붙은 뒤 scenario(server) 실행"""
+    async def main():
+        server = EventBusServer(path)
+        await server.start()
+        if client:
+            threading.Thread(target=client.run, daemon=True).start()
+            await wait_for_peer(server)
+        try:
+            return await scenario(server)
+        finally:
+            if client:
+                client.stop()
+            await server.close()
+    return asyncio.run(main())
+
+
+def test_request_gets_reply_after_handler_runs(tmp_path):
+    client = EventBusClient(str(tmp_path / 'bus.sock'), retry_interval=0.01)
+    received = []
+    client.on('session_created')(received.append)
+    reply = run_with_client(client.path, client, lambda server: server.request('session_created', {'session_id': 'abc'}, 2))
+    assert reply == {'ok': True, 'error': None}
+    assert received == [{'session_id': 'abc'}]
+
+
+def test_request_reports_handler_failure(tmp_path):
+    client = EventBusClient(str(tmp_path / 'bus.sock'), retry_interval=0.01)
+
+    @client.on('session_created')
+    def broken(data):
+        raise KeyError('participants')
+
+    reply = run_with_client(client.path, client, lambda server: server.request('session_created', {}, 2))
+    assert reply['ok'] is False and 'participants' in reply['error']
+
+
+def test_request_without_handler_is_not_ok(tmp_path):
+    client = EventBusClient(str(tmp_path / 'bus.sock'), retry_interval=0.01)
+    reply = run_with_client(client.path, client, lambda server: server.request('session_created', {}, 2))
+    assert reply['ok'] is False
+
+
+def test_request_times_out_when_peer_never_replies(tmp_path):
+    path = str(tmp_path / 'bus.sock')
+
+    async def scenario(server):
+        # 연결만 하고 아무것도 읽지 않는 웹 워커
+        silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        await asyncio.get_running_loop().run_in_executor(None, silent.connect, path)
+        try:
+            await wait_for_peer(server)
+            return await server.request('session_created', {}, 0.1), server._pending
+        finally:
+            silent.close()
+
+    reply, pending = run_with_client(path, None, scenario)
+    assert reply is None
+    assert pending == {}
+
+
+def test_request_without_peers_returns_none(tmp_path):
+    reply = run_with_client(str(tmp_path / 'bus.sock'), None, lambda server: server.request('session_created', {}, 0.1))
+    assert reply is None
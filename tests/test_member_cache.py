@@ -0,0 +1,97 @@
+"""멤버 표시 이름/티어 캐시"""
+import asyncio
+from types import SimpleNamespace
+
+from bot.utils.member_cache import UNKNOWN_MEMBER, MemberCache
+
+
+def make_member(guild, member_id, display_name):
+    return SimpleNamespace(guild=guild, id=member_id, display_name=display_name)
+
+
+class FakeGuild:
+    def __init__(self, guild_id=1, cached=(), remote=()):
+        self.id = guild_id
+        self.members = {member_id: make_member(self, member_id, name) for member_id, name in cached}
+        self.remote = {member_id: make_member(self, member_id, name) for member_id, name in remote}
+        self.fetched = []
+
+    def get_member(self, member_id):
+        return self.members.get(member_id)
+
+    async def fetch_member(self, member_id):
+        self.fetched.append(member_id)
+        await asyncio.sleep(0)
+        if member_id not in self.remote:
+            raise LookupError(member_id)
+        return self.remote[member_id]
+
+
+def test_nickname_is_parsed_once_until_it_changes():
+    cache = MemberCache()
+    guild = FakeGuild()
+    member = make_member(guild, 10, '나비/d2/미드')
+    info = cache.update(member)
+    assert (info.tier, info.sort_key) == ('d', 4)
+    assert cache.update(member) is info
+
+    member.display_name = '나비/gm/미드'
+    assert cache.update(member).tier == 'gm'
+    assert len(cache) == 1
+
+
+def test_get_falls_back_to_guild_member_cache():
+    cache = MemberCache()
+    guild = FakeGuild(cached=[(10, '철수/s1')])
+    assert cache.get(guild, 10).tier == 's'
+    assert cache.get(guild, 99) is UNKNOWN_MEMBER
+    assert cache.display_name(guild, 99) is None
+    assert cache.display_name(guild, 10) == '철수/s1'
+
+
+def test_unparseable_nickname_sorts_last():
+    info = MemberCache().update(make_member(FakeGuild(), 1, '닉네임만'))
+    assert info.tier == 'unknown' and info.sort_key == float('inf')
+
+
+def test_resolve_fetches_only_missing_members():
+    cache = MemberCache()
+    guild = FakeGuild(cached=[(1, 'a/g')], remote=[(2, 'b/p')])
+    infos = asyncio.run(cache.resolve(guild, [1, 2, 3]))
+    assert [info.tier for info in infos] == ['g', 'p', 'unknown']
+    assert sorted(guild.fetched) == [2, 3]
+
+    guild.fetched.clear()
+    asyncio.run(cache.resolve(guild, [1, 2]))
+    assert guild.fetched == []
+
+
+def test_resolve_members_returns_none_for_unknown():
+    cache = MemberCache()
+    guild = FakeGuild(cached=[(1, 'a/g')], remote=[(2, 'b/p')])
+    members = asyncio.run(cache.resolve_members(guild, [1, 2, 3]))
+    assert [member.id if member else None for member in members] == [1, 2, None]
+    assert cache.get(guild, 2).tier == 'p'
+
+
+def test_member_events_update_and_evict():
+    class FakeBot:
+        def __init__(self):
+            self.listeners = {}
+
+        def add_listener(self, listener):
+            self.listeners[listener.__name__] = listener
+
+    cache = MemberCache()
+    bot = FakeBot()
+    cache.register(bot)
+    guild = FakeGuild()
+    member = make_member(guild, 5, 'x/b')
+
+    asyncio.run(bot.listeners['on_member_join'](member))
+    assert cache.get(guild, 5).tier == 'b'
+    renamed = make_member(guild, 5, 'x/i')
+    asyncio.run(bot.listeners['on_member_update'](member, renamed))
+    assert cache.get(guild, 5).tier == 'i'
+    asyncio.run(bot.listeners['on_member_remove'](renamed))
+    assert len(cache) == 0
@@ -0,0 +1,95 @@
+"""채널별 활동 메시지 묶음 전송"""
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from bot.utils import message_coalescer
+from bot.utils.message_coalescer import MAX_MESSAGE_LENGTH, MessageCoalescer, coalescer_for, coalescer_stats
+
+
+def http_error(status):
+    return discord.HTTPException(SimpleNamespace(status=status, reason='error'), 'error')
+
+
+class FakeChannel:
+    def __init__(self, channel_id=1, fail_with=None):
+        self.id = channel_id
+        self.sent = []
+        self.fail_with = list(fail_with or [])
+
+    async def send(self, content=None, **kwargs):
+        if self.fail_with:
+            raise self.fail_with.pop(0)
+        self.sent.append(content)
+        return content
+
+
+def test_lines_are_sent_as_one_digest():
+    async def main():
+        channel = FakeChannel()
+        coalescer = MessageCoalescer(channel, interval=0.01)
+        for name in ('a', 'b', 'c'):
+            coalescer.add(f"✅ {name} 참가")
+        await asyncio.sleep(0.05)
+        return channel, coalescer
+
+    channel, coalescer = asyncio.run(main())
+    assert channel.sent == ["✅ a 참가\n✅ b 참가\n✅ c 참가"]
+    assert (coalescer.digests_sent, coalescer.lines_sent, coalescer.queued) == (1, 3, 0)
+
+
+def test_digest_is_split_at_message_limit():
+    channel = FakeChannel()
+    coalescer = MessageCoalescer(channel)
+    line = 'x' * 600
+    coalescer._lines.extend([line] * 4)
+    asyncio.run(coalescer.flush())
+    assert [message.count('x') for message in channel.sent] == [1800, 600]
+    assert all(len(message) <= MAX_MESSAGE_LENGTH for message in channel.sent)
+
+
+def test_overlong_line_is_truncated():
+    channel = FakeChannel()
+    coalescer = MessageCoalescer(channel)
+    coalescer._lines.append('y' * (MAX_MESSAGE_LENGTH + 10))
+    asyncio.run(coalescer.flush())
+    assert channel.sent == ['y' * MAX_MESSAGE_LENGTH]
+
+
+def test_rate_limited_batch_is_kept_for_next_flush():
+    channel = FakeChannel(fail_with=[http_error(429)])
+    coalescer = MessageCoalescer(channel)
+    coalescer._lines.extend(['a', 'b'])
+    before = dict(message_coalescer._totals)
+
+    asyncio.run(coalescer.flush())
+    assert channel.sent == [] and list(coalescer._lines) == ['a', 'b']
+    assert coalescer.rate_limited == 1
+    assert message_coalescer._totals['rate_limited'] == before['rate_limited'] + 1
+
+    asyncio.run(coalescer.flush())
+    assert channel.sent == ['a\nb']
+
+
+def test_other_errors_drop_the_batch():
+    channel = FakeChannel(fail_with=[http_error(403)])
+    coalescer = MessageCoalescer(channel)
+    coalescer._lines.extend(['a', 'b'])
+    asyncio.run(coalescer.flush())
+    assert coalescer.queued == 0 and coalescer.rate_limited == 0
+
+
+def test_coalescer_is_shared_per_channel_and_stats_survive_cleanup():
+    channel = FakeChannel(channel_id=4242)
+    coalescer = coalescer_for(channel)
+    assert coalescer_for(channel) is coalescer
+    coalescer._lines.append('a')
+    assert coalescer_stats()['queued'] >= 1
+
+    before = coalescer_stats()['lines_sent']
+    asyncio.run(coalescer.flush())
+    del coalescer
+    assert 4242 not in message_coalescer._coalescers
+    stats = coalescer_stats()
+    assert stats['lines_sent'] == before + 1
@@ -0,0 +1,78 @@
+"""포지션 선택 소켓 핸들러 - 요청자 신원은 로그인 세션에서만"""
+import pytest
+
+from web.app_enhanced import app, socketio, session_store, new_game_state
+
+HOST = {'id': '1', 'username': 'host', 'display_name': '방장'}
+
+
+def make_participants():
+    return [{'discord_id': str(i), 'username': f'p{i}', 'display_name': f'p{i}'} for i in range(1, 11)]
+
+
+@pytest.fixture
+def session_id():
+    session_id = 'test_positions'
+    participants = make_participants()
+    session_store.create(session_id, {
+        'participants': participants, 'created_by': HOST['id'], 'title': '테스트'
+    }, new_game_state(participants))
+    yield session_id
+    session_store.delete(session_id)
+
+
+def connect(user):
+    flask_client = app.test_client()
+    if user is not None:
+        with flask_client.session_transaction() as flask_session:
+            flask_session['user'] = user
+    return socketio.test_client(app, flask_test_client=flask_client)
+
+
+def rejected_codes(client):
+    return [event['args'][0]['code'] for event in client.get_received() if event['name'] == 'action_rejected']
+
+
+def test_select_position_uses_session_identity(session_id):
+    client = connect({'id': '2', 'username': 'p2', 'display_name': 'p2'})
+    client.emit('select_position', {'session_id': session_id, 'team': 'blue', 'position': 'TOP',
+                                    'discord_id': '9', 'user_name': '사칭'})
+    state = session_store.get_state(session_id)
+    assert state['player_slots'] == {'2': ['blue', 'TOP']}
+    assert state['teams']['blue']['TOP'] == 'p2'
+
+
+def test_leave_position_ignores_client_discord_id(session_id):
+    connect({'id': '2', 'display_name': 'p2'}).emit(
+        'select_position', {'session_id': session_id, 'team': 'blue', 'position': 'TOP'})
+    connect({'id': '3', 'display_name': 'p3'}).emit(
+        'leave_position', {'session_id': session_id, 'discord_id': '2'})
+    assert session_store.get_state(session_id)['player_slots'] == {'2': ['blue', 'TOP']}
+
+
+def test_anonymous_requests_are_rejected(session_id):
+    client = connect(None)
+    client.emit('select_position', {'session_id': session_id, 'team': 'blue', 'position': 'TOP', 'discord_id': '2'})
+    client.emit('submit_role_preferences', {'session_id': session_id, 'discord_id': '2', 'preferences': ['MID']})
+    assert rejected_codes(client) == ['not_logged_in', 'not_logged_in']
+    assert session_store.get_state(session_id)['player_slots'] == {}
+
+
+def test_preferences_are_stored_under_session_user(session_id):
+    client = connect({'id': '4', 'display_name': 'p4'})
+    client.emit('submit_role_preferences', {'session_id': session_id, 'discord_id': '5', 'preferences': ['mid', 'TOP']})
+    assert session_store.get_state(session_id)['role_preferences'] == {'4': ['MID', 'TOP']}
+
+    outsider = connect({'id': '99', 'display_name': '구경꾼'})
+    outsider.emit('submit_role_preferences', {'session_id': session_id, 'preferences': ['MID']})
+    assert rejected_codes(outsider) == ['not_participant']
+
+
+def test_only_host_can_auto_assign(session_id):
+    player = connect({'id': '2', 'display_name': 'p2'})
+    player.emit('auto_assign_roles', {'session_id': session_id})
+    assert rejected_codes(player) == ['not_host']
+    assert session_store.get_state(session_id)['player_slots'] == {}
+
+    connect(HOST).emit('auto_assign_roles', {'session_id': session_id})
+    assert len(session_store.get_state(session_id)['player_slots']) == 10
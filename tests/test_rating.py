@@ -0,0 +1,46 @@
+"""팀 Elo - 대칭성, 전체 재계산"""
+import pytest
+
+from shared.rating import INITIAL_RATING, compute_ratings, expected_score, rating_delta
+
+
+def test_expected_score_is_symmetric():
+    assert expected_score(1000, 1000) == pytest.approx(0.5)
+    assert expected_score(1200, 1000) + expected_score(1000, 1200) == pytest.approx(1.0)
+
+
+def test_delta_is_zero_sum_between_outcomes():
+    blue, red = [1100.0] * 5, [1000.0] * 5
+    win = rating_delta(blue, red, True)
+    loss = rating_delta(blue, red, False)
+    assert win > 0 > loss
+    assert win - loss == pytest.approx(32.0)
+    assert rating_delta(red, blue, True) == pytest.approx(-loss)
+
+
+def test_replay_matches_sequential_updates():
+    # 경기 1: 1~2(블루) vs 3~4(레드), 블루 승 / 경기 2: 1,3(블루) vs 2,4(레드), 레드 승
+    games = [(1, [1, 2], [3, 4], True), (2, [1, 3], [2, 4], False)]
+    game_ids, player_ids, on_blue, blue_won = [], [], [], []
+    for game_id, blue, red, won in games:
+        for player_id in blue + red:
+            game_ids.append(game_id)
+            player_ids.append(player_id)
+            on_blue.append(player_id in blue)
+            blue_won.append(won)
+
+    ratings = {player_id: INITIAL_RATING for player_id in (1, 2, 3, 4)}
+    for _, blue, red, won in games:
+        delta = rating_delta([ratings[p] for p in blue], [ratings[p] for p in red], won)
+        for p in blue:
+            ratings[p] += delta
+        for p in red:
+            ratings[p] -= delta
+
+    replayed = compute_ratings(game_ids, player_ids, on_blue, blue_won)
+    assert replayed == pytest.approx(ratings)
+    assert sum(replayed.values()) == pytest.approx(4 * INITIAL_RATING)
+
+
+def test_empty_history():
+    assert compute_ratings([], [], [], []) == {}
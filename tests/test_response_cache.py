@@ -0,0 +1,65 @@
+"""응답 캐시 - 압축 본문, ETag, 앞뒤 조각 이어 붙이기"""
+import json
+import zlib
+
+import pytest
+from flask import Flask
+
+from web.api.response_cache import ResponseCache, cached_response, encode_payload, spliced_response
+
+CHAMPIONS = [{'id': i, 'english_name': f'Champ{i}', 'korean_name': f'챔피언{i}'} for i in range(100)]
+
+
+def gunzip_single_member(data):
+    """브라우저처럼 첫 gzip 멤버만 푼다 - 뒤에 남는 데이터가 있으면 실패"""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    body = decompressor.decompress(data)
+    assert decompressor.eof and decompressor.unused_data == b''
+    return body
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+def test_small_body_is_not_compressed():
+    payload = encode_payload({'a': 1})
+    assert payload.gzip_body is None and payload.deflate_body is None
+
+
+def test_cached_gzip_body_is_one_member():
+    payload = encode_payload(CHAMPIONS)
+    assert gunzip_single_member(payload.gzip_body) == payload.body
+
+
+def test_cache_builds_once_per_key():
+    cache = ResponseCache(max_entries=1)
+    calls = []
+    build = lambda: calls.append(1) or CHAMPIONS
+    assert cache.get('a', build) is cache.get('a', build)
+    cache.get('b', build)
+    cache.get('a', build)
+    assert len(calls) == 3 and cache.stats()['entries'] == 1
+
+
+def test_if_none_match_returns_304(app):
+    payload = encode_payload(CHAMPIONS, etag='v1')
+    with app.test_request_context(headers={'If-None-Match': 'W/"v1"'}):
+        assert cached_response(payload).status_code == 304
+    with app.test_request_context(headers={'If-None-Match': 'W/"v0"'}):
+        response = cached_response(payload)
+        assert response.status_code == 200 and response.get_data() == payload.body
+
+
+def test_spliced_gzip_is_one_member(app):
+    payload = encode_payload(CHAMPIONS)
+    prefix, suffix = b'{"session_id":"abc","champions":', b',"status":"active"}'
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = spliced_response(prefix, payload, suffix, 'etag-abc')
+        assert response.headers['Content-Encoding'] == 'gzip'
+        body = gunzip_single_member(response.get_data())
+    assert json.loads(body) == {'session_id': 'abc', 'champions': CHAMPIONS, 'status': 'active'}
+
+    with app.test_request_context():
+        assert spliced_response(prefix, payload, suffix, 'etag-abc').get_data() == body
@@ -0,0 +1,54 @@
+"""포지션 자동 배정 - 선호 비용"""
+import pytest
+
+from shared.constants import POSITIONS
+from shared.role_assignment import (
+    PREFERENCE_COSTS, PositionError, assign_roles, normalize_preferences, place_player, remove_player
+)
+from shared.team_balancer import BalancePlayer
+
+
+def make_players():
+    return [BalancePlayer(str(i), f'p{i}', tier='g') for i in range(10)]
+
+
+def test_everyone_gets_first_choice_when_possible():
+    players = make_players()
+    preferences = {player.discord_id: [POSITIONS[i % 5]] for i, player in enumerate(players)}
+    result = assign_roles(players, preferences)
+    assert result.preference_cost == 0
+    for team in ('blue', 'red'):
+        for position, player in result.lineup[team].items():
+            assert preferences[player.discord_id][0] == position
+
+
+def test_preference_cost_counts_lower_choices():
+    players = make_players()
+    # 모두 TOP 1지망, JUG 2지망 - TOP은 팀당 한 자리뿐
+    preferences = {player.discord_id: ['TOP', 'JUG'] for player in players}
+    result = assign_roles(players, preferences)
+    expected = 2 * (PREFERENCE_COSTS[0] + PREFERENCE_COSTS[1] + 3 * 10)
+    assert result.preference_cost == expected
+
+
+def test_requires_ten_players():
+    with pytest.raises(PositionError) as error:
+        assign_roles(make_players()[:9], {})
+    assert error.value.code == 'player_count'
+
+
+def test_normalize_preferences():
+    assert normalize_preferences(['top', 'Mid', 'TOP']) == ['TOP', 'MID']
+    with pytest.raises(PositionError):
+        normalize_preferences(['JUNGLE'])
+
+
+def test_place_and_remove_player_keep_index_in_sync():
+    state = {'teams': {team: {position: None for position in POSITIONS} for team in ('blue', 'red')}}
+    assert place_player(state, '1', 'a', 'blue', 'TOP') is None
+    assert place_player(state, '1', 'a', 'red', 'MID') == ['blue', 'TOP']
+    assert state['teams']['blue']['TOP'] is None
+    with pytest.raises(PositionError):
+        place_player(state, '2', 'b', 'red', 'MID')
+    assert remove_player(state, '1') == ['red', 'MID']
+    assert state['teams']['red']['MID'] is None and state['player_slots'] == {}
@@ -0,0 +1,65 @@
+"""세션 저장소 - 원자적 수정, LRU/유휴 시간 제거"""
+import pytest
+
+from shared.session_store import MemorySessionStore, SQLiteSessionStore, SessionNotFound
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def make_store(request, tmp_path):
+    def make(**limits):
+        if request.param == 'memory':
+            return MemorySessionStore(**limits)
+        return SQLiteSessionStore(str(tmp_path / 'sessions.db'), **limits)
+    return make
+
+
+def test_update_state_bumps_version(make_store):
+    store = make_store()
+    store.create('a', {}, {'count': 0})
+    assert store.update_state('a', lambda state: state.update(count=state['count'] + 1)) is None
+    state = store.get_state('a')
+    assert state['count'] == 1 and state['version'] == 1
+
+
+def test_failed_update_leaves_state_unchanged(make_store):
+    store = make_store()
+    store.create('a', {}, {'nested': {'items': [1]}})
+
+    def mutate(state):
+        state['nested']['items'].append(2)
+        raise ValueError('reject')
+
+    with pytest.raises(ValueError):
+        store.update_state('a', mutate)
+    state = store.get_state('a')
+    assert state['nested']['items'] == [1] and state['version'] == 0
+
+
+def test_update_unknown_session_raises(make_store):
+    with pytest.raises(SessionNotFound):
+        make_store().update_state('missing', lambda state: None)
+
+
+def test_lru_evicts_least_recently_used(make_store):
+    evicted = []
+    store = make_store(max_sessions=2, on_evict=lambda session_id, data, state: evicted.append(session_id))
+    store.create('a', {}, {})
+    store.create('b', {}, {})
+    store.touch('a')
+    store.create('c', {}, {})
+    assert evicted == ['b']
+    assert set(store.session_ids()) == {'a', 'c'}
+    assert store.evicted['lru'] == 1
+
+
+def test_sweep_removes_idle_sessions(make_store, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('shared.session_store.time.time', lambda: clock[0])
+    store = make_store(idle_ttl=60)
+    store.create('old', {}, {})
+    clock[0] += 50
+    store.create('new', {}, {})
+    clock[0] += 20
+    assert store.sweep() == 1
+    assert 'old' not in store and 'new' in store
+    assert store.evicted['idle'] == 1
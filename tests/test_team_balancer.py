@@ -0,0 +1,44 @@
+"""팀 밸런스 - 126가지 분할"""
+import itertools
+
+import numpy as np
+import pytest
+
+from shared.team_balancer import BalancePlayer, balance_teams, player_strengths, split_masks
+
+
+def test_split_masks_cover_each_split_once():
+    masks = split_masks(10)
+    assert masks.shape == (126, 10)
+    assert masks[:, 0].all()
+    assert (masks.sum(axis=1) == 5).all()
+    assert len({tuple(row) for row in masks.tolist()}) == 126
+
+
+def test_balance_matches_brute_force():
+    rng = np.random.default_rng(7)
+    players = [
+        BalancePlayer(str(i), f'p{i}', tier='g', rating=float(rating))
+        for i, rating in enumerate(rng.integers(600, 1400, size=10))
+    ]
+    strengths = player_strengths(players)
+    best = min(
+        abs(strengths[list(blue)].sum() - (strengths.sum() - strengths[list(blue)].sum()))
+        for blue in itertools.combinations(range(10), 5)
+    )
+
+    [split] = balance_teams(players, top_k=1)
+    assert split.difference == pytest.approx(best)
+    assert len(split.blue) == len(split.red) == 5
+    assert {p.discord_id for p in split.blue + split.red} == {p.discord_id for p in players}
+
+
+def test_unknown_tier_uses_room_average():
+    players = [BalancePlayer('1', 'a', tier='c'), BalancePlayer('2', 'b', tier='i'), BalancePlayer('3', 'c')]
+    strengths = player_strengths(players)
+    assert strengths[2] == pytest.approx((strengths[0] + strengths[1]) / 2)
+
+
+def test_odd_player_count_rejected():
+    with pytest.raises(ValueError):
+        balance_teams([BalancePlayer(str(i), str(i)) for i in range(3)])
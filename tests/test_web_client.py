@@ -0,0 +1,141 @@
+"""봇 -> 웹서버 HTTP 클라이언트 - 회로 차단기와 재시도"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from bot.utils import web_client as web_client_module
+from bot.utils.web_client import CircuitBreaker, WebClient, WebServerUnavailable
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(web_client_module.time, 'monotonic', clock)
+    return clock
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == 'closed' and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+
+def test_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.state == 'half_open'
+    assert breaker.allow()
+    assert not breaker.allow()  # 시험 요청이 끝나기 전에는 하나만
+
+    breaker.record_failure()  # 시험 실패 - 다시 차단 시간 시작
+    assert breaker.state == 'open'
+    clock.now += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.failures == 0
+
+
+def test_released_trial_can_be_retried(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    breaker.release_trial()
+    assert breaker.allow()
+
+
+def serve(handler, scenario):
+    """handler 하나만 있는 로컬 웹서버를 띄우고 scenario(base_url) 실행"""
+    async def main():
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(f'http://127.0.0.1:{port}')
+        finally:
+            await runner.cleanup()
+    return asyncio.run(main())
+
+
+def test_server_errors_are_retried_then_reported(monkeypatch):
+    monkeypatch.setattr(web_client_module, 'RETRY_BASE_DELAY', 0)
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        return web.Response(status=503)
+
+    async def scenario(base_url):
+        client = WebClient(base_url, timeout=5, retries=2)
+        try:
+            with pytest.raises(WebServerUnavailable):
+                await client.post_json('/api/session/create', {})
+            return client
+        finally:
+            await client.close()
+
+    client = serve(handler, scenario)
+    assert len(calls) == 3
+    assert client.failures == 3 and client.breaker.failures == 1
+
+
+def test_client_errors_are_returned_without_retry():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        return web.json_response({'error': 'bad'}, status=400)
+
+    async def scenario(base_url):
+        client = WebClient(base_url, timeout=5, retries=2)
+        try:
+            return await client.get_json('/api/health')
+        finally:
+            await client.close()
+
+    response = serve(handler, scenario)
+    assert (response.status, response.data, response.ok) == (400, {'error': 'bad'}, False)
+    assert calls == ['/api/health']
+
+
+def test_open_breaker_fails_without_connecting():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        return web.Response(status=500)
+
+    async def scenario(base_url):
+        client = WebClient(base_url, timeout=5, retries=0)
+        client.breaker.failure_threshold = 2
+        try:
+            for _ in range(2):
+                with pytest.raises(WebServerUnavailable):
+                    await client.get_json('/api/health')
+            with pytest.raises(WebServerUnavailable, match='회로 차단'):
+                await client.get_json('/api/health')
+            return client.stats()
+        finally:
+            await client.close()
+
+    stats = serve(handler, scenario)
+    assert len(calls) == 2
+    assert stats['circuit'] == 'open' and stats['requests'] == 2
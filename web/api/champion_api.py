@@ -1,52 +1,55 @@
-"""챔피언 데이터 API"""
+"""챔피언 데이터 API
+
+챔피언 데이터는 프로세스 카탈로그 캐시(shared.champion_catalog)에서 제공한다.
+"""
 from flask import Blueprint, jsonify, request
-from database.connection import SessionLocal
-from database.champion_models import Champion
+from shared.champion_catalog import champion_catalog
+from shared.champion_search import champion_search
+from web.api.response_cache import response_cache, cached_response
 
 champion_bp = Blueprint('champion', __name__)
 
+# 검색 결과 개수 상한 (limit 쿼리 값은 1 ~ MAX_SEARCH_LIMIT로 제한)
+MAX_SEARCH_LIMIT = 50
+
 @champion_bp.route('/api/champions', methods=['GET'])
 def get_all_champions():
-    """모든 챔피언 목록 조회"""
-    db = SessionLocal()
-    try:
-        champions = db.query(Champion).order_by(Champion.korean_name).all()
-        return jsonify([champ.to_dict() for champ in champions])
-    finally:
-        db.close()
+    """모든 챔피언 목록 조회 (한글 이름순)"""
+    catalog = champion_catalog.get()
+    payload = response_cache.get(
+        ('champions', catalog.etag),
+        lambda: sorted((dict(champ) for champ in catalog.champions), key=lambda champ: champ['korean_name']),
+        etag=catalog.etag
+    )
+    return cached_response(payload)
 
 @champion_bp.route('/api/champions/search', methods=['GET'])
 def search_champions():
-    """챔피언 검색"""
+    """챔피언 검색 (메모리 인덱스 - 이름 접두어/중간 일치, 초성 검색 지원)"""
     query = request.args.get('q', '').strip()
     
     if not query:
         return jsonify([])
     
-    db = SessionLocal()
-    try:
-        champions = db.query(Champion).filter(
-            (Champion.korean_name.contains(query)) |
-            (Champion.english_name.ilike(f'%{query}%'))
-        ).order_by(Champion.korean_name).all()
-        
-        return jsonify([champ.to_dict() for champ in champions])
-    finally:
-        db.close()
+    limit = max(1, min(request.args.get('limit', 20, type=int), MAX_SEARCH_LIMIT))
+    champions = champion_search.search(query, limit=limit)
+    return jsonify([dict(champ) for champ in champions])
 
 @champion_bp.route('/api/champions/<champion_name>', methods=['GET'])
 def get_champion_by_name(champion_name):
-    """특정 챔피언 정보 조회"""
-    db = SessionLocal()
-    try:
-        champion = db.query(Champion).filter(
-            (Champion.korean_name == champion_name) |
-            (Champion.english_name.ilike(champion_name))
-        ).first()
-        
-        if champion:
-            return jsonify(champion.to_dict())
-        else:
-            return jsonify({'error': 'Champion not found'}), 404
-    finally:
-        db.close()
+    """특정 챔피언 정보 조회 (한글 이름 또는 영문 이름, 대소문자 무시)"""
+    catalog = champion_catalog.get()
+    champion = catalog.by_name.get(champion_name)
+    
+    if champion is None:
+        english_name = champion_name.lower()
+        champion = next(
+            (champ for champ in catalog.champions
+             if champ['korean_name'] == champion_name or champ['english_name'].lower() == english_name),
+            None
+        )
+    
+    if champion:
+        return jsonify(dict(champion))
+    else:
+        return jsonify({'error': 'Champion not found'}), 404
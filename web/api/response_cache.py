@@ -0,0 +1,137 @@
+"""미리 인코딩/압축해 둔 JSON 응답 캐시
+
+읽기 전용 API(챔피언 목록 등)의 응답 본문을 msgspec으로 한 번만 인코딩하고
+gzip 본문도 함께 보관한다. 요청 처리는 캐시 조회 + 바이트 복사뿐이다.
+캐시 키에 데이터 버전(카탈로그 ETag 등)을 넣으므로 무효화 없이 새 버전이
+새 항목으로 들어가고, 오래된 항목은 LRU로 밀려난다.
+"""
+import hashlib
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+import msgspec
+from flask import current_app, request
+
+# 이보다 작은 본문은 압축 이득보다 비용이 커서 압축하지 않는다
+MIN_GZIP_SIZE = 512
+GZIP_LEVEL = 6
+
+# gzip 멤버 머리 (mtime=0, OS 알 수 없음) / 비어 있는 마지막 deflate 블록
+GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+FINAL_BLOCK = b'\x03\x00'
+
+_encoder = msgspec.json.Encoder()
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    body: bytes
+    gzip_body: Optional[bytes]
+    etag: str
+    deflate_body: Optional[bytes] = None  # 마지막 블록 표시 없이 바이트 경계에서 끝난 raw deflate 조각
+
+
+def deflate_segment(data: bytes, final: bool = False) -> bytes:
+    """raw deflate 조각 - final이 아니면 sync flush로 바이트 경계에서 끝나 뒤에 다른 조각을 이어 붙일 수 있다"""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def gzip_member(segments, crc: int, size: int) -> bytes:
+    """deflate 조각들을 하나의 gzip 멤버로 묶기 (마지막 조각은 final 블록으로 끝나야 한다)"""
+    return b''.join([GZIP_HEADER, *segments, struct.pack('<II', crc, size & 0xFFFFFFFF)])
+
+
+def encode_payload(data, etag: Optional[str] = None) -> CachedPayload:
+    """JSON 인코딩 + gzip 압축 (msgspec.Raw로 이미 인코딩된 조각을 끼워 넣을 수 있다)
+
+    bytes는 이미 완성된 본문으로 보고 그대로 압축만 한다 (CSS 등).
+    """
+    body = data if isinstance(data, bytes) else _encoder.encode(data)
+    gzip_body = deflate_body = None
+    if len(body) >= MIN_GZIP_SIZE:
+        deflate_body = deflate_segment(body)
+        gzip_body = gzip_member([deflate_body, FINAL_BLOCK], zlib.crc32(body), len(body))
+    return CachedPayload(body, gzip_body, etag or hashlib.sha1(body).hexdigest()[:16], deflate_body)
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], object], etag: Optional[str] = None) -> CachedPayload:
+        """캐시된 응답 본문 반환 (없으면 build() 결과를 인코딩해 저장)"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+
+        payload = encode_payload(build(), etag)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.misses += 1
+        return payload
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def cached_response(payload: CachedPayload, mimetype: str = 'application/json'):
+    """If-None-Match / Accept-Encoding에 맞춘 Flask 응답
+
+    gzip과 원본 본문이 같은 ETag를 쓰므로 약한(weak) ETag로 보낸다.
+    """
+    return _respond(lambda: payload.body, payload.gzip_body and (lambda: payload.gzip_body), payload.etag, mimetype)
+
+
+def spliced_response(prefix: bytes, payload: CachedPayload, suffix: bytes, etag: str,
+                     mimetype: str = 'application/json'):
+    """캐시된 본문 앞뒤에 요청마다 다른 작은 조각을 붙인 응답
+
+    큰 본문은 다시 인코딩/압축하지 않는다. gzip 응답은 앞뒤 조각만 따로 deflate해
+    캐시된 deflate 조각과 이어 붙인 하나의 gzip 멤버로 보낸다 (브라우저는 여러 멤버를
+    이어 붙인 gzip을 첫 멤버까지만 푼다). 요청마다 드는 추가 비용은 CRC32 계산뿐이다.
+    """
+    def gzip_body():
+        crc = zlib.crc32(suffix, zlib.crc32(payload.body, zlib.crc32(prefix)))
+        size = len(prefix) + len(payload.body) + len(suffix)
+        return gzip_member(
+            [deflate_segment(prefix), payload.deflate_body, deflate_segment(suffix, final=True)], crc, size
+        )
+
+    return _respond(
+        lambda: prefix + payload.body + suffix,
+        gzip_body if payload.deflate_body is not None else None,
+        etag, mimetype
+    )
+
+
+def _respond(body: Callable[[], bytes], gzip_body: Optional[Callable[[], bytes]], etag: str, mimetype: str):
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    elif gzip_body is not None and request.accept_encodings['gzip']:
+        response = current_app.response_class(gzip_body(), mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = current_app.response_class(body(), mimetype=mimetype)
+
+    response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+response_cache = ResponseCache()
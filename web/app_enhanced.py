@@ -10,15 +10,35 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from shared.config import Config
-from shared.database import Database
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from shared.database import Database, get_pool_stats
+from shared.champion_catalog import champion_catalog
+from shared.session_store import create_session_store, SessionNotFound, MemorySessionStore
+from shared.draft_engine import draft_engine, DraftError
+from shared.deadline_scheduler import DeadlineScheduler
+from shared.image_store import image_store, IMAGE_EXTENSIONS, ATLAS_JSON, ATLAS_CSS
+from shared.constants import POSITIONS
+from shared.event_bus import EventBusClient, SESSION_CREATED, DRAFT_PROGRESS, DRAFT_CONFIRMED
+from shared.team_balancer import balance_teams, build_players, load_player_stats
+from shared.rating import create_game_record
+from shared.role_assignment import (
+    PositionError, assign_roles, apply_assignment, normalize_preferences, place_player, remove_player
+)
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_file, abort
 from flask_socketio import SocketIO, emit, join_room, leave_room
+import functools
+import hashlib
 import json
+import signal
+import threading
+import time
 import uuid
 from datetime import datetime
 
 # OAuth 관련 import
 from web.auth.discord_oauth import DiscordOAuth
+from web.api.champion_api import champion_bp
+from web.api.response_cache import response_cache, cached_response, spliced_response
+import msgspec
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -26,14 +46,99 @@ app.config['SECRET_KEY'] = Config.SECRET_KEY
 app.config['SESSION_TYPE'] = 'filesystem'
 app.config['SESSION_PERMANENT'] = False
 
-socketio = SocketIO(app, cors_allowed_origins="*")
+# 여러 웹 워커로 실행할 때는 메시지 큐로 방 단위 이벤트를 공유한다
+socketio = SocketIO(app, cors_allowed_origins="*", message_queue=Config.SOCKETIO_MESSAGE_QUEUE)
+app.register_blueprint(champion_bp)
+
+@app.context_processor
+def inject_image_settings():
+    """템플릿 공통 값 - 더미 챔피언 이미지 CDN"""
+    return {'champion_image_cdn': Config.CHAMPION_IMAGE_CDN}
 
 # OAuth 초기화
 discord_oauth = DiscordOAuth()
 
-# 게임 세션 저장소
-game_sessions = {}
-game_states = {}
+ARCHIVE_QUERY = """
+    INSERT INTO game_sessions (session_id, channel_id, status, blue_team, red_team, ban_pick_data)
+    VALUES (%s, %s, 'completed', %s, %s, %s)
+    ON DUPLICATE KEY UPDATE status = VALUES(status), blue_team = VALUES(blue_team),
+        red_team = VALUES(red_team), ban_pick_data = VALUES(ban_pick_data)
+"""
+
+def archive_session(session_id, session_data, game_state):
+    """저장소에서 제거되는 세션 처리 - 끝난 드래프트는 DB에 보관"""
+    draft_timer.cancel(session_id)
+    if not Config.SESSION_ARCHIVE or game_state.get('phase') != 'completed':
+        return
+    
+    draft = game_state['draft']
+    result = Database().execute_query(ARCHIVE_QUERY, (
+        session_id,
+        str(session_data.get('channel_id', '')),
+        json.dumps(draft['lineup']['blue'], ensure_ascii=False),
+        json.dumps(draft['lineup']['red'], ensure_ascii=False),
+        json.dumps({'bans': draft['bans'], 'picks': draft['picks']}, ensure_ascii=False)
+    ))
+    if result is not None:
+        print(f"🗄️ 완료된 드래프트 보관: {session_id}")
+
+def session_sweeper():
+    """유휴 세션 주기적 정리 (백그라운드 작업)"""
+    while True:
+        socketio.sleep(Config.SESSION_SWEEP_INTERVAL)
+        try:
+            session_store.sweep()
+        except Exception as e:
+            print(f"❌ 세션 정리 실패: {e}")
+
+# 게임 세션 저장소 (SESSION_STORE 설정에 따라 메모리 또는 SQLite, 크기/유휴 시간 제한)
+session_store = create_session_store(on_evict=archive_session)
+
+class InflightTracker:
+    """처리 중인 소켓 이벤트 수 - 종료 시 진행 중인 이벤트가 끝날 때까지 기다린다"""
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.count = 0
+        self.draining = False
+    
+    def track(self, handler):
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            with self._cond:
+                if self.draining:
+                    emit('server_restarting', {})
+                    return None
+                self.count += 1
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                with self._cond:
+                    self.count -= 1
+                    self._cond.notify_all()
+        return wrapper
+    
+    def drain(self, timeout):
+        """새 이벤트를 막고 진행 중인 이벤트가 끝날 때까지 대기"""
+        with self._cond:
+            self.draining = True
+            return self._cond.wait_for(lambda: self.count == 0, timeout)
+
+inflight = InflightTracker()
+
+def new_game_state(participants):
+    """초기 게임 상태"""
+    return {
+        'phase': 'position_select',
+        'teams': {
+            'blue': {'TOP': None, 'JUG': None, 'MID': None, 'ADC': None, 'SUP': None},
+            'red': {'TOP': None, 'JUG': None, 'MID': None, 'ADC': None, 'SUP': None}
+        },
+        'draft': draft_engine.new_draft(),
+        'participants': participants,
+        'player_slots': {},       # discord_id -> [팀, 포지션] 역색인
+        'role_preferences': {}    # discord_id -> 선호 포지션 순위
+    }
 
 @app.route('/')
 def index():
@@ -112,41 +217,85 @@ def get_current_user():
     else:
         return jsonify({'error': 'Not authenticated'}), 401
 
+@app.route(f'{Config.CHAMPION_IMAGE_URL_PREFIX}<name>')
+def champion_image(name):
+    """로컬 챔피언 이미지 - 파일 이름이 내용 해시라 영구 캐시 가능"""
+    path = image_store.path_for(name)
+    if path is None:
+        abort(404)
+    
+    etag = name.rsplit('.', 1)[0]
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    elif path.exists():
+        response = send_file(path, mimetype=IMAGE_EXTENSIONS[path.suffix], etag=False, conditional=False)
+    else:
+        abort(404)
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+SPRITE_FILES = {'champions.json': (ATLAS_JSON, 'application/json'), 'champions.css': (ATLAS_CSS, 'text/css')}
+
+@app.route('/sprites/<name>')
+def champion_sprites(name):
+    """스프라이트 아틀라스 위치 정보 (shared/sprite_atlas.py가 생성)"""
+    if name not in SPRITE_FILES:
+        abort(404)
+    
+    file_name, mimetype = SPRITE_FILES[name]
+    path = image_store.root / file_name
+    try:
+        stamp = path.stat().st_mtime_ns
+    except OSError:
+        abort(404)
+    
+    payload = response_cache.get(('sprites', file_name, stamp), path.read_bytes)
+    return cached_response(payload, mimetype=mimetype)
+
+@app.route('/healthz')
+def healthz():
+    """준비 상태 확인 (실행기가 웹서버 시작 완료를 확인할 때 사용)"""
+    return jsonify({'status': 'ok', 'sessions': len(session_store)})
+
+@app.route('/api/stats')
+def get_server_stats():
+    """서버 내부 상태 통계"""
+    return jsonify({
+        'db_pool': get_pool_stats(),
+        'sessions': session_store.stats(),
+        'response_cache': response_cache.stats(),
+        'draft_timer': {'pending': draft_timer.pending(), 'fired': draft_timer.fired}
+    })
+
+def create_bot_session(data):
+    """봇이 보낸 세션 데이터 + 초기 게임 상태 저장"""
+    session_id = data['session_id']
+    session_store.create(session_id, {
+        'participants': data['participants'],
+        'channel_id': data['channel_id'],
+        'guild_id': data['guild_id'],
+        'created_by': data['created_by'],
+        'created_at': data['created_at'],
+        'title': data.get('title', '나비내전'),
+        'phase': 'lobby'
+    }, new_game_state(data['participants']))
+    print(f"✅ 세션 생성: {session_id} ({len(data['participants'])}명)")
+    return session_id
+
+# 봇과의 로컬 이벤트 버스 (봇이 없으면 HTTP API로 대체된다)
+event_bus = EventBusClient()
+
+@event_bus.on(SESSION_CREATED)
+def on_bus_session_created(data):
+    create_bot_session(data)
+
 @app.route('/api/session/create', methods=['POST'])
 def create_session():
-    """디스코드 봇에서 세션 생성 요청"""
+    """디스코드 봇에서 세션 생성 요청 (이벤트 버스가 끊겼을 때의 대체 경로)"""
     try:
-        data = request.get_json()
-        session_id = data['session_id']
-        
-        # 세션 데이터 저장
-        game_sessions[session_id] = {
-            'participants': data['participants'],
-            'channel_id': data['channel_id'],
-            'guild_id': data['guild_id'],
-            'created_by': data['created_by'],
-            'created_at': data['created_at'],
-            'title': data.get('title', '나비내전'),
-            'phase': 'lobby'
-        }
-        
-        # 게임 상태 초기화
-        game_states[session_id] = {
-            'phase': 'position_select',
-            'teams': {
-                'blue': {'TOP': None, 'JUG': None, 'MID': None, 'ADC': None, 'SUP': None},
-                'red': {'TOP': None, 'JUG': None, 'MID': None, 'ADC': None, 'SUP': None}
-            },
-            'draft': {
-                'bans': {'blue': [], 'red': []},
-                'picks': {'blue': [], 'red': []},
-                'currentTurn': 'blue_ban_1',
-                'timer': 30
-            },
-            'participants': data['participants']
-        }
-        
-        print(f"✅ 세션 생성: {session_id} ({len(data['participants'])}명)")
+        session_id = create_bot_session(request.get_json())
         return jsonify({'success': True, 'session_id': session_id})
     
     except Exception as e:
@@ -155,45 +304,26 @@ def create_session():
 
 @app.route('/api/session/<session_id>')
 def get_session(session_id):
-    """세션 정보 조회"""
-    try:
-        db = Database()
-        champions = db.fetch_all("SELECT * FROM champions ORDER BY english_name")
-        
-        return jsonify({
-            'session_id': session_id,
-            'champions': champions,
-            'status': 'active'
-        })
-    except Exception as e:
-        # 데이터베이스 연결 실패 시 더미 데이터 반환
-        dummy_champions = [
-            {
-                'english_name': 'Aatrox',
-                'korean_name': '아트록스',
-                'image_url': 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Aatrox.png'
-            },
-            {
-                'english_name': 'Ahri',
-                'korean_name': '아리',
-                'image_url': 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Ahri.png'
-            }
-        ]
-        
-        return jsonify({
-            'session_id': session_id,
-            'champions': dummy_champions,
-            'status': 'active'
-        })
+    """세션 정보 조회 (챔피언 목록은 프로세스 캐시에서 제공)"""
+    if session_id not in session_store:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    catalog = champion_catalog.get()
+    
+    # 챔피언 목록 본문은 카탈로그 버전마다 한 번만 인코딩/압축하고 세션 ID만 앞에 붙인다
+    payload = response_cache.get(('champions_json', catalog.etag), lambda: catalog.champions_json, etag=catalog.etag)
+    prefix = b'{"session_id":' + msgspec.json.encode(session_id) + b',"champions":'
+    etag = f"{catalog.etag}-{hashlib.sha1(session_id.encode()).hexdigest()[:8]}"
+    return spliced_response(prefix, payload, b',"status":"active"}', etag)
 
 @app.route('/api/session/<session_id>/users')
 def get_session_users(session_id):
     """세션의 유저 정보 반환"""
-    if session_id not in game_sessions:
+    session_data = session_store.get_session(session_id)
+    if session_data is None:
         return jsonify({'error': 'Session not found'}), 404
     
-    session_data = game_sessions[session_id]
-    game_state = game_states.get(session_id, {})
+    game_state = session_store.get_state(session_id) or {}
     
     return jsonify({
         'participants': session_data['participants'],
@@ -246,12 +376,61 @@ def cyber_test():
             <h1>🤖 CYBER DRAFT SYSTEM</h1>
             <p>>>> ACCESSING MAINFRAME <<<</p>
             <p>>>> LOADING NEURAL INTERFACE <<<</p>
-            <a href="/draft_cyber/cyber_test_123">🚀 ENTER THE MATRIX</a>
+            <a href="/cyber_test/start">🚀 ENTER THE MATRIX</a>
         </div>
     </body>
     </html>
     '''
 
+@app.route('/cyber_test/start')
+def cyber_test_start():
+    """테스트용 세션 생성 - 로그인한 유저 + 더미 9명, 바로 밴픽 단계"""
+    user = session.get('user')
+    
+    if not user:
+        return redirect(url_for('discord_login', next=request.url))
+    
+    session_id = f"cyber_test_{uuid.uuid4().hex[:8]}"
+    print(f"🧪 사이버 테스트용 세션 데이터 생성: {session_id}")
+    
+    # 현재 로그인된 유저 정보
+    current_user_info = {
+        'discord_id': user.get('id', 'current_user'),
+        'username': user.get('username', 'CurrentUser'),
+        'display_name': user.get('display_name', 'Current User'),
+        'avatar_url': user.get('avatar_url', 'https://cdn.discordapp.com/embed/avatars/0.png'),
+        'discriminator': user.get('discriminator', '0000')
+    }
+    
+    # 더미 참가자 데이터 (10명)
+    dummy_participants = [current_user_info]
+    for i in range(1, 10):
+        dummy_participants.append({
+            'discord_id': f'cyber_{i}',
+            'username': f'CyberUser{i}',
+            'display_name': f'사이버유저{i}',
+            'avatar_url': f'https://cdn.discordapp.com/embed/avatars/{i % 6}.png',
+            'discriminator': f'{2000 + i:04d}'
+        })
+    
+    # 참가자를 순서대로 자리에 앉히고 밴픽 단계로 시작
+    game_state = new_game_state(dummy_participants)
+    slots = [(team, position) for team in ('blue', 'red') for position in POSITIONS]
+    for participant, (team, position) in zip(dummy_participants, slots):
+        place_player(game_state, str(participant['discord_id']), participant['display_name'], team, position)
+    game_state['phase'] = 'draft'
+    
+    session_store.create(session_id, {
+        'participants': dummy_participants,
+        'channel_id': 'cyber_channel',
+        'guild_id': 'cyber_guild',
+        'created_by': current_user_info,
+        'created_at': datetime.now().isoformat(),
+        'title': '🤖 사이버 나비내전',
+        'phase': 'draft'
+    }, game_state)
+    return redirect(url_for('draft_cyber_page', session_id=session_id))
+
 @app.route('/draft_cyber/<session_id>')
 def draft_cyber_page(session_id):
     """사이버펑크 드래프트 페이지"""
@@ -260,56 +439,10 @@ def draft_cyber_page(session_id):
     if not user:
         return redirect(url_for('discord_login', next=request.url))
     
-    # 세션 데이터가 없으면 테스트용 더미 데이터 생성
-    if session_id not in game_sessions:
-        print(f"🧪 사이버 테스트용 세션 데이터 생성: {session_id}")
-        
-        # 현재 로그인된 유저 정보
-        current_user_info = {
-            'discord_id': user.get('id', 'current_user'),
-            'username': user.get('username', 'CurrentUser'),
-            'display_name': user.get('display_name', 'Current User'),
-            'avatar_url': user.get('avatar_url', 'https://cdn.discordapp.com/embed/avatars/0.png'),
-            'discriminator': user.get('discriminator', '0000')
-        }
-        
-        # 더미 참가자 데이터 (10명)
-        dummy_participants = [current_user_info]
-        for i in range(1, 10):
-            dummy_participants.append({
-                'discord_id': f'cyber_{i}',
-                'username': f'CyberUser{i}',
-                'display_name': f'사이버유저{i}',
-                'avatar_url': f'https://cdn.discordapp.com/embed/avatars/{i % 6}.png',
-                'discriminator': f'{2000 + i:04d}'
-            })
-        
-        # 세션 데이터 저장
-        game_sessions[session_id] = {
-            'participants': dummy_participants,
-            'channel_id': 'cyber_channel',
-            'guild_id': 'cyber_guild',
-            'created_by': current_user_info,
-            'created_at': datetime.now().isoformat(),
-            'title': '🤖 사이버 나비내전',
-            'phase': 'draft'
-        }
-        
-        # 게임 상태 초기화
-        game_states[session_id] = {
-            'phase': 'position_select',
-            'teams': {
-                'blue': {'TOP': None, 'JUG': None, 'MID': None, 'ADC': None, 'SUP': None},
-                'red': {'TOP': None, 'JUG': None, 'MID': None, 'ADC': None, 'SUP': None}
-            },
-            'draft': {
-                'bans': {'blue': [], 'red': []},
-                'picks': {'blue': [], 'red': []},
-                'currentTurn': 'blue_ban_1',
-                'timer': 30
-            },
-            'participants': dummy_participants
-        }
+    # 모르는 세션 ID로는 세션을 만들지 않는다 (무작위 URL이 진행 중인 드래프트를 밀어내지 않도록)
+    if session_id not in session_store:
+        abort(404)
+    session_store.touch(session_id)
     
     print(f"✅ 사이버 드래프트 접근: {user.get('display_name', 'Unknown')} -> {session_id}")
     return render_template('draft_cyber.html', session_id=session_id, user_info=user)
@@ -323,125 +456,335 @@ def on_connect():
 def on_disconnect():
     print(f"🔌 클라이언트 연결 해제: {request.sid}")
 
+def build_snapshot(session_id, discord_id=None):
+    """전체 상태 스냅샷 (입장/재동기화 때만 전송)"""
+    session_data = session_store.get_session(session_id)
+    if session_data is None:
+        return None
+    
+    game_state = dict(session_store.get_state(session_id) or {})
+    game_state.pop('participants', None)  # 참가자 목록은 아래에 한 번만 보낸다
+    
+    return {
+        'version': game_state.get('version', 0),
+        'game_state': game_state,
+        'participants': session_data.get('participants', []),
+        'current_user_discord_id': discord_id,
+        'server_time': time.time()
+    }
+
+def build_draft_delta(version, result, auto=False):
+    """밴/픽 1건에 대한 작은 변경 이벤트"""
+    return {
+        'v': version,
+        'op': result['action'],
+        'turn': result['turn'],
+        'team': result['team'],
+        'pos': result['position'],
+        'champ': result['champion_english'],
+        'next': result['next_turn'],
+        'deadline': result['deadline'],
+        'auto': auto,
+        'ts': time.time()
+    }
+
+def broadcast_draft_delta(session_id, delta):
+    """변경 이벤트 전송 후 다음 턴 마감 예약"""
+    socketio.emit('state_delta', delta, to=session_id)
+    event_bus.publish(DRAFT_PROGRESS, {
+        'session_id': session_id,
+        'op': delta['op'],
+        'team': delta['team'],
+        'champ': delta['champ'],
+        'next': delta['next'],
+        'completed': delta['next'] >= draft_engine.total_turns
+    })
+    
+    if delta['next'] >= draft_engine.total_turns:
+        draft_timer.cancel(session_id)
+        socketio.emit('draft_completed', {'session_id': session_id}, to=session_id)
+        print(f"🎉 드래프트 완료: {session_id}")
+    elif delta.get('deadline'):
+        draft_timer.schedule(session_id, delta['deadline'], delta['next'])
+
+# 드래프트 타이머 - 모든 세션의 턴 마감을 백그라운드 작업 하나가 관리
+def on_turn_expired(session_id, turn_index):
+    """턴 시간 초과 - 남은 챔피언 중 무작위로 자동 밴/픽 (남은 챔피언이 없으면 턴을 넘긴다)"""
+    champions = champion_catalog.get().champions
+    
+    def auto_action(state):
+        draft = state['draft']
+        turn = draft_engine.current_turn(draft)
+        if state.get('phase') != 'draft' or turn is None or turn.index != turn_index:
+            raise DraftError('stale_turn', '이미 지나간 턴입니다.')
+        
+        champion = draft_engine.random_available(draft, champions)
+        if champion is None:
+            result = draft_engine.skip(draft, turn_index, now=time.time())
+        else:
+            result = draft_engine.apply(
+                draft, turn.team_name, turn.action_name, champion, turn_index, now=time.time()
+            )
+        state['phase'] = 'completed' if result['completed'] else 'draft'
+        return build_draft_delta(state['version'], result, auto=True)
+    
+    try:
+        delta = session_store.update_state(session_id, auto_action)
+    except SessionNotFound:
+        return
+    except DraftError as e:
+        if e.code != 'stale_turn':
+            print(f"❌ 시간 초과 자동 처리 실패: {session_id} - {e.code}: {e.message}")
+        return
+    
+    print(f"⏰ 시간 초과 자동 {delta['op']}: {session_id} {delta['team']} - {delta['champ'] or '-'}")
+    broadcast_draft_delta(session_id, delta)
+
+draft_timer = DeadlineScheduler(
+    on_expire=on_turn_expired,
+    sleep=socketio.sleep,
+    spawn=socketio.start_background_task
+)
+
+def ensure_draft_clock(session_id):
+    """진행 중인 드래프트의 현재 턴 마감이 예약되어 있도록 보장 (밴픽 단계에서만)"""
+    state = session_store.get_state(session_id)
+    if state is None or state.get('phase') != 'draft' or draft_engine.is_completed(state['draft']):
+        return
+    
+    draft = state['draft']
+    if draft.get('deadline') is not None:
+        # 이미 시작된 시계 (재시작/다른 워커 이후) - 이 프로세스에 다시 예약
+        draft_timer.schedule(session_id, draft['deadline'], draft['turn'])
+        return
+    
+    def start_clock(state):
+        if state['draft'].get('deadline') is not None:
+            raise DraftError('clock_running', '이미 시작된 타이머입니다.')
+        draft_engine.start_clock(state['draft'], time.time())
+        return {
+            'v': state['version'],
+            'op': 'clock',
+            'next': state['draft']['turn'],
+            'deadline': state['draft']['deadline'],
+            'ts': time.time()
+        }
+    
+    try:
+        delta = session_store.update_state(session_id, start_clock)
+    except SessionNotFound:
+        return
+    except DraftError:
+        # 다른 요청이 먼저 시계를 시작함 - 그 마감으로 예약
+        return ensure_draft_clock(session_id)
+    
+    socketio.emit('state_delta', delta, to=session_id)
+    draft_timer.schedule(session_id, delta['deadline'], delta['next'])
+
 @socketio.on('join_session')
+@inflight.track
 def on_join_session(data):
     session_id = data['session_id']
     discord_id = data.get('discord_id')
     
     join_room(session_id)
     
-    # 현재 상태 전송
-    if session_id in game_sessions:
-        session_data = game_sessions[session_id]
-        game_state = game_states.get(session_id, {})
-        
-        emit('game_state_update', {
-            'game_state': game_state,
-            'participants': session_data.get('participants', []),
-            'current_user_discord_id': discord_id
-        })
+    # 첫 입장 시 밴픽 시계 시작 후 현재 상태 전송
+    session_store.touch(session_id)
+    ensure_draft_clock(session_id)
+    snapshot = build_snapshot(session_id, discord_id)
+    if snapshot is not None:
+        emit('game_state_update', snapshot)
     
     print(f"🎮 세션 참가: {discord_id} -> {session_id}")
 
-@app.route("/banpick/<session_id>")
-def banpick_page(session_id):
-    """밴픽 페이지 - 실제 내전용"""
-    user = session.get("user")
-    
-    if not user:
-        return redirect(url_for("discord_login", next=request.url))
+@socketio.on('request_resync')
+@inflight.track
+def on_request_resync(data):
+    """클라이언트가 버전 누락을 감지했을 때 전체 상태 재전송"""
+    snapshot = build_snapshot(data['session_id'], data.get('discord_id'))
+    if snapshot is not None:
+        emit('game_state_update', snapshot)
+
+@socketio.on('select_champion')
+@inflight.track
+def on_select_champion(data):
+    """밴/픽 요청 - 서버 엔진이 검증한 경우에만 반영"""
+    session_id = data.get('session_id')
+    champion = champion_catalog.get().by_name.get(data.get('champion_english'))
+    # 요청자는 클라이언트가 보낸 값이 아니라 로그인 세션으로 확인한다
+    discord_id = (session.get('user') or {}).get('id')
+    
+    def apply_action(state):
+        if state.get('phase') != 'draft':
+            raise DraftError('wrong_phase', '밴픽 단계가 아닙니다.')
+        slot = state.get('player_slots', {}).get(str(discord_id))
+        if slot is None:
+            raise DraftError('not_participant', '이 내전의 참가자만 밴/픽할 수 있습니다.')
+        result = draft_engine.apply(
+            state['draft'], data.get('team'), data.get('action'), champion, data.get('turn'),
+            now=time.time(), actor_team=slot[0]
+        )
+        state['phase'] = 'completed' if result['completed'] else 'draft'
+        return build_draft_delta(state['version'], result)
     
-    # 실제 게임 세션 확인
-    if session_id not in game_sessions:
-        # 실제 세션이 없으면 더미 데이터로 생성
-        print(f"🎮 실제 게임 세션 생성: {session_id}")
-        
-        # 더미 참가자 데이터 (10명)
-        dummy_participants = []
-        for i in range(10):
-            dummy_participants.append({
-                "discord_id": f"player_{i}",
-                "username": f"Player{i+1}",
-                "display_name": f"플레이어{i+1}",
-                "avatar_url": f"https://cdn.discordapp.com/embed/avatars/{i % 6}.png",
-                "discriminator": f"{1000 + i:04d}"
-            })
-        
-        # 게임 세션 데이터 생성
-        game_sessions[session_id] = {
-            "participants": dummy_participants,
-            "channel_id": "real_channel",
-            "guild_id": "real_guild",
-            "created_by": user,
-            "created_at": datetime.now().isoformat(),
-            "title": "🦋 나비내전",
-            "phase": "position_select"
-        }
-        
-        # 게임 상태 초기화
-        game_states[session_id] = {
-            "phase": "position_select",
-            "teams": {
-                "blue": {"TOP": None, "JUG": None, "MID": None, "ADC": None, "SUP": None},
-                "red": {"TOP": None, "JUG": None, "MID": None, "ADC": None, "SUP": None}
-            },
-            "draft": {
-                "bans": {"blue": [], "red": []},
-                "picks": {"blue": [], "red": []},
-                "currentTurn": "blue_ban_1",
-                "timer": 30
-            },
-            "participants": dummy_participants
-        }
+    try:
+        delta = session_store.update_state(session_id, apply_action)
+    except SessionNotFound:
+        emit('action_rejected', {'code': 'no_session', 'message': '세션을 찾을 수 없습니다.'})
+        return
+    except DraftError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        print(f"⛔ 밴픽 거부: {session_id} - {e.code}")
+        return
+    
+    print(f"🎯 챔피언 {delta['op']}: {delta['team']} - {delta['champ']} (v{delta['v']})")
+    broadcast_draft_delta(session_id, delta)
+
+def current_discord_id():
+    """소켓 요청을 보낸 로그인 사용자의 디스코드 id (클라이언트가 보낸 값은 믿지 않는다)"""
+    user = session.get('user') or {}
+    return str(user['id']) if user.get('id') else None
+
+def session_host_id(session_data):
+    """세션을 연 사람의 디스코드 id (봇 세션은 id 문자열, 웹 세션은 사용자 정보 dict)"""
+    host = session_data.get('created_by')
+    if isinstance(host, dict):
+        host = host.get('discord_id')
+    return str(host) if host else None
+
+def update_positions(session_id, mutate):
+    """포지션 선택 단계에서만 게임 상태 변경 (거절 사유는 PositionError)"""
+    def guarded(state):
+        if state.get('phase') != 'position_select':
+            raise PositionError('wrong_phase', '포지션 선택 단계가 아닙니다.')
+        return mutate(state)
     
-    print(f"✅ 밴픽 페이지 접근: {user.get("display_name", "Unknown")} -> {session_id}")
-    return render_template("banpick.html", session_id=session_id, user_info=user)
-
-@app.route("/draft_result/<session_id>")
-def draft_result_page(session_id):
-    """드래프트 결과 확인 페이지"""
-    user = session.get("user")
+    try:
+        return session_store.update_state(session_id, guarded)
+    except SessionNotFound:
+        raise PositionError('no_session', '세션을 찾을 수 없습니다.')
+
+@socketio.on('submit_role_preferences')
+@inflight.track
+def on_submit_role_preferences(data):
+    """선호 포지션 순위 제출 (예: ['MID', 'TOP'])"""
+    session_id = data.get('session_id')
+    discord_id = current_discord_id()
+    if discord_id is None:
+        emit('action_rejected', {'code': 'not_logged_in', 'message': '로그인이 필요합니다.'})
+        return
+    
+    session_data = session_store.get_session(session_id)
+    if session_data is None:
+        emit('action_rejected', {'code': 'no_session', 'message': '세션을 찾을 수 없습니다.'})
+        return
+    if discord_id not in {str(p.get('discord_id')) for p in session_data.get('participants', [])}:
+        emit('action_rejected', {'code': 'not_participant', 'message': '이 내전 참가자만 선호 포지션을 낼 수 있습니다.'})
+        return
+    
+    def save_preferences(state):
+        preferences = normalize_preferences(data.get('preferences'))
+        state.setdefault('role_preferences', {})[discord_id] = preferences
+        return len(state['role_preferences'])
     
+    try:
+        submitted = update_positions(session_id, save_preferences)
+    except PositionError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        return
+    
+    socketio.emit('role_preferences_updated', {'discord_id': discord_id, 'submitted': submitted}, to=session_id)
+
+@socketio.on('auto_assign_roles')
+@inflight.track
+def on_auto_assign_roles(data):
+    """제출된 선호와 팀 밸런스로 10명 배정을 한 번에 계산해 반영"""
+    session_id = data.get('session_id')
+    session_data = session_store.get_session(session_id)
+    game_state = session_store.get_state(session_id)
+    if session_data is None or game_state is None:
+        emit('action_rejected', {'code': 'no_session', 'message': '세션을 찾을 수 없습니다.'})
+        return
+    if current_discord_id() != session_host_id(session_data):
+        emit('action_rejected', {'code': 'not_host', 'message': '내전을 연 사람만 자동 배정할 수 있습니다.'})
+        return
+    
+    participants = session_data.get('participants', [])
+    players = build_players(participants, load_player_stats([p['discord_id'] for p in participants]))
+    try:
+        assignment = assign_roles(players, game_state.get('role_preferences', {}))
+        update_positions(session_id, lambda state: apply_assignment(state, assignment))
+    except PositionError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        return
+    
+    print(f"🧮 포지션 자동 배정: {session_id} (선호 비용 {assignment.preference_cost:.0f}, 전력 차 {assignment.difference:.0f})")
+    socketio.emit('game_state_update', build_snapshot(session_id), to=session_id)
+
+@socketio.on('select_position')
+@inflight.track
+def on_select_position(data):
+    """수동 자리 이동 - 역색인으로 이전 자리를 바로 비운다"""
+    session_id = data.get('session_id')
+    user = session.get('user')
     if not user:
-        return redirect(url_for("discord_login", next=request.url))
-    
-    # 테스트용 더미 데이터로 응답
-    print(f"✅ 드래프트 결과 페이지 접근: {session_id}")
-    return render_template("draft_result.html", session_id=session_id, user_info=user)
-
-@app.route("/api/session/<session_id>/result")
-def get_draft_result(session_id):
-    """드래프트 결과 데이터 조회"""
-    # 더미 데이터 반환
-    result_data = {
-        "teams": {
-            "blue": {"TOP": {"player": {"display_name": "테스트유저1"}, "champion": {"korean_name": "아트록스"}}},
-            "red": {"TOP": {"player": {"display_name": "테스트유저6"}, "champion": {"korean_name": "가렌"}}}
-        },
-        "bans": {"blue": ["야스오"], "red": ["아칼리"]}
-    }
-    return jsonify(result_data)
-
-def main():
-    """웹서버 실행"""
-    print("🤖 사이버펑크 나비 내전 웹 서버 시작...")
-    print(f"🔑 Discord OAuth 설정:")
-    print(f"   Client ID: {discord_oauth.client_id}")
-    print(f"   Redirect URI: {discord_oauth.redirect_uri}")
-    print(f"🌐 테스트 URL: http://{Config.FLASK_HOST}:{Config.FLASK_PORT}/cyber_test")
+        emit('action_rejected', {'code': 'not_logged_in', 'message': '로그인이 필요합니다.'})
+        return
+    discord_id = str(user['id'])
+    user_name = user.get('final_name') or user.get('display_name') or user.get('username')
+    team, position = data.get('team'), data.get('position')
     
     try:
-        socketio.run(
-            app, 
-            host=Config.FLASK_HOST, 
-            port=Config.FLASK_PORT, 
-            debug=Config.FLASK_DEBUG
+        previous = update_positions(
+            session_id, lambda state: place_player(state, discord_id, user_name, team, position)
         )
-    except Exception as e:
-        print(f"❌ 웹서버 실행 실패: {e}")
+    except PositionError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        return
+    
+    if previous is not None:
+        socketio.emit('position_selected', {'team': previous[0], 'position': previous[1], 'user_name': None}, to=session_id)
+    socketio.emit('position_selected', {'team': team, 'position': position, 'user_name': user_name}, to=session_id)
+
+@socketio.on('leave_position')
+@inflight.track
+def on_leave_position(data):
+    session_id = data.get('session_id')
+    discord_id = current_discord_id()
+    if discord_id is None:
+        emit('action_rejected', {'code': 'not_logged_in', 'message': '로그인이 필요합니다.'})
+        return
+    
+    try:
+        previous = update_positions(session_id, lambda state: remove_player(state, discord_id))
+    except PositionError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        return
+    
+    if previous is not None:
+        socketio.emit('position_selected', {'team': previous[0], 'position': previous[1], 'user_name': None}, to=session_id)
 
-if __name__ == "__main__":
-    main()
+@socketio.on('start_draft')
+@inflight.track
+def on_start_draft(data):
+    """포지션이 모두 정해지면 밴픽 단계로 넘어가고 첫 턴 시계 시작"""
+    session_id = data.get('session_id')
+    
+    def start(state):
+        if len(state.get('player_slots', {})) < 10:
+            raise PositionError('lineup_incomplete', '10명이 모두 포지션을 정해야 시작할 수 있습니다.')
+        state['phase'] = 'draft'
+    
+    try:
+        update_positions(session_id, start)
+    except PositionError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        return
+    
+    print(f"🚀 밴픽 시작: {session_id}")
+    ensure_draft_clock(session_id)
+    socketio.emit('draft_started', {'session_id': session_id}, to=session_id)
 
 @app.route("/banpick/<session_id>")
 def banpick_page(session_id):
@@ -451,76 +794,34 @@ def banpick_page(session_id):
     if not user:
         return redirect(url_for("discord_login", next=request.url))
     
-    # 실제 게임 세션 확인
-    if session_id not in game_sessions:
-        # 실제 세션이 없으면 더미 데이터로 생성
-        print(f"🎮 실제 게임 세션 생성: {session_id}")
-        
-        # 더미 참가자 데이터 (10명)
-        dummy_participants = []
-        for i in range(10):
-            dummy_participants.append({
-                "discord_id": f"player_{i}",
-                "username": f"Player{i+1}",
-                "display_name": f"플레이어{i+1}",
-                "avatar_url": f"https://cdn.discordapp.com/embed/avatars/{i % 6}.png",
-                "discriminator": f"{1000 + i:04d}"
-            })
-        
-        # 게임 세션 데이터 생성
-        game_sessions[session_id] = {
-            "participants": dummy_participants,
-            "channel_id": "real_channel",
-            "guild_id": "real_guild",
-            "created_by": user,
-            "created_at": datetime.now().isoformat(),
-            "title": "🦋 나비내전",
-            "phase": "position_select"
-        }
-        
-        # 게임 상태 초기화
-        game_states[session_id] = {
-            "phase": "position_select",
-            "teams": {
-                "blue": {"TOP": None, "JUG": None, "MID": None, "ADC": None, "SUP": None},
-                "red": {"TOP": None, "JUG": None, "MID": None, "ADC": None, "SUP": None}
-            },
-            "draft": {
-                "bans": {"blue": [], "red": []},
-                "picks": {"blue": [], "red": []},
-                "currentTurn": "blue_ban_1",
-                "timer": 30
-            },
-            "participants": dummy_participants
-        }
+    if session_id not in session_store:
+        abort(404)
+    session_store.touch(session_id)
     
-    print(f"✅ 밴픽 페이지 접근: {user.get("display_name", "Unknown")} -> {session_id}")
-    return render_template("banpick.html", session_id=session_id, user_info=user)
+    is_host = session_host_id(session_store.get_session(session_id) or {}) == str(user.get('id'))
+    print(f"✅ 밴픽 페이지 접근: {user.get('display_name', 'Unknown')} -> {session_id}")
+    return render_template("banpick.html", session_id=session_id, user_info=user, is_host=is_host)
 
-@app.route('/draft_result/<session_id>')
+@app.route("/draft_result/<session_id>")
 def draft_result_page(session_id):
     """드래프트 결과 확인 페이지"""
-    user = session.get('user')
+    user = session.get("user")
     
     if not user:
-        return redirect(url_for('discord_login', next=request.url))
-    
-    # 세션 확인
-    if session_id not in game_sessions:
-        return "세션을 찾을 수 없습니다.", 404
+        return redirect(url_for("discord_login", next=request.url))
     
-    print(f"✅ 드래프트 결과 페이지 접근: {user.get('display_name', 'Unknown')} -> {session_id}")
-    return render_template('draft_result.html', session_id=session_id, user_info=user)
+    # 테스트용 더미 데이터로 응답
+    print(f"✅ 드래프트 결과 페이지 접근: {session_id}")
+    return render_template("draft_result.html", session_id=session_id, user_info=user)
 
 @app.route('/api/session/<session_id>/result')
 def get_draft_result(session_id):
     """드래프트 결과 데이터 조회"""
-    if session_id not in game_sessions or session_id not in game_states:
+    session_data = session_store.get_session(session_id)
+    game_state = session_store.get_state(session_id)
+    if session_data is None or game_state is None:
         return jsonify({'error': 'Session not found'}), 404
     
-    session_data = game_sessions[session_id]
-    game_state = game_states[session_id]
-    
     # 결과 데이터 구성
     result_data = {
         'teams': game_state.get('teams', {}),
@@ -531,8 +832,26 @@ def get_draft_result(session_id):
     
     return jsonify(result_data)
 
+@app.route('/api/session/<session_id>/balance')
+def get_team_balance(session_id):
+    """로비 단계 팀 나누기 추천 (전력 차가 작은 순서로 k개)"""
+    session_data = session_store.get_session(session_id)
+    if session_data is None:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    participants = session_data.get('participants', [])
+    top_k = min(max(request.args.get('k', 3, type=int), 1), 10)
+    stats = load_player_stats([p['discord_id'] for p in participants])
+    try:
+        splits = balance_teams(build_players(participants, stats), top_k=top_k)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({'session_id': session_id, 'splits': [split.to_dict() for split in splits]})
+
 # 웹소켓 이벤트 추가
 @socketio.on('join_result_session')
+@inflight.track
 def on_join_result_session(data):
     session_id = data['session_id']
     join_room(f"result_{session_id}")
@@ -540,109 +859,106 @@ def on_join_result_session(data):
     print(f"🎉 결과 세션 참가: {session_id}")
 
 @socketio.on('confirm_draft_results')
+@inflight.track
 def on_confirm_draft_results(data):
     session_id = data['session_id']
     final_data = data['final_data']
     
     print(f"✅ 드래프트 결과 확정: {session_id}")
     
-    # 실제로는 디스코드로 결과 전송
-    # TODO: 디스코드 봇에 결과 전송 로직 추가
+    # 디스코드 봇에 결과 전송 (봇이 세션 채널에 결과를 올린다)
+    session_data = session_store.get_session(session_id) or {}
+    record_game(session_id, session_data)
+    delivered = event_bus.publish(DRAFT_CONFIRMED, {
+        'session_id': session_id,
+        'channel_id': session_data.get('channel_id'),
+        'title': session_data.get('title', '나비내전'),
+        'final_data': final_data
+    })
+    if not delivered:
+        print(f"⚠️ 봇에 결과를 전달하지 못했습니다 (이벤트 버스 미연결): {session_id}")
+    
+    emit('results_confirmed', {'success': True, 'delivered': delivered}, room=f"result_{session_id}")
+
+def record_game(session_id, session_data):
+    """끝난 드래프트를 경기 기록으로 저장 (%결과 로 승리 팀을 기록할 때 필요)"""
+    state = session_store.get_state(session_id)
+    if not Config.SESSION_ARCHIVE or state is None or state.get('phase') != 'completed':
+        return
     
-    emit('results_confirmed', {'success': True}, room=f"result_{session_id}")
+    try:
+        game_id = create_game_record(session_id, session_data.get('title', '나비내전'), session_host_id(session_data) or '', state)
+    except Exception as e:
+        print(f"❌ 경기 기록 실패 ({session_id}): {e}")
+        return
+    if game_id is not None:
+        print(f"🗄️ 경기 기록: {session_id} -> #{game_id}")
+
+# 결과 페이지가 저장할 수 있는 필드 (state['result_adjustments']에 보관)
+ADJUSTMENT_FIELDS = ('teams', 'bans')
 
 @socketio.on('save_draft_adjustments')
+@inflight.track
 def on_save_adjustments(data):
     session_id = data['session_id']
-    adjustments = data['adjustments']
-    
-    # 게임 상태 업데이트
-    if session_id in game_states:
-        game_states[session_id].update(adjustments)
-    
-    print(f"💾 드래프트 수정사항 저장: {session_id}")
+    adjustments = data.get('adjustments') or {}
     
-    emit('adjustments_saved', {'success': True}, room=f"result_{session_id}")
-
-
-@app.route("/banpick/<session_id>")
-def banpick_page(session_id):
-    """밴픽 페이지 - 실제 내전용"""
-    user = session.get("user")
+    # 결과 페이지의 표시용 수정사항만 따로 보관 - draft/phase/player_slots 등 서버 상태는 건드리지 않는다
+    saved = {key: adjustments[key] for key in ADJUSTMENT_FIELDS if key in adjustments}
     
-    if not user:
-        return redirect(url_for("discord_login", next=request.url))
+    def save(state):
+        if state.get('phase') != 'completed':
+            raise DraftError('wrong_phase', '드래프트가 끝난 뒤에만 수정할 수 있습니다.')
+        state['result_adjustments'] = saved
     
-    # 실제 게임 세션 확인
-    if session_id not in game_sessions:
-        # 실제 세션이 없으면 더미 데이터로 생성
-        print(f"🎮 실제 게임 세션 생성: {session_id}")
-        
-        # 더미 참가자 데이터 (10명)
-        dummy_participants = []
-        for i in range(10):
-            dummy_participants.append({
-                "discord_id": f"player_{i}",
-                "username": f"Player{i+1}",
-                "display_name": f"플레이어{i+1}",
-                "avatar_url": f"https://cdn.discordapp.com/embed/avatars/{i % 6}.png",
-                "discriminator": f"{1000 + i:04d}"
-            })
-        
-        # 게임 세션 데이터 생성
-        game_sessions[session_id] = {
-            "participants": dummy_participants,
-            "channel_id": "real_channel",
-            "guild_id": "real_guild",
-            "created_by": user,
-            "created_at": datetime.now().isoformat(),
-            "title": "🦋 나비내전",
-            "phase": "position_select"
-        }
-        
-        # 게임 상태 초기화
-        game_states[session_id] = {
-            "phase": "position_select",
-            "teams": {
-                "blue": {"TOP": None, "JUG": None, "MID": None, "ADC": None, "SUP": None},
-                "red": {"TOP": None, "JUG": None, "MID": None, "ADC": None, "SUP": None}
-            },
-            "draft": {
-                "bans": {"blue": [], "red": []},
-                "picks": {"blue": [], "red": []},
-                "currentTurn": "blue_ban_1",
-                "timer": 30
-            },
-            "participants": dummy_participants
-        }
-    
-    print(f"✅ 밴픽 페이지 접근: {user.get("display_name", "Unknown")} -> {session_id}")
-    return render_template("banpick.html", session_id=session_id, user_info=user)
-
-@app.route("/draft_result/<session_id>")
-def draft_result_page(session_id):
-    """드래프트 결과 확인 페이지"""
-    user = session.get("user")
+    try:
+        session_store.update_state(session_id, save)
+    except SessionNotFound:
+        emit('action_rejected', {'code': 'no_session', 'message': '세션을 찾을 수 없습니다.'})
+        return
+    except DraftError as e:
+        emit('action_rejected', {'code': e.code, 'message': e.message})
+        return
     
-    if not user:
-        return redirect(url_for("discord_login", next=request.url))
+    print(f"💾 드래프트 수정사항 저장: {session_id}")
     
-    # 테스트용 더미 데이터로 응답
-    print(f"✅ 드래프트 결과 페이지 접근: {session_id}")
-    return render_template("draft_result.html", session_id=session_id, user_info=user)
+    emit('adjustments_saved', {'success': True}, room=f"result_{session_id}")
 
-@app.route("/api/session/<session_id>/result")
-def get_draft_result(session_id):
-    """드래프트 결과 데이터 조회"""
-    # 더미 데이터 반환
-    result_data = {
-        "teams": {
-            "blue": {"TOP": {"player": {"display_name": "테스트유저1"}, "champion": {"korean_name": "아트록스"}}},
-            "red": {"TOP": {"player": {"display_name": "테스트유저6"}, "champion": {"korean_name": "가렌"}}}
-        },
-        "bans": {"blue": ["야스오"], "red": ["아칼리"]}
-    }
-    return jsonify(result_data)
+def restore_sessions():
+    """이전 프로세스가 종료 시 저장한 세션 복원 (메모리 저장소일 때만)"""
+    if not isinstance(session_store, MemorySessionStore):
+        return
+    
+    restored = session_store.restore(Config.SESSION_SNAPSHOT_PATH)
+    for session_id in restored:
+        state = session_store.get_state(session_id)
+        draft = state['draft']
+        if state.get('phase') == 'draft' and draft.get('deadline') and not draft_engine.is_completed(draft):
+            # 재시작하는 동안 흐른 시간은 빼고 현재 턴을 새로 시작
+            deadline = session_store.update_state(
+                session_id, lambda state: draft_engine.start_clock(state['draft'], time.time())
+            )
+            draft_timer.schedule(session_id, deadline, draft['turn'])
+    if restored:
+        print(f"♻️ 세션 {len(restored)}개 복원")
+
+def graceful_shutdown(signum, frame):
+    """SIGTERM - 진행 중인 소켓 이벤트를 마치고 세션을 저장한 뒤 종료"""
+    print("🛑 종료 신호 수신 - 진행 중인 이벤트 마무리 중...")
+    socketio.emit('server_restarting', {})
+    
+    if not inflight.drain(Config.SHUTDOWN_TIMEOUT):
+        print(f"⚠️ {Config.SHUTDOWN_TIMEOUT}초 안에 끝나지 않은 이벤트 {inflight.count}개")
+    draft_timer.stop()
+    event_bus.stop()
+    
+    # SQLite 저장소는 이미 파일에 있으므로 메모리 저장소만 저장
+    if isinstance(session_store, MemorySessionStore):
+        count = session_store.snapshot(Config.SESSION_SNAPSHOT_PATH)
+        print(f"💾 세션 {count}개 저장: {Config.SESSION_SNAPSHOT_PATH}")
+    
+    print("👋 웹서버 종료")
+    sys.exit(0)
 
 def main():
     """웹서버 실행"""
@@ -652,12 +968,18 @@ def main():
     print(f"   Redirect URI: {discord_oauth.redirect_uri}")
     print(f"🌐 테스트 URL: http://{Config.FLASK_HOST}:{Config.FLASK_PORT}/cyber_test")
     
+    socketio.start_background_task(session_sweeper)
+    socketio.start_background_task(event_bus.run)
+    restore_sessions()
+    signal.signal(signal.SIGTERM, graceful_shutdown)
+    
     try:
         socketio.run(
             app, 
             host=Config.FLASK_HOST, 
             port=Config.FLASK_PORT, 
-            debug=Config.FLASK_DEBUG
+            debug=Config.FLASK_DEBUG,
+            allow_unsafe_werkzeug=True
         )
     except Exception as e:
         print(f"❌ 웹서버 실행 실패: {e}")
@@ -1,9 +1,39 @@
 import requests
 import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from flask import session
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
 import os
 
+# (연결, 읽기) 타임아웃 - 디스코드 API가 느려도 로그인 요청이 무한정 걸리지 않도록
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+class NicknameCache:
+    """서버 닉네임 TTL 캐시 (user_id -> 닉네임, 없으면 None도 캐시)"""
+
+    def __init__(self, ttl=600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, user_id):
+        """(hit 여부, 닉네임)"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(user_id, None)
+                return False, None
+            return True, entry[1]
+
+    def set(self, user_id, nickname):
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, nickname)
+
+
 class DiscordOAuth:
     def __init__(self):
         self.client_id = os.getenv('DISCORD_CLIENT_ID')
@@ -15,6 +45,13 @@ class DiscordOAuth:
         
         # 봇이 속한 서버 ID (내전이 진행되는 서버)
         self.guild_id = os.getenv('DISCORD_GUILD_ID')  # .env에 추가 필요
+        self.bot_token = os.getenv('DISCORD_BOT_TOKEN')
+        
+        # keep-alive 연결 풀 - 로그인마다 TLS 핸드셰이크를 새로 하지 않는다
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        self.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='discord-api')
+        self.nicknames = NicknameCache(ttl=int(os.getenv('DISCORD_NICKNAME_TTL', 600)))
     
     def get_authorization_url(self, state=None):
         """OAuth 인증 URL 생성 - 서버 정보도 가져오도록 scope 확장"""
@@ -45,7 +82,7 @@ class DiscordOAuth:
         }
         
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        response = requests.post(self.token_url, data=data, headers=headers)
+        response = self.http.post(self.token_url, data=data, headers=headers, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         return response.json()
@@ -54,13 +91,22 @@ class DiscordOAuth:
         """사용자 정보 및 서버 닉네임 가져오기"""
         headers = {'Authorization': f'Bearer {access_token}'}
         
-        # 기본 사용자 정보
-        response = requests.get(f"{self.api_base}/users/@me", headers=headers)
+        # 기본 사용자 정보와 서버 멤버 정보를 동시에 요청
+        member_future = None
+        if self.guild_id:
+            member_future = self.executor.submit(self.get_own_member, headers)
+        
+        response = self.http.get(f"{self.api_base}/users/@me", headers=headers, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         user_data = response.json()
         
-        # 서버 닉네임 가져오기 (봇 토큰 필요)
-        server_nickname = self.get_server_nickname(user_data['id'])
+        member_data = member_future.result() if member_future else None
+        if member_data is not None:
+            server_nickname = member_data.get('nick')
+            self.nicknames.set(user_data['id'], server_nickname)
+        else:
+            # 멤버 권한이 없으면 봇 토큰으로 조회 (캐시 우선)
+            server_nickname = self.get_server_nickname(user_data['id'])
         
         # 디스코드 새 사용자명 시스템 처리
         if user_data.get('discriminator') == '0':
@@ -86,29 +132,47 @@ class DiscordOAuth:
             'avatar_url': avatar_url
         }
     
+    def get_own_member(self, headers):
+        """사용자 토큰으로 본인의 서버 멤버 정보 가져오기 (guilds.members.read)"""
+        try:
+            response = self.http.get(
+                f"{self.api_base}/users/@me/guilds/{self.guild_id}/member",
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
+            )
+            if response.status_code == 200:
+                return response.json()
+            print(f"서버 멤버 정보 가져오기 실패: {response.status_code}")
+        except requests.RequestException as e:
+            print(f"서버 멤버 정보 가져오기 오류: {e}")
+        return None
+    
     def get_server_nickname(self, user_id):
         """봇 토큰으로 서버에서의 닉네임 가져오기"""
-        if not self.guild_id:
+        if not self.guild_id or not self.bot_token:
             return None
+        
+        hit, nickname = self.nicknames.get(user_id)
+        if hit:
+            return nickname
             
         try:
             # 봇 토큰 사용 (OAuth 토큰이 아닌)
-            bot_token = os.getenv('DISCORD_BOT_TOKEN')
-            if not bot_token:
-                return None
-                
-            headers = {'Authorization': f'Bot {bot_token}'}
+            headers = {'Authorization': f'Bot {self.bot_token}'}
             
             # 서버 멤버 정보 가져오기
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_base}/guilds/{self.guild_id}/members/{user_id}",
-                headers=headers
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
             )
             
             if response.status_code == 200:
                 member_data = response.json()
                 # 서버 닉네임이 있으면 반환, 없으면 None
-                return member_data.get('nick')
+                nickname = member_data.get('nick')
+                self.nicknames.set(user_id, nickname)
+                return nickname
             else:
                 print(f"서버 멤버 정보 가져오기 실패: {response.status_code}")
                 return None
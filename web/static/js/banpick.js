@@ -23,11 +23,9 @@ if (window.banPickSystemLoaded) {
                     timer: 30
                 }
             };
-            this.champions = [];
             
             this.loadCurrentUser();
             this.initializeSocket();
-            this.loadChampions();
         }
 
         async loadCurrentUser() {
@@ -78,17 +76,24 @@ if (window.banPickSystemLoaded) {
             this.socket.on('position_selected', (data) => {
                 this.handlePositionUpdate(data);
             });
-        }
 
-        async loadChampions() {
-            try {
-                const response = await fetch(`/api/session/${this.sessionId}`);
-                const data = await response.json();
-                this.champions = data.champions;
-                console.log(`📊 ${this.champions.length}개 챔피언 로드됨`);
-            } catch (error) {
-                console.error('챔피언 데이터 로드 실패:', error);
-            }
+            this.socket.on('role_preferences_updated', (data) => {
+                const status = document.getElementById('preferenceStatus');
+                if (status) status.textContent = `제출 ${data.submitted}명`;
+            });
+
+            this.socket.on('action_rejected', (data) => {
+                console.warn('⛔ 요청 거부:', data);
+                if (typeof positionModal !== 'undefined' && positionModal && positionModal.showError) {
+                    positionModal.showError(data.message || '허용되지 않는 요청입니다.', '⚠️');
+                } else {
+                    alert(data.message || '허용되지 않는 요청입니다.');
+                }
+            });
+
+            this.socket.on('draft_started', () => {
+                window.location.href = `/draft_cyber/${this.sessionId}`;
+            });
         }
 
         selectPosition(team, position) {
@@ -153,8 +158,6 @@ if (window.banPickSystemLoaded) {
                 session_id: this.sessionId,
                 team: team,
                 position: position,
-                user_name: userName,
-                discord_id: this.currentUser.id,
                 avatar_url: this.currentUser.avatar_url
             });
             
@@ -224,6 +227,24 @@ if (window.banPickSystemLoaded) {
             });
         }
 
+        submitRolePreferences() {
+            // 1지망부터 순서대로, 빈 칸은 빼고 보낸다 (중복은 서버에서 정리)
+            const preferences = Array.from(document.querySelectorAll('.role-preference-select'))
+                .sort((a, b) => a.dataset.rank - b.dataset.rank)
+                .map(select => select.value)
+                .filter(value => value);
+            console.log('📝 선호 포지션 제출:', preferences);
+            this.socket.emit('submit_role_preferences', {
+                session_id: this.sessionId,
+                preferences: preferences
+            });
+        }
+
+        autoAssignRoles() {
+            console.log('🧮 포지션 자동 배정 요청');
+            this.socket.emit('auto_assign_roles', { session_id: this.sessionId });
+        }
+
         checkAllPositionsFilled() {
             const totalFilled = Object.values(this.gameState.teams.blue).filter(p => p).length +
                                Object.values(this.gameState.teams.red).filter(p => p).length;
@@ -241,6 +262,10 @@ if (window.banPickSystemLoaded) {
             }
         }
 
+        startDraft() {
+            this.socket.emit('start_draft', { session_id: this.sessionId });
+        }
+
         updateUI() {
             if (this.gameState.phase === 'position_select') {
                 this.updatePositionSlots();
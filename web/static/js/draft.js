@@ -104,7 +104,7 @@ DraftSystem.prototype.createDummyChampions = function() {
             id: i + 1,
             english_name: dummyChampions[i],
             korean_name: dummyChampions[i],
-            image_url: 'https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/' + dummyChampions[i] + '.png'
+            image_url: (window.CHAMPION_IMAGE_CDN || 'https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/') + dummyChampions[i] + '.png'
         });
     }
     
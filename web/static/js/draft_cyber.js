@@ -1,15 +1,23 @@
 console.log('🎮 Cyber Draft System 로드 시작');
 
+// 더미 챔피언 이미지 CDN (서버 설정 DDRAGON_VERSION 기준)
+const CHAMPION_IMAGE_CDN = (window.CHAMPION_IMAGE_CDN || 'https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/');
+
 // CyberDraftSystem 클래스
 class CyberDraftSystem {
     constructor(sessionId) {
         this.sessionId = sessionId;
         this.socket = io();
         this.champions = [];
+        this.championsByName = {};
+        this.sprites = {};  // 영문 이름 -> 스프라이트 위치 (아틀라스가 있을 때만)
         this.participants = [];
+        this.version = 0;  // 서버 상태 버전 (델타 순서 확인용)
         this.currentTurnIndex = 0;
         this.timerInterval = null;
         this.timeLeft = 30;
+        this.deadline = null;    // 현재 턴 마감 시각 (서버 시간, 초)
+        this.clockOffset = 0;    // 서버 시간 - 클라이언트 시간 (초)
         this.selectedChampion = null;
         
         // LoL 공식 밴픽 순서 (TOP이 밴 담당)
@@ -30,11 +38,11 @@ class CyberDraftSystem {
             { team: 'blue', action: 'pick', position: 'MID', display: '🔵 블루팀 미드 픽' },
             { team: 'red', action: 'pick', position: 'MID', display: '🔴 레드팀 미드 픽' },
             
-            // 2라운드 밴
-            { team: 'red', action: 'ban', position: 'TOP', display: '🔴 레드팀 4번째 밴' },
+            // 2라운드 밴 (서버 shared.constants.DRAFT_PHASES 순서와 동일)
             { team: 'blue', action: 'ban', position: 'TOP', display: '🔵 블루팀 4번째 밴' },
-            { team: 'red', action: 'ban', position: 'TOP', display: '🔴 레드팀 5번째 밴' },
+            { team: 'red', action: 'ban', position: 'TOP', display: '🔴 레드팀 4번째 밴' },
             { team: 'blue', action: 'ban', position: 'TOP', display: '🔵 블루팀 5번째 밴' },
+            { team: 'red', action: 'ban', position: 'TOP', display: '🔴 레드팀 5번째 밴' },
             
             // 2라운드 픽
             { team: 'red', action: 'pick', position: 'ADC', display: '🔴 레드팀 원딜 픽' },
@@ -59,6 +67,7 @@ class CyberDraftSystem {
     async initialize() {
         try {
             await this.initializeSocket();
+            await this.loadSprites();
             await this.loadChampions();
             await this.loadParticipants();
             this.setupEventListeners();
@@ -91,6 +100,11 @@ class CyberDraftSystem {
             
             this.socket.on('game_state_update', (data) => {
                 console.log('🎮 게임 상태 업데이트:', data);
+                this.version = data.version || 0;
+                if (data.server_time) {
+                    this.syncClock(data.server_time, data.game_state && data.game_state.draft
+                        ? data.game_state.draft.deadline : null);
+                }
                 if (data.participants) {
                     this.participants = data.participants;
                     this.renderTeamSlots();
@@ -100,9 +114,18 @@ class CyberDraftSystem {
                 }
             });
             
-            this.socket.on('champion_selected', (data) => {
-                console.log('🎯 챔피언 선택됨:', data);
-                this.handleRemoteChampionSelection(data);
+            this.socket.on('state_delta', (delta) => {
+                this.applyDelta(delta);
+            });
+            
+            this.socket.on('server_restarting', () => {
+                // 서버 재시작 중 - 소켓이 자동 재연결되면 join_session으로 상태를 다시 받는다
+                this.showError('서버를 재시작하는 중입니다. 잠시 후 자동으로 다시 연결됩니다.');
+            });
+            
+            this.socket.on('action_rejected', (data) => {
+                console.warn('⛔ 선택 거부:', data);
+                this.showError(data.message || '허용되지 않는 선택입니다.');
             });
             
             this.socket.on('draft_completed', () => {
@@ -117,6 +140,25 @@ class CyberDraftSystem {
         });
     }
     
+    async loadSprites() {
+        // 챔피언 초상화 아틀라스 (없으면 개별 이미지 사용)
+        try {
+            const response = await fetch('/sprites/champions.json');
+            if (!response.ok) return;
+            
+            const atlas = await response.json();
+            this.sprites = atlas.champions || {};
+            
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = '/sprites/champions.css';
+            document.head.appendChild(link);
+            console.log('🧩 스프라이트 아틀라스 로드:', Object.keys(this.sprites).length + '개');
+        } catch (error) {
+            console.warn('⚠️ 스프라이트 아틀라스 로드 실패:', error);
+        }
+    }
+    
     async loadChampions() {
         try {
             console.log('📊 챔피언 데이터 로딩 시작...');
@@ -128,6 +170,7 @@ class CyberDraftSystem {
             
             const data = await response.json();
             this.champions = data.champions || [];
+            this.indexChampions();
             
             if (this.champions.length === 0) {
                 console.warn('⚠️ 챔피언 데이터가 없어 더미 데이터 로드');
@@ -179,13 +222,21 @@ class CyberDraftSystem {
         this.champions = dummyChampions.map(name => ({
             english_name: name,
             korean_name: name,
-            image_url: `https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/${name}.png`
+            image_url: `${CHAMPION_IMAGE_CDN}${name}.png`
         }));
+        this.indexChampions();
         
         this.renderChampionGrid();
         console.log('🧪 더미 챔피언 데이터 로드 완료:', this.champions.length + '개');
     }
     
+    indexChampions() {
+        this.championsByName = {};
+        this.champions.forEach(champion => {
+            this.championsByName[champion.english_name] = champion;
+        });
+    }
+    
     loadDummyParticipants() {
         this.participants = [];
         for (let i = 0; i < 10; i++) {
@@ -261,10 +312,18 @@ class CyberDraftSystem {
             if (isBanned) itemEl.classList.add('banned');
             if (isPicked) itemEl.classList.add('picked');
             
-            itemEl.innerHTML = `
-                <img src="${champion.image_url}" alt="${champion.korean_name}"
-                     onerror="this.src='https://cdn.discordapp.com/embed/avatars/0.png'">
-            `;
+            const sprite = this.sprites[champion.english_name];
+            if (sprite) {
+                itemEl.innerHTML = `
+                    <span class="champion-sprite sheet-${sprite.sheet}" data-champion="${champion.english_name}"
+                          role="img" aria-label="${champion.korean_name}"></span>
+                `;
+            } else {
+                itemEl.innerHTML = `
+                    <img src="${champion.image_url}" alt="${champion.korean_name}"
+                         onerror="this.src='https://cdn.discordapp.com/embed/avatars/0.png'">
+                `;
+            }
             
             if (!isBanned && !isPicked) {
                 itemEl.addEventListener('click', () => this.selectChampion(champion));
@@ -328,9 +387,6 @@ class CyberDraftSystem {
         // 포지션 하이라이트
         this.highlightCurrentPosition(currentTurn);
         
-        // 타이머 리셋
-        this.timeLeft = 30;
-        
         console.log('🔄 턴 업데이트:', currentTurn);
     }
     
@@ -399,36 +455,21 @@ class CyberDraftSystem {
         }
         
         const currentTurn = this.draftOrder[this.currentTurnIndex];
-        const championData = {
-            english_name: this.selectedChampion.english_name,
-            korean_name: this.selectedChampion.korean_name,
-            image_url: this.selectedChampion.image_url
-        };
         
-        if (currentTurn.action === 'ban') {
-            this.executeBan(currentTurn, championData);
-        } else {
-            this.executePick(currentTurn, championData);
-        }
-        
-        // 소켓으로 전송
+        // 서버로 요청만 보내고, 반영은 서버의 champion_selected 브로드캐스트로 한다
         this.socket.emit('select_champion', {
             session_id: this.sessionId,
-            champion_english: championData.english_name,
-            champion_korean: championData.korean_name,
+            champion_english: this.selectedChampion.english_name,
             action: currentTurn.action,
             team: currentTurn.team,
             turn: this.currentTurnIndex
         });
         
-        // 다음 턴으로
-        this.currentTurnIndex++;
         this.selectedChampion = null;
-        
-        // UI 업데이트
         this.clearSelection();
-        this.renderChampionGrid();
-        this.updateCurrentTurn();
+        
+        const actionBtn = document.getElementById('actionBtn');
+        if (actionBtn) actionBtn.disabled = true;
     }
     
     executeBan(currentTurn, championData) {
@@ -515,7 +556,11 @@ class CyberDraftSystem {
         }
         
         this.timerInterval = setInterval(() => {
-            this.timeLeft--;
+            // 남은 시간은 항상 서버 마감 시각 기준으로 계산
+            if (this.deadline) {
+                const now = Date.now() / 1000 + this.clockOffset;
+                this.timeLeft = Math.max(0, Math.ceil(this.deadline - now));
+            }
             
             const timerEl = document.getElementById('timer');
             if (timerEl) {
@@ -535,11 +580,13 @@ class CyberDraftSystem {
     }
     
     handleTimeOut() {
-        console.log('⏰ 시간 초과');
-        this.timeLeft = 30; // 리셋
-        
-        // 실제로는 자동 스킵 또는 랜덤 선택 처리
-        // 여기서는 단순히 타이머만 리셋
+        // 시간 초과 시 서버가 자동으로 밴/픽하고 state_delta를 보낸다
+    }
+    
+    syncClock(serverTime, deadline) {
+        // 서버 시간과의 차이와 현재 턴 마감 시각 갱신
+        this.clockOffset = serverTime - Date.now() / 1000;
+        this.deadline = deadline || null;
     }
     
     showDraftCompleted() {
@@ -604,26 +651,102 @@ class CyberDraftSystem {
         return window.currentUserDiscordId || 'current_user';
     }
     
+    applyDelta(delta) {
+        // 이미 반영된 버전은 무시, 중간 버전이 빠졌으면 전체 상태 재요청
+        if (delta.v <= this.version) return;
+        if (delta.v !== this.version + 1) {
+            console.warn(`⚠️ 상태 버전 누락 (${this.version} -> ${delta.v}), 재동기화 요청`);
+            this.socket.emit('request_resync', {
+                session_id: this.sessionId,
+                discord_id: this.getCurrentUserDiscordId()
+            });
+            return;
+        }
+        this.version = delta.v;
+        if (delta.ts) {
+            this.syncClock(delta.ts, delta.deadline);
+        }
+        
+        if (delta.op === 'ban' || delta.op === 'pick') {
+            const champion = this.championsByName[delta.champ] || {};
+            this.handleRemoteChampionSelection({
+                turn: delta.turn,
+                action: delta.op,
+                team: delta.team,
+                champion_english: delta.champ,
+                champion_korean: champion.korean_name || delta.champ,
+                image_url: champion.image_url || '',
+                next_turn: delta.next
+            });
+            if (delta.auto) {
+                this.showError(`⏰ 시간 초과 - 자동 ${delta.op === 'ban' ? '밴' : '픽'}: ${champion.korean_name || delta.champ}`);
+            }
+        } else if (delta.op === 'skip') {
+            this.currentTurnIndex = delta.next;
+            this.renderChampionGrid();
+            this.updateCurrentTurn();
+            this.showError('⏰ 시간 초과 - 남은 챔피언이 없어 턴을 넘깁니다');
+        }
+    }
+    
     handleRemoteChampionSelection(data) {
-        // 다른 플레이어의 선택 처리
-        console.log('🎯 원격 선택 처리:', data);
+        // 서버가 승인한 선택 반영
+        console.log('🎯 선택 반영:', data);
+        
+        const currentTurn = this.draftOrder[data.turn];
+        const championData = {
+            english_name: data.champion_english,
+            korean_name: data.champion_korean,
+            image_url: data.image_url
+        };
         
         if (data.action === 'ban') {
-            this.gameState.bans[data.team].push(data.champion_korean);
+            this.executeBan(currentTurn, championData);
         } else {
-            this.gameState.picks[data.team].push(data.champion_korean);
-            // 팀 구성 업데이트 로직 추가
+            this.executePick(currentTurn, championData);
         }
         
+        this.currentTurnIndex = data.next_turn;
         this.renderChampionGrid();
-        this.renderTeamSlots();
+        this.updateCurrentTurn();
     }
     
     updateFromGameState(gameState) {
         // 서버에서 받은 게임 상태로 업데이트
-        this.gameState = { ...this.gameState, ...gameState };
+        const draft = gameState.draft;
+        if (draft) {
+            this.gameState.bans = draft.bans;
+            this.gameState.picks = draft.picks;
+            if (draft.lineup) {
+                this.gameState.teams = draft.lineup;
+            }
+            this.currentTurnIndex = draft.turn || 0;
+            this.renderBanSlots();
+        }
         this.renderChampionGrid();
         this.renderTeamSlots();
+        this.updateCurrentTurn();
+    }
+    
+    renderBanSlots() {
+        ['blue', 'red'].forEach(team => {
+            const banSlots = document.getElementById(team === 'blue' ? 'blueBanSlots' : 'redBanSlots');
+            if (!banSlots) return;
+            
+            const slots = banSlots.querySelectorAll('.ban-slot');
+            slots.forEach((slot, index) => {
+                const koreanName = this.gameState.bans[team][index];
+                const champion = this.champions.find(c => c.korean_name === koreanName);
+                if (koreanName) {
+                    slot.innerHTML = `<img src="${champion ? champion.image_url : ''}" alt="${koreanName}"
+                                           onerror="this.src='https://cdn.discordapp.com/embed/avatars/0.png'">`;
+                    slot.classList.add('filled');
+                } else {
+                    slot.innerHTML = '';
+                    slot.classList.remove('filled');
+                }
+            });
+        });
     }
 }
 
@@ -675,14 +798,9 @@ CyberDraftSystem.prototype.showDraftCompleted = function() {
     
     console.log('🎉 드래프트가 완료되었습니다!');
     
-    // 3초 후 결과 페이지로 이동
-    setTimeout(() => {
+    // 3초 후 결과 페이지로 이동 (완료 판정과 최종 상태는 서버가 가진다)
+    if (this.redirectTimeout) return;
+    this.redirectTimeout = setTimeout(() => {
         window.location.href = `/draft_result/${this.sessionId}`;
     }, 3000);
-    
-    // 소켓으로 완료 알림
-    this.socket.emit('draft_completed', {
-        session_id: this.sessionId,
-        final_state: this.gameState
-    });
 };
@@ -1,5 +1,8 @@
 console.log('🎉 Draft Result System 로드 시작');
 
+// 챔피언 이미지 CDN (서버 설정 DDRAGON_VERSION 기준)
+const CHAMPION_IMAGE_CDN = (window.CHAMPION_IMAGE_CDN || 'https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/');
+
 class DraftResultSystem {
     constructor(sessionId) {
         this.sessionId = sessionId;
@@ -67,18 +70,18 @@ class DraftResultSystem {
         this.draftData = {
             teams: {
                 blue: {
-                    TOP: { player: { display_name: '테스트유저1', avatar_url: 'https://cdn.discordapp.com/embed/avatars/1.png' }, champion: { korean_name: '아트록스', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Aatrox.png' }},
-                    JUG: { player: { display_name: '테스트유저2', avatar_url: 'https://cdn.discordapp.com/embed/avatars/2.png' }, champion: { korean_name: '그레이브즈', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Graves.png' }},
-                    MID: { player: { display_name: '테스트유저3', avatar_url: 'https://cdn.discordapp.com/embed/avatars/3.png' }, champion: { korean_name: '아리', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Ahri.png' }},
-                    ADC: { player: { display_name: '테스트유저4', avatar_url: 'https://cdn.discordapp.com/embed/avatars/4.png' }, champion: { korean_name: '징크스', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Jinx.png' }},
-                    SUP: { player: { display_name: '테스트유저5', avatar_url: 'https://cdn.discordapp.com/embed/avatars/5.png' }, champion: { korean_name: '쓰레쉬', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Thresh.png' }}
+                    TOP: { player: { display_name: '테스트유저1', avatar_url: 'https://cdn.discordapp.com/embed/avatars/1.png' }, champion: { korean_name: '아트록스', image_url: CHAMPION_IMAGE_CDN + 'Aatrox.png' }},
+                    JUG: { player: { display_name: '테스트유저2', avatar_url: 'https://cdn.discordapp.com/embed/avatars/2.png' }, champion: { korean_name: '그레이브즈', image_url: CHAMPION_IMAGE_CDN + 'Graves.png' }},
+                    MID: { player: { display_name: '테스트유저3', avatar_url: 'https://cdn.discordapp.com/embed/avatars/3.png' }, champion: { korean_name: '아리', image_url: CHAMPION_IMAGE_CDN + 'Ahri.png' }},
+                    ADC: { player: { display_name: '테스트유저4', avatar_url: 'https://cdn.discordapp.com/embed/avatars/4.png' }, champion: { korean_name: '징크스', image_url: CHAMPION_IMAGE_CDN + 'Jinx.png' }},
+                    SUP: { player: { display_name: '테스트유저5', avatar_url: 'https://cdn.discordapp.com/embed/avatars/5.png' }, champion: { korean_name: '쓰레쉬', image_url: CHAMPION_IMAGE_CDN + 'Thresh.png' }}
                 },
                 red: {
-                    TOP: { player: { display_name: '테스트유저6', avatar_url: 'https://cdn.discordapp.com/embed/avatars/0.png' }, champion: { korean_name: '가렌', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Garen.png' }},
-                    JUG: { player: { display_name: '테스트유저7', avatar_url: 'https://cdn.discordapp.com/embed/avatars/1.png' }, champion: { korean_name: '엘리스', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Elise.png' }},
-                    MID: { player: { display_name: '테스트유저8', avatar_url: 'https://cdn.discordapp.com/embed/avatars/2.png' }, champion: { korean_name: '신드라', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Syndra.png' }},
-                    ADC: { player: { display_name: '테스트유저9', avatar_url: 'https://cdn.discordapp.com/embed/avatars/3.png' }, champion: { korean_name: '베인', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Vayne.png' }},
-                    SUP: { player: { display_name: '테스트유저10', avatar_url: 'https://cdn.discordapp.com/embed/avatars/4.png' }, champion: { korean_name: '레오나', image_url: 'https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/Leona.png' }}
+                    TOP: { player: { display_name: '테스트유저6', avatar_url: 'https://cdn.discordapp.com/embed/avatars/0.png' }, champion: { korean_name: '가렌', image_url: CHAMPION_IMAGE_CDN + 'Garen.png' }},
+                    JUG: { player: { display_name: '테스트유저7', avatar_url: 'https://cdn.discordapp.com/embed/avatars/1.png' }, champion: { korean_name: '엘리스', image_url: CHAMPION_IMAGE_CDN + 'Elise.png' }},
+                    MID: { player: { display_name: '테스트유저8', avatar_url: 'https://cdn.discordapp.com/embed/avatars/2.png' }, champion: { korean_name: '신드라', image_url: CHAMPION_IMAGE_CDN + 'Syndra.png' }},
+                    ADC: { player: { display_name: '테스트유저9', avatar_url: 'https://cdn.discordapp.com/embed/avatars/3.png' }, champion: { korean_name: '베인', image_url: CHAMPION_IMAGE_CDN + 'Vayne.png' }},
+                    SUP: { player: { display_name: '테스트유저10', avatar_url: 'https://cdn.discordapp.com/embed/avatars/4.png' }, champion: { korean_name: '레오나', image_url: CHAMPION_IMAGE_CDN + 'Leona.png' }}
                 }
             },
             bans: {
@@ -115,7 +118,7 @@ class DraftResultSystem {
         this.champions = dummyChampions.map(name => ({
             english_name: name,
             korean_name: name,
-            image_url: `https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/${name}.png`
+            image_url: `${CHAMPION_IMAGE_CDN}${name}.png`
         }));
     }
     
@@ -190,7 +193,7 @@ class DraftResultSystem {
                 <div class="team-bans-header">블루팀 밴</div>
                 <div class="ban-champions">
                     ${this.draftData.bans.blue.map(champion => `
-                       <img src="https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/${champion}.png" 
+                       <img src="${CHAMPION_IMAGE_CDN}${champion}.png" 
                             alt="${champion}" class="banned-champion"
                             onerror="this.src='https://cdn.discordapp.com/embed/avatars/0.png'">
                    `).join('')}
@@ -200,7 +203,7 @@ class DraftResultSystem {
                <div class="team-bans-header">레드팀 밴</div>
                <div class="ban-champions">
                    ${this.draftData.bans.red.map(champion => `
-                       <img src="https://ddragon.leagueoflegends.com/cdn/13.24.1/img/champion/${champion}.png" 
+                       <img src="${CHAMPION_IMAGE_CDN}${champion}.png" 
                             alt="${champion}" class="banned-champion"
                             onerror="this.src='https://cdn.discordapp.com/embed/avatars/0.png'">
                    `).join('')}